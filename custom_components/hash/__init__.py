@@ -2,26 +2,65 @@
 
 from __future__ import annotations
 
+import datetime
 import logging
+from collections.abc import Awaitable, Callable
+from functools import partial
 
 import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import (
+    ServiceValidationError,
+    Unauthorized,
+    UnknownUser,
+)
 from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
 
+from .aggregates import GROUP_AREA, GROUP_PERSON, HOME_KEY
 from .const import (
+    ASSIGNMENT_FAIR_SHARE,
+    ASSIGNMENT_ROTATION,
     CONF_CHORE_ID,
     CONF_GLOBAL_PAUSE,
     CONF_VACATION_PERSONS,
     DOMAIN,
     PLATFORMS,
+    SERVICE_CANCEL_VACATION,
     SERVICE_COMPLETE_CHORE,
+    SERVICE_EXPORT,
+    SERVICE_FORECAST,
+    SERVICE_IMPORT,
+    SERVICE_PROFILE,
     SERVICE_RESET_CHORE,
+    SERVICE_SCHEDULE_VACATION,
     SERVICE_SET_GLOBAL_PAUSE,
     SERVICE_SET_VACATION,
+    SERVICE_SIMULATE,
+    SERVICE_URGENT_CHORES,
+    URGENT_CHORES_LIMIT,
 )
-from .coordinator import HashCoordinator
+from .coordinator import HashCoordinator, async_get_coordinator
+from .metadata import async_shutdown_metadata
 from .panel import async_register_panel, async_unregister_panel
+from .profiler import async_profile
+from .simulator import async_simulate
+from .transfer import (
+    FORMATS,
+    MODE_MERGE,
+    MODES,
+    HashExportView,
+    HashImportView,
+    async_export_to_file,
+    async_import_from_file,
+    format_for_path,
+)
 from .websocket import register_websocket_commands
 
 _LOGGER = logging.getLogger(__name__)
@@ -39,8 +78,91 @@ SET_VACATION_SCHEMA = vol.Schema(
     }
 )
 
+SCHEDULE_VACATION_SCHEMA = vol.Schema(
+    {
+        vol.Required("person_entity_id"): cv.entity_id,
+        vol.Required("start"): cv.date,
+        vol.Required("end"): cv.date,
+    }
+)
+
+CANCEL_VACATION_SCHEMA = vol.Schema({vol.Required("person_entity_id"): cv.entity_id})
+
 SET_GLOBAL_PAUSE_SCHEMA = vol.Schema({vol.Required("paused"): cv.boolean})
 
+URGENT_CHORES_SCHEMA = vol.Schema(
+    {
+        vol.Optional("limit", default=URGENT_CHORES_LIMIT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=50)
+        ),
+        vol.Exclusive("person_entity_id", "scope"): cv.entity_id,
+        vol.Exclusive("area_id", "scope"): cv.string,
+    }
+)
+
+FORECAST_SCHEMA = vol.Schema(
+    {
+        vol.Required("at"): cv.datetime,
+        vol.Optional("chore_ids"): vol.All(cv.ensure_list, [cv.string]),
+        vol.Optional("person_entity_id"): cv.entity_id,
+        vol.Optional("area_id"): cv.string,
+    }
+)
+
+SIMULATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("days", default=365): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3650)
+        ),
+        vol.Optional("persons"): cv.entity_ids,
+        vol.Optional("vacations", default=[]): [
+            vol.Schema(
+                {
+                    vol.Required("person_entity_id"): cv.entity_id,
+                    vol.Required("start"): cv.date,
+                    vol.Required("end"): cv.date,
+                }
+            )
+        ],
+        vol.Optional("intervals", default={}): {
+            cv.string: vol.All(vol.Coerce(int), vol.Range(min=1))
+        },
+        vol.Optional("daily_budget"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional("assignment_mode"): vol.In(
+            [ASSIGNMENT_ROTATION, ASSIGNMENT_FAIR_SHARE]
+        ),
+    }
+)
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional("calls", default=10): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=1000)
+        ),
+        vol.Optional("duration", default=60): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=3600)
+        ),
+        vol.Optional("sampling", default=False): cv.boolean,
+    }
+)
+
+EXPORT_SCHEMA = vol.Schema(
+    {
+        vol.Optional("path"): cv.string,
+        vol.Optional("format"): vol.In(FORMATS),
+        vol.Optional("include_history", default=False): cv.boolean,
+        vol.Optional("overwrite", default=False): cv.boolean,
+    }
+)
+
+IMPORT_SCHEMA = vol.Schema(
+    {
+        vol.Required("path"): cv.string,
+        vol.Optional("format"): vol.In(FORMATS),
+        vol.Optional("mode", default=MODE_MERGE): vol.In(MODES),
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HASH from a config entry."""
@@ -51,9 +173,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
-    # Register services (only once)
+    # Register services and HTTP views (only once)
     if not hass.services.has_service(DOMAIN, SERVICE_COMPLETE_CHORE):
         _register_services(hass)
+    if not hass.data[DOMAIN].get("_views_registered"):
+        hass.http.register_view(HashExportView())
+        hass.http.register_view(HashImportView())
+        hass.data[DOMAIN]["_views_registered"] = True
 
     # Register panel and websocket commands (only once)
     if not hass.data[DOMAIN].get("_panel_registered"):
@@ -64,6 +190,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
     entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+    entry.async_on_unload(partial(async_shutdown_metadata, hass))
 
     return True
 
@@ -97,32 +224,55 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
         await coordinator._store.async_remove()
 
 
+def _async_register_admin_service(
+    hass: HomeAssistant,
+    service: str,
+    service_func: Callable[[ServiceCall], Awaitable[ServiceResponse]],
+    schema: vol.Schema,
+    supports_response: SupportsResponse,
+) -> None:
+    """Register a service that requires admin access.
+
+    Same check as homeassistant.helpers.service.async_register_admin_service,
+    which drops service responses.
+    """
+
+    async def admin_handler(call: ServiceCall) -> ServiceResponse:
+        if call.context.user_id:
+            user = await hass.auth.async_get_user(call.context.user_id)
+            if user is None:
+                raise UnknownUser(context=call.context)
+            if not user.is_admin:
+                raise Unauthorized(context=call.context)
+        return await service_func(call)
+
+    hass.services.async_register(
+        DOMAIN,
+        service,
+        admin_handler,
+        schema=schema,
+        supports_response=supports_response,
+    )
+
+
 def _register_services(hass: HomeAssistant) -> None:
     """Register HASH services."""
 
-    async def _get_coordinator() -> HashCoordinator | None:
-        """Get the first available coordinator."""
-        entries = hass.data.get(DOMAIN, {})
-        for coordinator in entries.values():
-            if isinstance(coordinator, HashCoordinator):
-                return coordinator
-        return None
-
     async def handle_complete_chore(call: ServiceCall) -> None:
         """Handle complete_chore service call."""
-        coordinator = await _get_coordinator()
+        coordinator = async_get_coordinator(hass)
         if coordinator:
             await coordinator.async_complete_chore(call.data[CONF_CHORE_ID])
 
     async def handle_reset_chore(call: ServiceCall) -> None:
         """Handle reset_chore service call."""
-        coordinator = await _get_coordinator()
+        coordinator = async_get_coordinator(hass)
         if coordinator:
             await coordinator.async_reset_chore(call.data[CONF_CHORE_ID])
 
     async def handle_set_vacation(call: ServiceCall) -> None:
         """Handle set_vacation service call."""
-        coordinator = await _get_coordinator()
+        coordinator = async_get_coordinator(hass)
         if not coordinator:
             return
         entry = coordinator.config_entry
@@ -141,9 +291,31 @@ def _register_services(hass: HomeAssistant) -> None:
         hass.config_entries.async_update_entry(entry, options=current_options)
         await coordinator.async_request_refresh()
 
+    async def handle_schedule_vacation(call: ServiceCall) -> None:
+        """Handle schedule_vacation service call."""
+        coordinator = async_get_coordinator(hass)
+        if not coordinator:
+            return
+        start = call.data["start"]
+        end = call.data["end"]
+        if end < start:
+            raise ServiceValidationError("Vacation end must not be before its start")
+        await coordinator.async_add_vacation(
+            call.data["person_entity_id"],
+            dt_util.start_of_local_day(start),
+            # Vacations include their last day
+            dt_util.start_of_local_day(end + datetime.timedelta(days=1)),
+        )
+
+    async def handle_cancel_vacation(call: ServiceCall) -> None:
+        """Handle cancel_vacation service call."""
+        coordinator = async_get_coordinator(hass)
+        if coordinator:
+            await coordinator.async_remove_vacations(call.data["person_entity_id"])
+
     async def handle_set_global_pause(call: ServiceCall) -> None:
         """Handle set_global_pause service call."""
-        coordinator = await _get_coordinator()
+        coordinator = async_get_coordinator(hass)
         if not coordinator:
             return
         entry = coordinator.config_entry
@@ -154,6 +326,112 @@ def _register_services(hass: HomeAssistant) -> None:
         hass.config_entries.async_update_entry(entry, options=current_options)
         await coordinator.async_request_refresh()
 
+    async def handle_urgent_chores(call: ServiceCall) -> ServiceResponse:
+        """Handle urgent_chores service call."""
+        coordinator = async_get_coordinator(hass)
+        if not coordinator:
+            return {"chores": []}
+        if "person_entity_id" in call.data:
+            key = (GROUP_PERSON, call.data["person_entity_id"])
+        elif "area_id" in call.data:
+            key = (GROUP_AREA, call.data["area_id"])
+        else:
+            key = HOME_KEY
+        return {"chores": coordinator.async_most_urgent(key, call.data["limit"])}
+
+    async def handle_forecast(call: ServiceCall) -> ServiceResponse:
+        """Handle forecast service call."""
+        at = call.data["at"]
+        if at.tzinfo is None:
+            at = at.replace(tzinfo=dt_util.get_default_time_zone())
+        coordinator = async_get_coordinator(hass)
+        chores = {}
+        if coordinator:
+            chore_ids = call.data.get("chore_ids")
+            chores = coordinator.async_forecast(
+                at,
+                set(chore_ids) if chore_ids is not None else None,
+                person=call.data.get("person_entity_id"),
+                area_id=call.data.get("area_id"),
+            )
+        return {"at": dt_util.as_utc(at).isoformat(), "chores": chores}
+
+    async def handle_simulate(call: ServiceCall) -> ServiceResponse:
+        """Handle simulate service call."""
+        coordinator = async_get_coordinator(hass)
+        if not coordinator:
+            return {}
+        vacations = [
+            (
+                vacation["person_entity_id"],
+                dt_util.start_of_local_day(vacation["start"]),
+                # Vacations include their last day
+                dt_util.start_of_local_day(
+                    vacation["end"] + datetime.timedelta(days=1)
+                ),
+            )
+            for vacation in call.data["vacations"]
+        ]
+        return await async_simulate(
+            coordinator,
+            call.data["days"],
+            persons=call.data.get("persons"),
+            vacations=vacations,
+            intervals=call.data["intervals"],
+            daily_budget=call.data.get("daily_budget"),
+            assignment_mode=call.data.get("assignment_mode"),
+        )
+
+    async def handle_profile(call: ServiceCall) -> ServiceResponse:
+        """Handle profile service call."""
+        try:
+            return await async_profile(
+                hass,
+                call.data["calls"],
+                call.data["duration"],
+                call.data["sampling"],
+            )
+        except ValueError as err:
+            raise ServiceValidationError(f"Profile failed: {err}") from err
+
+    async def handle_export(call: ServiceCall) -> ServiceResponse:
+        """Handle export service call."""
+        coordinator = async_get_coordinator(hass)
+        if not coordinator:
+            return None
+        fmt = format_for_path(call.data.get("path", ""), call.data.get("format"))
+        path = call.data.get("path") or f"hash_export.{fmt}"
+        try:
+            result = await async_export_to_file(
+                coordinator,
+                path,
+                fmt,
+                call.data["include_history"],
+                call.data["overwrite"],
+            )
+        except (OSError, ValueError) as err:
+            raise ServiceValidationError(f"Export failed: {err}") from err
+        return result
+
+    async def handle_import(call: ServiceCall) -> ServiceResponse:
+        """Handle import service call."""
+        coordinator = async_get_coordinator(hass)
+        if not coordinator:
+            return None
+        path = call.data["path"]
+        fmt = format_for_path(path, call.data.get("format"))
+        try:
+            builder = await async_import_from_file(
+                coordinator, path, fmt, call.data["mode"]
+            )
+        except (OSError, ValueError) as err:
+            raise ServiceValidationError(f"Import failed: {err}") from err
+        if builder.errors:
+            raise ServiceValidationError(
+                "Import failed, nothing was changed: " + "; ".join(builder.errors)
+            )
+        return {"imported": builder.counts}
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_COMPLETE_CHORE,
@@ -172,9 +450,63 @@ def _register_services(hass: HomeAssistant) -> None:
         handle_set_vacation,
         schema=SET_VACATION_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SCHEDULE_VACATION,
+        handle_schedule_vacation,
+        schema=SCHEDULE_VACATION_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CANCEL_VACATION,
+        handle_cancel_vacation,
+        schema=CANCEL_VACATION_SCHEMA,
+    )
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_GLOBAL_PAUSE,
         handle_set_global_pause,
         schema=SET_GLOBAL_PAUSE_SCHEMA,
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_URGENT_CHORES,
+        handle_urgent_chores,
+        schema=URGENT_CHORES_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_FORECAST,
+        handle_forecast,
+        schema=FORECAST_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SIMULATE,
+        handle_simulate,
+        schema=SIMULATE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    _async_register_admin_service(
+        hass,
+        SERVICE_PROFILE,
+        handle_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
+    _async_register_admin_service(
+        hass,
+        SERVICE_EXPORT,
+        handle_export,
+        schema=EXPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    _async_register_admin_service(
+        hass,
+        SERVICE_IMPORT,
+        handle_import,
+        schema=IMPORT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
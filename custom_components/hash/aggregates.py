@@ -0,0 +1,182 @@
+"""Incrementally maintained cleanliness aggregates for HASH.
+
+Every chore contributes to the household group, its area group and the group
+of the person it is assigned to. Groups keep running sums, a lazy-deletion
+heap for the minimum and one keyed by the time cleanliness reaches zero for
+urgency, so a chore update costs O(log n) instead of a scan.
+"""
+
+from __future__ import annotations
+
+import datetime
+import heapq
+from dataclasses import dataclass
+from typing import Any
+
+GROUP_HOME = "home"
+GROUP_AREA = "area"
+GROUP_PERSON = "person"
+
+GroupKey = tuple[str, str]
+
+HOME_KEY: GroupKey = (GROUP_HOME, "")
+
+
+@dataclass(frozen=True, slots=True)
+class AggregateStats:
+    """Summary of a group of chores."""
+
+    count: int
+    average: float | None
+    minimum: float | None
+    overdue: int
+    worst_chore_id: str | None
+
+
+class AggregateGroup:
+    """Running aggregates over the chores of one group."""
+
+    def __init__(self) -> None:
+        """Initialize an empty group."""
+        # chore_id -> (cleanliness in tenths, heap sequence number)
+        self._members: dict[str, tuple[int, int]] = {}
+        self._total = 0
+        self._overdue = 0
+        self._heap: list[tuple[int, int, str]] = []
+        # (timestamp at which cleanliness reaches zero, sequence, chore_id)
+        self._urgency: list[tuple[float, int, str]] = []
+        self._seq = 0
+
+    def __len__(self) -> int:
+        """Return the number of chores in the group."""
+        return len(self._members)
+
+    def set(self, chore_id: str, cleanliness: float, zero_at: float) -> None:
+        """Add a chore or update its cleanliness and time-to-zero."""
+        self.discard(chore_id)
+        # Cleanliness has one decimal; tenths keep the running sum exact.
+        tenths = round(cleanliness * 10)
+        self._seq += 1
+        self._members[chore_id] = (tenths, self._seq)
+        self._total += tenths
+        if tenths <= 0:
+            self._overdue += 1
+        heapq.heappush(self._heap, (tenths, self._seq, chore_id))
+        heapq.heappush(self._urgency, (zero_at, self._seq, chore_id))
+        if len(self._heap) > 2 * len(self._members) + 16:
+            self._compact()
+
+    def discard(self, chore_id: str) -> None:
+        """Remove a chore; its heap entry is dropped lazily."""
+        member = self._members.pop(chore_id, None)
+        if member is None:
+            return
+        self._total -= member[0]
+        if member[0] <= 0:
+            self._overdue -= 1
+
+    def stats(self) -> AggregateStats:
+        """Return the current aggregates."""
+        count = len(self._members)
+        if not count:
+            return AggregateStats(0, None, None, 0, None)
+        heap = self._heap
+        while self._members.get(heap[0][2], (None, None))[1] != heap[0][1]:
+            heapq.heappop(heap)
+        tenths, _, worst = heap[0]
+        return AggregateStats(
+            count=count,
+            average=round(self._total / count / 10, 1),
+            minimum=tenths / 10,
+            overdue=self._overdue,
+            worst_chore_id=worst,
+        )
+
+    def most_urgent(self, limit: int) -> list[str]:
+        """Return up to limit chore ids, the soonest to reach zero first.
+
+        Walks the heap from the root through a frontier of candidate indices,
+        so it costs O(k log k) for the k entries visited and leaves the heap
+        untouched.
+        """
+        heap = self._urgency
+        result: list[str] = []
+        frontier = [(heap[0], 0)] if heap else []
+        while frontier and len(result) < limit:
+            (_, seq, chore_id), index = heapq.heappop(frontier)
+            if self._members.get(chore_id, (None, None))[1] == seq:
+                result.append(chore_id)
+            for child in (2 * index + 1, 2 * index + 2):
+                if child < len(heap):
+                    heapq.heappush(frontier, (heap[child], child))
+        return result
+
+    def _compact(self) -> None:
+        """Drop stale heap entries."""
+        self._heap = [
+            (tenths, seq, chore_id) for chore_id, (tenths, seq) in self._members.items()
+        ]
+        heapq.heapify(self._heap)
+        valid = {(seq, chore_id) for chore_id, (_, seq) in self._members.items()}
+        self._urgency = [
+            entry for entry in self._urgency if (entry[1], entry[2]) in valid
+        ]
+        heapq.heapify(self._urgency)
+
+
+def zero_at(snapshot: dict[str, Any]) -> float:
+    """Return the timestamp at which a chore's cleanliness reaches zero."""
+    last_cleaned = datetime.datetime.fromisoformat(snapshot["last_cleaned"])
+    return last_cleaned.timestamp() + snapshot["interval_days"] * 86400
+
+
+def group_keys(snapshot: dict[str, Any]) -> list[GroupKey]:
+    """Return the groups a chore snapshot belongs to."""
+    keys = [HOME_KEY]
+    if snapshot.get("area_id"):
+        keys.append((GROUP_AREA, snapshot["area_id"]))
+    if snapshot.get("assigned_to"):
+        keys.append((GROUP_PERSON, snapshot["assigned_to"]))
+    return keys
+
+
+class HashAggregates:
+    """Aggregate groups maintained from chore snapshot changes."""
+
+    def __init__(self) -> None:
+        """Initialize the aggregates."""
+        self._groups: dict[GroupKey, AggregateGroup] = {}
+        self._memberships: dict[str, list[GroupKey]] = {}
+
+    def update(self, chore_id: str, snapshot: dict[str, Any] | None) -> None:
+        """Apply a chore's new snapshot, or remove the chore if None."""
+        old_keys = self._memberships.pop(chore_id, [])
+        new_keys = group_keys(snapshot) if snapshot is not None else []
+        for key in old_keys:
+            if key not in new_keys:
+                group = self._groups[key]
+                group.discard(chore_id)
+                if not len(group) and key != HOME_KEY:
+                    del self._groups[key]
+        if snapshot is None:
+            return
+        due = zero_at(snapshot)
+        for key in new_keys:
+            self._groups.setdefault(key, AggregateGroup()).set(
+                chore_id, snapshot["cleanliness"], due
+            )
+        self._memberships[chore_id] = new_keys
+
+    def stats(self, key: GroupKey) -> AggregateStats:
+        """Return the aggregates of a group; unknown groups are empty."""
+        group = self._groups.get(key)
+        if group is None:
+            return AggregateStats(0, None, None, 0, None)
+        return group.stats()
+
+    def most_urgent(self, key: GroupKey, limit: int) -> list[str]:
+        """Return the ids of a group's most urgent chores."""
+        group = self._groups.get(key)
+        if group is None:
+            return []
+        return group.most_urgent(limit)
@@ -0,0 +1,141 @@
+"""Fair-share chore assignment for HASH.
+
+Instead of rotating each chore on its own, the assigner gives every chore to
+the active person with the least load, where load is the effort of the chores
+a person currently holds plus the effort they completed recently. Placement
+pops the least loaded person off a min-heap, so assigning N chores to P
+persons costs O(N log P).
+
+Assignments are cached. An update only places chores that are new, changed
+(including a pinned person going on or returning from vacation), released
+after a completion, or held by a person who is no longer active.
+"""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class ChoreShare:
+    """What the assigner needs to know about a chore."""
+
+    effort: int
+    # Person the chore is pinned to, or "" to share it
+    pinned: str = ""
+
+
+class FairShareAssigner:
+    """Cached, load-balanced chore assignments."""
+
+    def __init__(self) -> None:
+        """Initialize without assignments."""
+        self._persons: frozenset[str] = frozenset()
+        self._chores: dict[str, ChoreShare] = {}
+        self._assignments: dict[str, str | None] = {}
+        # Effort of the chores each person currently holds
+        self._held: dict[str, int] = {}
+
+    def assignee(self, chore_id: str) -> str | None:
+        """Return the cached assignee of a chore."""
+        return self._assignments.get(chore_id)
+
+    def held(self, person: str) -> int:
+        """Return the effort of the chores a person currently holds."""
+        return self._held.get(person, 0)
+
+    def release(self, chore_id: str) -> None:
+        """Forget a chore's assignment so the next update places it again."""
+        self._drop(chore_id)
+
+    def place(
+        self, chore_id: str, share: ChoreShare, credit: dict[str, float]
+    ) -> str | None:
+        """Place a single chore against the current load in O(P).
+
+        Cheaper than update when the caller knows that only this chore needs
+        a new assignee, e.g. right after a completion.
+        """
+        self._drop(chore_id)
+        person: str | None = share.pinned or min(
+            self._persons,
+            key=lambda p: (self.held(p) + credit.get(p, 0), p),
+            default=None,
+        )
+        self._chores[chore_id] = share
+        self._assignments[chore_id] = person
+        if person is not None:
+            self._held[person] = self.held(person) + share.effort
+        return person
+
+    def update(
+        self,
+        chores: dict[str, ChoreShare],
+        persons: Iterable[str],
+        credit: Callable[[], dict[str, float]],
+        hints: dict[str, str] | None = None,
+    ) -> set[str]:
+        """Bring assignments up to date; returns the ids that were placed.
+
+        persons are the active persons. credit is only called when something
+        has to be placed and returns the effort each person completed
+        recently. hints are earlier assignments, kept for chores placed again
+        while their person is still active.
+        """
+        active = frozenset(persons)
+        left = self._persons - active
+        self._persons = active
+
+        pending = {
+            chore_id
+            for chore_id in self._chores.keys() | chores.keys()
+            if self._chores.get(chore_id) != chores.get(chore_id)
+            or self._assignments.get(chore_id) in left
+        }
+        for chore_id in pending:
+            self._drop(chore_id)
+        pending &= chores.keys()
+        if not pending:
+            return pending
+
+        loads = {person: float(self.held(person)) for person in active}
+        for person, effort in credit().items():
+            if person in loads:
+                loads[person] += effort
+        # Lazy heap: an entry is stale once its load differs from loads[person]
+        heap = [(load, person) for person, load in loads.items()]
+        heapq.heapify(heap)
+        hints = hints or {}
+        # Pinned chores first so their load is known, then the heaviest ones,
+        # which keeps the greedy split close to even
+        order = sorted(
+            pending, key=lambda c: (not chores[c].pinned, -chores[c].effort, c)
+        )
+        for chore_id in order:
+            share = chores[chore_id]
+            person: str | None = share.pinned or hints.get(chore_id)
+            if not share.pinned and person not in active:
+                while heap and heap[0][0] != loads[heap[0][1]]:
+                    heapq.heappop(heap)
+                person = heap[0][1] if heap else None
+            self._chores[chore_id] = share
+            self._assignments[chore_id] = person
+            if person is None:
+                continue
+            self._held[person] = self.held(person) + share.effort
+            if person in loads:
+                loads[person] += share.effort
+                heapq.heappush(heap, (loads[person], person))
+        return pending
+
+    def _drop(self, chore_id: str) -> None:
+        """Remove a chore's assignment and its load."""
+        share = self._chores.pop(chore_id, None)
+        person = self._assignments.pop(chore_id, None)
+        if share is None or person is None:
+            return
+        self._held[person] -= share.effort
+        if not self._held[person]:
+            del self._held[person]
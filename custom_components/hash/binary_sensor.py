@@ -0,0 +1,242 @@
+"""Binary sensor platform for HASH — overdue chores and persons."""
+
+from __future__ import annotations
+
+import datetime
+from abc import ABC, abstractmethod
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_utc_time
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import CONF_ASSIGNED_PERSON, CONF_CHORES, DOMAIN
+from .coordinator import HashCoordinator
+from .entity import device_info
+from .metadata import async_get_metadata
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up HASH binary sensors from a config entry."""
+    coordinator: HashCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    entities: list[BinarySensorEntity] = [
+        HashChoreOverdueBinarySensor(coordinator, entry, chore_id)
+        for chore_id in coordinator.data
+    ]
+
+    persons: set[str] = {
+        chore[CONF_ASSIGNED_PERSON]
+        for chore in entry.options.get(CONF_CHORES, [])
+        if chore.get(CONF_ASSIGNED_PERSON)
+    }
+    for data in coordinator.data.values():
+        if data["assigned_to"]:
+            persons.add(data["assigned_to"])
+    entities.extend(
+        HashPersonOverdueBinarySensor(coordinator, entry, person_id)
+        for person_id in sorted(persons)
+    )
+
+    async_add_entities(entities)
+
+
+def overdue_at(snapshot: dict[str, Any] | None) -> datetime.datetime | None:
+    """Return when a chore becomes overdue: the local midnight after next_due."""
+    if not snapshot or not snapshot.get("next_due"):
+        return None
+    due = datetime.date.fromisoformat(snapshot["next_due"])
+    return dt_util.start_of_local_day(due + datetime.timedelta(days=1))
+
+
+class _HashDeadlineEntity(CoordinatorEntity[HashCoordinator], BinarySensorEntity, ABC):
+    """Binary sensor that flips at deadlines via a point-in-time timer."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    # Chore whose updates are listened to; None listens to every chore
+    _listen_chore_id: str | None = None
+
+    def __init__(self, coordinator: HashCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._attr_device_info = device_info(entry)
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        # Deadline the timer is scheduled for
+        self._next_deadline: datetime.datetime | None = None
+        self._written: tuple[bool, bool, dict | None] | None = None
+
+    @abstractmethod
+    def _deadlines(self) -> list[datetime.datetime]:
+        """Return the deadlines this sensor depends on."""
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for chore updates and schedule the next deadline."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(
+                self._handle_chore_update, self._listen_chore_id
+            )
+        )
+        self.async_on_remove(self._cancel_timer)
+        self._update_deadlines()
+        self._written = self._state_key()
+
+    @callback
+    def _cancel_timer(self) -> None:
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+        self._next_deadline = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full refresh."""
+        self._update_deadlines()
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Handle an update of a single chore."""
+        self._update_deadlines()
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_deadline(self, now: datetime.datetime) -> None:
+        """Flip state at a deadline and schedule the next one."""
+        self._unsub_timer = None
+        self._next_deadline = None
+        self._update_deadlines()
+        self._async_write_if_changed()
+
+    @callback
+    def _update_deadlines(self) -> None:
+        """Recompute state and reschedule the timer if the next deadline moved."""
+        now = dt_util.utcnow()
+        deadlines = self._deadlines()
+        self._attr_is_on = any(deadline <= now for deadline in deadlines)
+        upcoming = min(
+            (deadline for deadline in deadlines if deadline > now), default=None
+        )
+        if upcoming == self._next_deadline:
+            return
+        self._cancel_timer()
+        if upcoming is not None:
+            self._unsub_timer = async_track_point_in_utc_time(
+                self.hass, self._handle_deadline, upcoming
+            )
+            self._next_deadline = upcoming
+
+    def _state_key(self) -> tuple[bool, bool, dict | None]:
+        """Return what a state write would report."""
+        return (self.available, bool(self.is_on), self.extra_state_attributes)
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if availability, state or attributes changed."""
+        written = self._state_key()
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+
+class HashChoreOverdueBinarySensor(_HashDeadlineEntity):
+    """On once a chore's due date has passed."""
+
+    def __init__(
+        self, coordinator: HashCoordinator, entry: ConfigEntry, chore_id: str
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._chore_id = chore_id
+        self._listen_chore_id = chore_id
+        self._attr_unique_id = f"{entry.entry_id}_{chore_id}_overdue"
+        name = coordinator.data.get(chore_id, {}).get("name", chore_id)
+        self._attr_name = f"{name} overdue"
+
+    @property
+    def available(self) -> bool:
+        """Return True if coordinator data has this chore."""
+        return super().available and self._chore_id in self.coordinator.data
+
+    def _deadlines(self) -> list[datetime.datetime]:
+        """Return the chore's overdue deadline."""
+        deadline = overdue_at(self.coordinator.data.get(self._chore_id))
+        return [deadline] if deadline else []
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return when the chore becomes overdue."""
+        deadlines = self._deadlines()
+        return {"overdue_at": deadlines[0].isoformat() if deadlines else None}
+
+
+class HashPersonOverdueBinarySensor(_HashDeadlineEntity):
+    """On while any chore assigned to a person is overdue."""
+
+    def __init__(
+        self, coordinator: HashCoordinator, entry: ConfigEntry, person_entity_id: str
+    ) -> None:
+        """Initialize the binary sensor."""
+        super().__init__(coordinator, entry)
+        self._person_entity_id = person_entity_id
+        safe_id = person_entity_id.replace(".", "_")
+        self._attr_unique_id = f"{entry.entry_id}_{safe_id}_has_overdue"
+        friendly = async_get_metadata(coordinator.hass).async_person_name(
+            person_entity_id
+        )
+        self._attr_name = f"{friendly} has overdue chores"
+        # Chores currently assigned to this person
+        self._chore_ids: set[str] = set()
+
+    async def async_added_to_hass(self) -> None:
+        """Find this person's chores before the first deadlines are computed."""
+        self._update_chore_ids()
+        await super().async_added_to_hass()
+
+    def _update_chore_ids(self) -> None:
+        """Recompute the chores assigned to this person."""
+        self._chore_ids = {
+            chore_id
+            for chore_id, data in self.coordinator.data.items()
+            if data["assigned_to"] == self._person_entity_id
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full refresh."""
+        self._update_chore_ids()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Only recompute if the chore is or was assigned to this person."""
+        data = self.coordinator.data.get(chore_id, {})
+        if data.get("assigned_to") == self._person_entity_id:
+            self._chore_ids.add(chore_id)
+        elif chore_id in self._chore_ids:
+            self._chore_ids.discard(chore_id)
+        else:
+            return
+        super()._handle_chore_update(chore_id)
+
+    def _deadlines(self) -> list[datetime.datetime]:
+        """Return the deadlines of the chores assigned to this person."""
+        data = self.coordinator.data
+        return [
+            deadline
+            for chore_id in self._chore_ids
+            if (deadline := overdue_at(data.get(chore_id)))
+        ]
@@ -0,0 +1,188 @@
+"""Blocked days from other calendars for HASH.
+
+Days covered by an event on a blocking calendar (holidays, guests staying)
+are kept as a sorted list of merged date ranges, so checking a day is a
+bisection. The calendars are only asked for the part of the planning horizon
+that has not been fetched yet: one query when HASH starts and a day's worth
+as the horizon moves on. Since the other calendars can change at any time,
+the whole horizon is fetched again once the last full fetch has expired.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.calendar import SERVICE_GET_EVENTS
+from homeassistant.components.calendar.const import (
+    EVENT_END_DATETIME,
+    EVENT_START_DATETIME,
+)
+from homeassistant.const import ATTR_ENTITY_ID, Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+_DAY = datetime.timedelta(days=1)
+
+
+class BlockedDays:
+    """Sorted, merged ranges of blocked days and the span already fetched.
+
+    Ranges are half-open: (start, end) blocks start up to the day before end.
+    ``version`` is bumped whenever the blocked days change, so the planner
+    knows when to re-plan.
+    """
+
+    def __init__(self) -> None:
+        """Initialize without blocked days."""
+        self.version = 0
+        self._starts: list[datetime.date] = []
+        self._ends: list[datetime.date] = []
+        self._fetched: tuple[datetime.date, datetime.date] | None = None
+        # When the fetched span was last fetched in full
+        self._fetched_at: datetime.datetime | None = None
+
+    def __contains__(self, day: object) -> bool:
+        """Return whether a day is blocked."""
+        if not isinstance(day, datetime.date):
+            return False
+        i = bisect.bisect_right(self._starts, day) - 1
+        return i >= 0 and day < self._ends[i]
+
+    def __len__(self) -> int:
+        """Return the number of blocked ranges."""
+        return len(self._starts)
+
+    def next_open(self, day: datetime.date) -> datetime.date:
+        """Return the day itself, or the first day after its blocked range."""
+        i = bisect.bisect_right(self._starts, day) - 1
+        if i >= 0 and day < self._ends[i]:
+            # Ranges are merged, so the end of one is never blocked
+            return self._ends[i]
+        return day
+
+    def missing(
+        self, start: datetime.date, end: datetime.date
+    ) -> tuple[datetime.date, datetime.date] | None:
+        """Return the part of start..end that still has to be fetched."""
+        if self._fetched is None or start < self._fetched[0]:
+            return start, end
+        if end <= self._fetched[1]:
+            return None
+        return max(start, self._fetched[1]), end
+
+    def expire(self, before: datetime.datetime) -> None:
+        """Have the whole span fetched again if it was fetched before a time.
+
+        The known ranges are kept until the next fetch replaces them.
+        """
+        if self._fetched_at is not None and self._fetched_at < before:
+            self._fetched = None
+
+    def update(
+        self,
+        start: datetime.date,
+        end: datetime.date,
+        ranges: list[tuple[datetime.date, datetime.date]],
+    ) -> bool:
+        """Merge the ranges fetched for start..end; returns whether any changed.
+
+        Days before start are forgotten. A fetch that does not continue the
+        fetched span replaces it and only counts as a change if the blocked
+        days differ.
+        """
+        fetched = self._fetched
+        if fetched is None or not fetched[0] <= start <= fetched[1]:
+            previous = (self._starts, self._ends)
+            self._starts, self._ends = [], []
+            self._fetched = (start, end)
+            self._fetched_at = dt_util.utcnow()
+            for range_start, range_end in ranges:
+                self._add(range_start, range_end)
+            changed = (self._starts, self._ends) != previous
+        else:
+            changed = False
+            self._fetched = (fetched[0], max(fetched[1], end))
+            for range_start, range_end in ranges:
+                changed |= self._add(range_start, range_end)
+        if changed:
+            self.version += 1
+        return changed
+
+    def prune(self, before: datetime.date) -> None:
+        """Forget the ranges that end before a day."""
+        i = bisect.bisect_right(self._ends, before)
+        del self._starts[:i]
+        del self._ends[:i]
+        if self._fetched is not None and self._fetched[0] < before:
+            self._fetched = (min(before, self._fetched[1]), self._fetched[1])
+
+    def _add(self, start: datetime.date, end: datetime.date) -> bool:
+        """Add a range, merging it with the ones it touches."""
+        if end <= start or (start in self and end <= self.next_open(start)):
+            return False
+        # First range ending at or after start, last range starting by end
+        low = bisect.bisect_left(self._ends, start)
+        high = bisect.bisect_right(self._starts, end)
+        if low < high:
+            start = min(start, self._starts[low])
+            end = max(end, self._ends[high - 1])
+        self._starts[low:high] = [start]
+        self._ends[low:high] = [end]
+        return True
+
+
+def _as_date(value: str, end: bool) -> datetime.date:
+    """Return the day of an event boundary; an end is exclusive."""
+    if len(value) == len("2000-01-01"):
+        return datetime.date.fromisoformat(value)
+    moment = dt_util.as_local(datetime.datetime.fromisoformat(value))
+    if not end:
+        return moment.date()
+    # A timed event blocks the day it ends on unless it ends at midnight
+    return (moment - datetime.timedelta(microseconds=1)).date() + _DAY
+
+
+def event_range(event: dict[str, Any]) -> tuple[datetime.date, datetime.date]:
+    """Return the days an event from calendar.get_events covers."""
+    start = _as_date(event["start"], end=False)
+    return start, max(start + _DAY, _as_date(event["end"], end=True))
+
+
+async def async_fetch_blocked(
+    hass: HomeAssistant,
+    entity_ids: list[str],
+    start: datetime.date,
+    end: datetime.date,
+) -> list[tuple[datetime.date, datetime.date]] | None:
+    """Fetch the blocked ranges between two days from calendar entities.
+
+    All calendars are queried with a single call. Returns None if they could
+    not be queried, e.g. while a calendar has not been set up yet.
+    """
+    try:
+        response = await hass.services.async_call(
+            Platform.CALENDAR,
+            SERVICE_GET_EVENTS,
+            {
+                ATTR_ENTITY_ID: entity_ids,
+                EVENT_START_DATETIME: dt_util.start_of_local_day(start),
+                EVENT_END_DATETIME: dt_util.start_of_local_day(end),
+            },
+            blocking=True,
+            return_response=True,
+        )
+    except HomeAssistantError as err:
+        _LOGGER.warning("Could not read blocked days from %s: %s", entity_ids, err)
+        return None
+    return [
+        event_range(event)
+        for result in (response or {}).values()
+        if isinstance(result, dict)
+        for event in result.get("events", [])
+    ]
@@ -3,18 +3,18 @@
 from __future__ import annotations
 
 import datetime
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import CONF_ASSIGNED_PERSON, CONF_CHORES, DOMAIN
 from .coordinator import HashCoordinator
+from .entity import device_info
 
 
 async def async_setup_entry(
@@ -53,20 +53,27 @@ def _build_events(
     start_date: datetime.date,
     end_date: datetime.date,
     person_filter: str | None = None,
+    planned: Callable[[str], list[datetime.date]] | None = None,
 ) -> list[CalendarEvent]:
-    """Build calendar events from coordinator data."""
-    events: list[CalendarEvent] = []
+    """Build calendar events from coordinator data.
 
-    for _chore_id, data in coordinator_data.items():
-        next_due_str = data.get("next_due")
-        if not next_due_str:
-            continue
+    planned returns a chore's planned dates; without it only next_due is shown.
+    """
+    events: list[CalendarEvent] = []
 
-        next_due = datetime.date.fromisoformat(next_due_str)
-        if next_due < start_date or next_due >= end_date:
+    for chore_id, data in coordinator_data.items():
+        if person_filter and data.get("assigned_to") != person_filter:
             continue
 
-        if person_filter and data.get("assigned_to") != person_filter:
+        # Planned dates for the coming weeks, starting with next_due
+        if planned is not None:
+            schedule = planned(chore_id)
+        elif data.get("next_due"):
+            schedule = [datetime.date.fromisoformat(data["next_due"])]
+        else:
+            schedule = []
+        days = [day for day in schedule if start_date <= day < end_date]
+        if not days:
             continue
 
         assignee_display = data.get("assigned_to", "Rotating") or "Rotating"
@@ -82,13 +89,14 @@ def _build_events(
             description_parts.append(f"Room: {room}")
         description_parts.append(f"Assigned: {assignee_display}")
 
-        events.append(
+        events.extend(
             CalendarEvent(
                 summary=data["name"],
-                start=next_due,
-                end=next_due + datetime.timedelta(days=1),
+                start=day,
+                end=day + datetime.timedelta(days=1),
                 description="\n".join(description_parts),
             )
+            for day in days
         )
 
     return events
@@ -105,20 +113,31 @@ class HashCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntity):
         self._attr_unique_id = f"{entry.entry_id}_calendar"
         self._attr_name = "HASH Cleaning Schedule"
         self._entry = entry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="HASH Cleaning Hub",
-            manufacturer="HASH",
-            model="Sweeping Hub",
-            entry_type=DeviceEntryType.SERVICE,
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for single-chore updates."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(self._handle_chore_update)
         )
 
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Handle an update of a single chore."""
+        self.async_write_ha_state()
+
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
         today = datetime.date.today()
         far_future = today + datetime.timedelta(days=365)
-        events = _build_events(self.coordinator.data, today, far_future)
+        events = _build_events(
+            self.coordinator.data,
+            today,
+            far_future,
+            planned=self.coordinator.planner.dates,
+        )
         if not events:
             return None
         events.sort(key=lambda e: e.start)
@@ -131,11 +150,13 @@ class HashCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntity):
         end_date: datetime.datetime,
     ) -> list[CalendarEvent]:
         """Return events in a date range."""
-        return _build_events(
-            self.coordinator.data,
-            start_date.date(),
-            end_date.date(),
-        )
+        with self.coordinator.stats.timed("calendar_events"):
+            return _build_events(
+                self.coordinator.data,
+                start_date.date(),
+                end_date.date(),
+                planned=self.coordinator.planner.dates,
+            )
 
 
 class HashPersonCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntity):
@@ -152,20 +173,50 @@ class HashPersonCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntit
         """Initialize a per-person calendar."""
         super().__init__(coordinator)
         self._person_entity_id = person_entity_id
+        # Chores currently assigned to this person
+        self._chore_ids: set[str] = set()
         safe_id = person_entity_id.replace(".", "_")
         self._attr_unique_id = f"{entry.entry_id}_calendar_{safe_id}"
         # Friendly name from entity_id
         friendly = person_entity_id.replace("person.", "").replace("_", " ").title()
         self._attr_name = f"HASH - {friendly}"
         self._entry = entry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="HASH Cleaning Hub",
-            manufacturer="HASH",
-            model="Sweeping Hub",
-            entry_type=DeviceEntryType.SERVICE,
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for single-chore updates."""
+        await super().async_added_to_hass()
+        self._update_chore_ids()
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(self._handle_chore_update)
         )
 
+    def _update_chore_ids(self) -> None:
+        """Recompute the chores assigned to this person."""
+        self._chore_ids = {
+            chore_id
+            for chore_id, data in self.coordinator.data.items()
+            if data.get("assigned_to") == self._person_entity_id
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full coordinator refresh."""
+        self._update_chore_ids()
+        super()._handle_coordinator_update()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Update only if the chore is or was assigned to this person."""
+        data = self.coordinator.data.get(chore_id, {})
+        if data.get("assigned_to") == self._person_entity_id:
+            self._chore_ids.add(chore_id)
+        elif chore_id in self._chore_ids:
+            self._chore_ids.discard(chore_id)
+        else:
+            return
+        self.async_write_ha_state()
+
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event for this person."""
@@ -176,6 +227,7 @@ class HashPersonCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntit
             today,
             far_future,
             person_filter=self._person_entity_id,
+            planned=self.coordinator.planner.dates,
         )
         if not events:
             return None
@@ -189,9 +241,11 @@ class HashPersonCalendarEntity(CoordinatorEntity[HashCoordinator], CalendarEntit
         end_date: datetime.datetime,
     ) -> list[CalendarEvent]:
         """Return events in a date range for this person."""
-        return _build_events(
-            self.coordinator.data,
-            start_date.date(),
-            end_date.date(),
-            person_filter=self._person_entity_id,
-        )
+        with self.coordinator.stats.timed("calendar_events"):
+            return _build_events(
+                self.coordinator.data,
+                start_date.date(),
+                end_date.date(),
+                person_filter=self._person_entity_id,
+                planned=self.coordinator.planner.dates,
+            )
@@ -17,19 +17,41 @@ from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers import selector
 
 from .const import (
+    ASSIGNMENT_FAIR_SHARE,
+    ASSIGNMENT_ROTATION,
     CONF_ASSIGNED_PERSON,
+    CONF_ASSIGNMENT_MODE,
+    CONF_BLACKOUT_DAYS,
+    CONF_BLOCKED_CALENDARS,
     CONF_CHORE_ID,
     CONF_CHORE_NAME,
     CONF_CHORES,
+    CONF_DAILY_BUDGET,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
+    CONF_EFFORT,
     CONF_GLOBAL_PAUSE,
     CONF_INTERVAL,
     CONF_INTERVAL_PRESET,
+    CONF_MAX_SHIFT_DAYS,
+    CONF_MIN_CLEANLINESS_DELTA,
+    CONF_PREFERRED_DAYS,
     CONF_ROOM,
     CONF_VACATION_PERSONS,
+    DECAY_LABELS,
+    DECAY_LINEAR,
+    DECAY_PIECEWISE,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_EFFORT,
+    DEFAULT_MAX_SHIFT_DAYS,
+    DEFAULT_MIN_CLEANLINESS_DELTA,
+    DEFAULT_PREFERRED_DAYS,
     DOMAIN,
     INTERVAL_LABELS,
     INTERVAL_PRESETS,
+    WEEKDAY_LABELS,
 )
+from .decay import parse_points
 
 
 class HashConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -61,6 +83,53 @@ class HashConfigFlow(ConfigFlow, domain=DOMAIN):
         return HashOptionsFlow()
 
 
+_EFFORT_SELECTOR = selector.NumberSelector(
+    selector.NumberSelectorConfig(min=1, max=10, mode=selector.NumberSelectorMode.BOX)
+)
+
+_DECAY_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=key, label=label)
+            for key, label in DECAY_LABELS.items()
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+_WEEKDAYS_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=key, label=label)
+            for key, label in WEEKDAY_LABELS.items()
+        ],
+        multiple=True,
+        mode=selector.SelectSelectorMode.LIST,
+    )
+)
+
+
+def _decay_settings(user_input: dict[str, Any]) -> dict[str, str]:
+    """Return the decay curve settings entered in a chore form."""
+    return {
+        CONF_DECAY: user_input.get(CONF_DECAY, DECAY_LINEAR),
+        CONF_DECAY_POINTS: (user_input.get(CONF_DECAY_POINTS) or "").strip(),
+    }
+
+
+def _decay_errors(user_input: dict[str, Any] | None) -> dict[str, str]:
+    """Validate the points of a piecewise decay curve."""
+    if user_input is None:
+        return {}
+    settings = _decay_settings(user_input)
+    if settings[CONF_DECAY] == DECAY_PIECEWISE and settings[CONF_DECAY_POINTS]:
+        try:
+            parse_points(settings[CONF_DECAY_POINTS])
+        except ValueError:
+            return {CONF_DECAY_POINTS: "invalid_decay_points"}
+    return {}
+
+
 def _resolve_area_name(hass: HomeAssistant, area_id: str) -> str:
     """Resolve an area ID to its display name, falling back to the ID."""
     if not area_id:
@@ -78,6 +147,14 @@ class HashOptionsFlow(OptionsFlow):
         self._chores: list[dict[str, Any]] = []
         self._vacation_persons: list[str] = []
         self._global_pause: bool = False
+        self._min_cleanliness_delta: float = DEFAULT_MIN_CLEANLINESS_DELTA
+        self._daily_budget: int = DEFAULT_DAILY_BUDGET
+        self._assignment_mode: str = ASSIGNMENT_ROTATION
+        self._preferred_days: list[str] = list(DEFAULT_PREFERRED_DAYS)
+        self._max_shift_days: int = DEFAULT_MAX_SHIFT_DAYS
+        self._blackout_days: list[str] = []
+        self._blocked_calendars: list[str] = []
+        self._loaded = False
         self._selected_chore_id: str | None = None
         # Temp storage for add_chore when custom interval is needed
         self._pending_chore: dict[str, Any] | None = None
@@ -86,11 +163,28 @@ class HashOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Show main menu for options."""
-        self._chores = list(self.config_entry.options.get(CONF_CHORES, []))
-        self._vacation_persons = list(
-            self.config_entry.options.get(CONF_VACATION_PERSONS, [])
-        )
-        self._global_pause = self.config_entry.options.get(CONF_GLOBAL_PAUSE, False)
+        # Load once; sub-steps return here with their changes pending.
+        if not self._loaded:
+            options = self.config_entry.options
+            self._chores = list(options.get(CONF_CHORES, []))
+            self._vacation_persons = list(options.get(CONF_VACATION_PERSONS, []))
+            self._global_pause = options.get(CONF_GLOBAL_PAUSE, False)
+            self._min_cleanliness_delta = options.get(
+                CONF_MIN_CLEANLINESS_DELTA, DEFAULT_MIN_CLEANLINESS_DELTA
+            )
+            self._daily_budget = options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET)
+            self._assignment_mode = options.get(
+                CONF_ASSIGNMENT_MODE, ASSIGNMENT_ROTATION
+            )
+            self._preferred_days = list(
+                options.get(CONF_PREFERRED_DAYS, DEFAULT_PREFERRED_DAYS)
+            )
+            self._max_shift_days = options.get(
+                CONF_MAX_SHIFT_DAYS, DEFAULT_MAX_SHIFT_DAYS
+            )
+            self._blackout_days = list(options.get(CONF_BLACKOUT_DAYS, []))
+            self._blocked_calendars = list(options.get(CONF_BLOCKED_CALENDARS, []))
+            self._loaded = True
 
         if user_input is not None:
             action = user_input.get("action")
@@ -102,13 +196,23 @@ class HashOptionsFlow(OptionsFlow):
                 return await self.async_step_select_chore_remove()
             if action == "manage_vacation":
                 return await self.async_step_manage_vacation()
+            if action == "settings":
+                return await self.async_step_settings()
             if action == "done":
                 return self.async_create_entry(
                     title="HASH",
                     data={
+                        **self.config_entry.options,
                         CONF_CHORES: self._chores,
                         CONF_VACATION_PERSONS: self._vacation_persons,
                         CONF_GLOBAL_PAUSE: self._global_pause,
+                        CONF_MIN_CLEANLINESS_DELTA: self._min_cleanliness_delta,
+                        CONF_DAILY_BUDGET: self._daily_budget,
+                        CONF_ASSIGNMENT_MODE: self._assignment_mode,
+                        CONF_PREFERRED_DAYS: self._preferred_days,
+                        CONF_MAX_SHIFT_DAYS: self._max_shift_days,
+                        CONF_BLACKOUT_DAYS: self._blackout_days,
+                        CONF_BLOCKED_CALENDARS: self._blocked_calendars,
                     },
                 )
 
@@ -127,6 +231,7 @@ class HashOptionsFlow(OptionsFlow):
                 value="manage_vacation", label="Manage Vacation & Pause"
             )
         )
+        actions.append(selector.SelectOptionDict(value="settings", label="Settings"))
         actions.append(selector.SelectOptionDict(value="done", label="Done"))
 
         return self.async_show_form(
@@ -147,7 +252,8 @@ class HashOptionsFlow(OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Add a new chore."""
-        if user_input is not None:
+        errors = _decay_errors(user_input)
+        if user_input is not None and not errors:
             preset = user_input[CONF_INTERVAL_PRESET]
             if preset == "custom":
                 # Store partial chore and ask for custom interval
@@ -155,6 +261,9 @@ class HashOptionsFlow(OptionsFlow):
                     CONF_CHORE_NAME: user_input[CONF_CHORE_NAME],
                     CONF_ROOM: user_input.get(CONF_ROOM, ""),
                     CONF_ASSIGNED_PERSON: user_input.get(CONF_ASSIGNED_PERSON, ""),
+                    CONF_EFFORT: int(user_input[CONF_EFFORT]),
+                    **_decay_settings(user_input),
+                    CONF_PREFERRED_DAYS: user_input.get(CONF_PREFERRED_DAYS, []),
                 }
                 return await self.async_step_add_chore_custom_interval()
 
@@ -165,6 +274,9 @@ class HashOptionsFlow(OptionsFlow):
                 CONF_ROOM: user_input.get(CONF_ROOM, ""),
                 CONF_INTERVAL: interval_days,
                 CONF_ASSIGNED_PERSON: user_input.get(CONF_ASSIGNED_PERSON, ""),
+                CONF_EFFORT: int(user_input[CONF_EFFORT]),
+                **_decay_settings(user_input),
+                CONF_PREFERRED_DAYS: user_input.get(CONF_PREFERRED_DAYS, []),
             }
             self._chores.append(chore)
             return await self.async_step_init()
@@ -193,8 +305,13 @@ class HashOptionsFlow(OptionsFlow):
                     ): selector.EntitySelector(
                         selector.EntitySelectorConfig(domain="person")
                     ),
+                    vol.Required(CONF_EFFORT, default=DEFAULT_EFFORT): _EFFORT_SELECTOR,
+                    vol.Required(CONF_DECAY, default=DECAY_LINEAR): _DECAY_SELECTOR,
+                    vol.Optional(CONF_DECAY_POINTS): selector.TextSelector(),
+                    vol.Optional(CONF_PREFERRED_DAYS, default=[]): _WEEKDAYS_SELECTOR,
                 }
             ),
+            errors=errors,
         )
 
     async def async_step_add_chore_custom_interval(
@@ -208,6 +325,10 @@ class HashOptionsFlow(OptionsFlow):
                 CONF_ROOM: self._pending_chore.get(CONF_ROOM, ""),
                 CONF_INTERVAL: int(user_input[CONF_INTERVAL]),
                 CONF_ASSIGNED_PERSON: self._pending_chore.get(CONF_ASSIGNED_PERSON, ""),
+                CONF_EFFORT: self._pending_chore[CONF_EFFORT],
+                CONF_DECAY: self._pending_chore[CONF_DECAY],
+                CONF_DECAY_POINTS: self._pending_chore[CONF_DECAY_POINTS],
+                CONF_PREFERRED_DAYS: self._pending_chore[CONF_PREFERRED_DAYS],
             }
             self._chores.append(chore)
             self._pending_chore = None
@@ -270,7 +391,8 @@ class HashOptionsFlow(OptionsFlow):
         if chore is None:
             return await self.async_step_init()
 
-        if user_input is not None:
+        errors = _decay_errors(user_input)
+        if user_input is not None and not errors:
             preset = user_input[CONF_INTERVAL_PRESET]
             if preset == "custom":
                 self._pending_chore = {
@@ -278,6 +400,9 @@ class HashOptionsFlow(OptionsFlow):
                     CONF_CHORE_NAME: user_input[CONF_CHORE_NAME],
                     CONF_ROOM: user_input.get(CONF_ROOM, ""),
                     CONF_ASSIGNED_PERSON: user_input.get(CONF_ASSIGNED_PERSON, ""),
+                    CONF_EFFORT: int(user_input[CONF_EFFORT]),
+                    **_decay_settings(user_input),
+                    CONF_PREFERRED_DAYS: user_input.get(CONF_PREFERRED_DAYS, []),
                 }
                 return await self.async_step_edit_chore_custom_interval()
 
@@ -285,6 +410,9 @@ class HashOptionsFlow(OptionsFlow):
             chore[CONF_ROOM] = user_input.get(CONF_ROOM, "")
             chore[CONF_INTERVAL] = INTERVAL_PRESETS[preset]
             chore[CONF_ASSIGNED_PERSON] = user_input.get(CONF_ASSIGNED_PERSON, "")
+            chore[CONF_EFFORT] = int(user_input[CONF_EFFORT])
+            chore.update(_decay_settings(user_input))
+            chore[CONF_PREFERRED_DAYS] = user_input.get(CONF_PREFERRED_DAYS, [])
             return await self.async_step_init()
 
         # Determine current preset
@@ -327,8 +455,25 @@ class HashOptionsFlow(OptionsFlow):
                     ): selector.EntitySelector(
                         selector.EntitySelectorConfig(domain="person")
                     ),
+                    vol.Required(
+                        CONF_EFFORT, default=chore.get(CONF_EFFORT, DEFAULT_EFFORT)
+                    ): _EFFORT_SELECTOR,
+                    vol.Required(
+                        CONF_DECAY, default=chore.get(CONF_DECAY, DECAY_LINEAR)
+                    ): _DECAY_SELECTOR,
+                    vol.Optional(
+                        CONF_DECAY_POINTS,
+                        description={
+                            "suggested_value": chore.get(CONF_DECAY_POINTS) or None
+                        },
+                    ): selector.TextSelector(),
+                    vol.Optional(
+                        CONF_PREFERRED_DAYS,
+                        default=chore.get(CONF_PREFERRED_DAYS, []),
+                    ): _WEEKDAYS_SELECTOR,
                 }
             ),
+            errors=errors,
         )
 
     async def async_step_edit_chore_custom_interval(
@@ -348,6 +493,10 @@ class HashOptionsFlow(OptionsFlow):
                 chore[CONF_ASSIGNED_PERSON] = self._pending_chore.get(
                     CONF_ASSIGNED_PERSON, ""
                 )
+                chore[CONF_EFFORT] = self._pending_chore[CONF_EFFORT]
+                chore[CONF_DECAY] = self._pending_chore[CONF_DECAY]
+                chore[CONF_DECAY_POINTS] = self._pending_chore[CONF_DECAY_POINTS]
+                chore[CONF_PREFERRED_DAYS] = self._pending_chore[CONF_PREFERRED_DAYS]
             self._pending_chore = None
             return await self.async_step_init()
 
@@ -424,3 +573,93 @@ class HashOptionsFlow(OptionsFlow):
                 }
             ),
         )
+
+    async def async_step_settings(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage sensor and planner settings."""
+        errors: dict[str, str] = {}
+        if user_input is not None and len(
+            user_input.get(CONF_BLACKOUT_DAYS, [])
+        ) >= len(WEEKDAY_LABELS):
+            errors[CONF_BLACKOUT_DAYS] = "all_days_blacked_out"
+        elif user_input is not None:
+            self._min_cleanliness_delta = float(user_input[CONF_MIN_CLEANLINESS_DELTA])
+            self._daily_budget = int(user_input[CONF_DAILY_BUDGET])
+            self._assignment_mode = user_input[CONF_ASSIGNMENT_MODE]
+            self._preferred_days = user_input.get(CONF_PREFERRED_DAYS, [])
+            self._max_shift_days = int(user_input[CONF_MAX_SHIFT_DAYS])
+            self._blackout_days = user_input.get(CONF_BLACKOUT_DAYS, [])
+            self._blocked_calendars = user_input.get(CONF_BLOCKED_CALENDARS, [])
+            return await self.async_step_init()
+
+        return self.async_show_form(
+            step_id="settings",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_MIN_CLEANLINESS_DELTA,
+                        default=self._min_cleanliness_delta,
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=10,
+                            step=0.1,
+                            unit_of_measurement="%",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_DAILY_BUDGET,
+                        default=self._daily_budget,
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=20,
+                            step=1,
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_ASSIGNMENT_MODE,
+                        default=self._assignment_mode,
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                selector.SelectOptionDict(
+                                    value=ASSIGNMENT_ROTATION, label="Rotation"
+                                ),
+                                selector.SelectOptionDict(
+                                    value=ASSIGNMENT_FAIR_SHARE, label="Fair share"
+                                ),
+                            ],
+                            mode=selector.SelectSelectorMode.LIST,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_PREFERRED_DAYS, default=self._preferred_days
+                    ): _WEEKDAYS_SELECTOR,
+                    vol.Required(
+                        CONF_MAX_SHIFT_DAYS,
+                        default=self._max_shift_days,
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=0,
+                            max=6,
+                            step=1,
+                            unit_of_measurement="days",
+                            mode=selector.NumberSelectorMode.BOX,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_BLACKOUT_DAYS, default=self._blackout_days
+                    ): _WEEKDAYS_SELECTOR,
+                    vol.Optional(
+                        CONF_BLOCKED_CALENDARS, default=self._blocked_calendars
+                    ): selector.EntitySelector(
+                        selector.EntitySelectorConfig(domain="calendar", multiple=True)
+                    ),
+                }
+            ),
+            errors=errors,
+        )
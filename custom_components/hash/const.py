@@ -6,13 +6,31 @@ DOMAIN = "hash"
 STORAGE_KEY = "hash.chore_data"
 STORAGE_VERSION = 1
 
-PLATFORMS = ["sensor", "calendar"]
+PLATFORMS = ["sensor", "binary_sensor", "calendar"]
 
 # Decay thresholds
 THRESHOLD_GREAT = 75
 THRESHOLD_FINE = 50
 THRESHOLD_DIRTY = 25
 
+# Decay curves
+DECAY_LINEAR = "linear"
+DECAY_EXPONENTIAL = "exponential"
+DECAY_STEP = "step"
+DECAY_PIECEWISE = "piecewise"
+DECAY_LABELS: dict[str, str] = {
+    DECAY_LINEAR: "Linear",
+    DECAY_EXPONENTIAL: "Fast, then slow",
+    DECAY_STEP: "In steps",
+    DECAY_PIECEWISE: "Custom points",
+}
+# Exponential decay steepness; e^-3 leaves a 5% tail that is rescaled away
+DECAY_EXPONENTIAL_RATE = 3.0
+# Number of equal drops of the step curve
+DECAY_STEPS = 4
+# Piecewise curve used when no points are configured: slowly, then suddenly
+DECAY_PIECEWISE_DEFAULT_POINTS = "60:85, 85:50"
+
 STATUS_GREAT = "Great"
 STATUS_FINE = "Fine"
 STATUS_DIRTY = "Dirty"
@@ -59,17 +77,70 @@ CONF_ROOM = "room"
 CONF_INTERVAL = "interval"
 CONF_INTERVAL_PRESET = "interval_preset"
 CONF_ASSIGNED_PERSON = "assigned_person"
+CONF_EFFORT = "effort"
+CONF_DECAY = "decay"
+CONF_DECAY_POINTS = "decay_points"
 CONF_VACATION_PERSONS = "vacation_persons"
 CONF_GLOBAL_PAUSE = "global_pause"
+CONF_MIN_CLEANLINESS_DELTA = "min_cleanliness_delta"
+CONF_DAILY_BUDGET = "daily_budget"
+CONF_ASSIGNMENT_MODE = "assignment_mode"
+CONF_PREFERRED_DAYS = "preferred_days"
+CONF_MAX_SHIFT_DAYS = "max_shift_days"
+CONF_BLACKOUT_DAYS = "blackout_days"
+CONF_BLOCKED_CALENDARS = "blocked_calendars"
+
+# Weekdays in the order of datetime.date.weekday()
+WEEKDAYS = ("mon", "tue", "wed", "thu", "fri", "sat", "sun")
+WEEKDAY_LABELS: dict[str, str] = {
+    "mon": "Monday",
+    "tue": "Tuesday",
+    "wed": "Wednesday",
+    "thu": "Thursday",
+    "fri": "Friday",
+    "sat": "Saturday",
+    "sun": "Sunday",
+}
+
+# Assignment modes
+ASSIGNMENT_ROTATION = "rotation"
+ASSIGNMENT_FAIR_SHARE = "fair_share"
 
 # Service names
 SERVICE_COMPLETE_CHORE = "complete_chore"
 SERVICE_RESET_CHORE = "reset_chore"
 SERVICE_SET_VACATION = "set_vacation"
+SERVICE_SCHEDULE_VACATION = "schedule_vacation"
+SERVICE_CANCEL_VACATION = "cancel_vacation"
 SERVICE_SET_GLOBAL_PAUSE = "set_global_pause"
+SERVICE_EXPORT = "export"
+SERVICE_IMPORT = "import"
+SERVICE_URGENT_CHORES = "urgent_chores"
+SERVICE_FORECAST = "forecast"
+SERVICE_SIMULATE = "simulate"
+SERVICE_PROFILE = "profile"
 
 # Coordinator
 UPDATE_INTERVAL_MINUTES = 15
+# Number of chores listed by the most urgent chores sensor
+URGENT_CHORES_LIMIT = 5
+# Smallest cleanliness change (percentage points) worth a new sensor state
+DEFAULT_MIN_CLEANLINESS_DELTA = 1.0
+# Effort of a chore unless configured otherwise
+DEFAULT_EFFORT = 1
+# Completions within this many days count toward a person's fair share
+FAIR_SHARE_HISTORY_DAYS = 28
+# Planner: chores a person is given per day before load is levelled, how far
+# ahead the plan reaches and how many days a chore may be pushed back to
+# land on a preferred day
+DEFAULT_DAILY_BUDGET = 3
+PLAN_WEEKS = 4
+DEFAULT_MAX_SHIFT_DAYS = 2
+DEFAULT_PREFERRED_DAYS = ["sat"]
+# Days blocked by other calendars are fetched again in full once this old
+BLOCKED_MAX_AGE_MINUTES = 60
+# Dispatcher signal carrying {chore_id: snapshot} for updated chores
+SIGNAL_CHORES_UPDATED = f"{DOMAIN}_chores_updated"
 
 # Icons by status
 ICON_GREAT = "mdi:check-circle"
@@ -4,25 +4,46 @@ from __future__ import annotations
 
 import datetime
 import logging
+import os
+from collections.abc import Callable
 from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers import area_registry as ar
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_point_in_utc_time
 from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
+from .aggregates import HOME_KEY, GroupKey, HashAggregates, zero_at
+from .assignment import ChoreShare, FairShareAssigner
+from .blocked import BlockedDays, async_fetch_blocked
 from .const import (
+    ASSIGNMENT_FAIR_SHARE,
+    BLOCKED_MAX_AGE_MINUTES,
+    CONF_ASSIGNED_PERSON,
+    CONF_ASSIGNMENT_MODE,
+    CONF_BLOCKED_CALENDARS,
     CONF_CHORE_ID,
     CONF_CHORE_NAME,
     CONF_CHORES,
+    CONF_DAILY_BUDGET,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
+    CONF_EFFORT,
     CONF_GLOBAL_PAUSE,
     CONF_INTERVAL,
     CONF_ROOM,
     CONF_VACATION_PERSONS,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_EFFORT,
     DOMAIN,
+    FAIR_SHARE_HISTORY_DAYS,
     INTERVAL_DISPLAY,
+    PLAN_WEEKS,
+    SIGNAL_CHORES_UPDATED,
     STATUS_DIRTY,
     STATUS_FINE,
     STATUS_GREAT,
@@ -33,20 +54,57 @@ from .const import (
     THRESHOLD_FINE,
     THRESHOLD_GREAT,
     UPDATE_INTERVAL_MINUTES,
+    URGENT_CHORES_LIMIT,
 )
-from .scheduler import calculate_next_due, get_effective_assignee
+from .decay import LINEAR, DecayCurve, decay_curve
+from .planner import SchedulePlanner, plan_item
+from .scheduler import DayRules, calculate_next_due, day_rules, get_effective_assignee
+from .stats import async_get_stats
+from .vacation import Vacation, away, next_transition
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def calculate_cleanliness(last_cleaned: datetime.datetime, interval_days: int) -> float:
-    """Calculate cleanliness percentage based on elapsed time."""
-    now = dt_util.utcnow()
+def calculate_cleanliness(
+    last_cleaned: datetime.datetime,
+    interval_days: int,
+    now: datetime.datetime | None = None,
+    curve: DecayCurve = LINEAR,
+) -> float:
+    """Calculate cleanliness percentage based on elapsed time.
+
+    now defaults to the current time; pass another time to forecast.
+    """
+    if now is None:
+        now = dt_util.utcnow()
     elapsed = now - last_cleaned
     elapsed_hours = elapsed.total_seconds() / 3600
     total_hours = interval_days * 24
-    cleanliness = max(0.0, 100.0 - (elapsed_hours / total_hours) * 100.0)
-    return round(cleanliness, 1)
+    return round(curve(elapsed_hours / total_hours), 1)
+
+
+# Snapshot keys for the times cleanliness falls to each status threshold
+THRESHOLD_TIMES = {
+    "fine_at": THRESHOLD_GREAT,
+    "dirty_at": THRESHOLD_FINE,
+    "urgent_at": THRESHOLD_DIRTY,
+    "empty_at": 0,
+}
+
+
+def calculate_threshold_times(
+    last_cleaned: datetime.datetime,
+    interval_days: int,
+    curve: DecayCurve = LINEAR,
+) -> dict[str, str]:
+    """Return the UTC times at which cleanliness reaches each threshold."""
+    interval = datetime.timedelta(days=interval_days)
+    return {
+        key: dt_util.as_utc(
+            last_cleaned + interval * curve.crossing(threshold)
+        ).isoformat()
+        for key, threshold in THRESHOLD_TIMES.items()
+    }
 
 
 def get_status(cleanliness: float) -> str:
@@ -72,6 +130,17 @@ def _get_all_persons(hass: HomeAssistant) -> list[str]:
     return [state.entity_id for state in hass.states.async_all("person")]
 
 
+class HashStore(Store[dict[str, Any]]):
+    """Store that records the size of the file it last wrote."""
+
+    size: int | None = None
+
+    def _write_data(self, path: str, data: dict) -> None:
+        """Write the data and measure the file in the same executor job."""
+        super()._write_data(path, data)
+        self.size = os.path.getsize(path)
+
+
 class HashCoordinator(DataUpdateCoordinator[dict[str, Any]]):
     """Coordinator for HASH chore data."""
 
@@ -86,20 +155,216 @@ class HashCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             update_interval=datetime.timedelta(minutes=UPDATE_INTERVAL_MINUTES),
             config_entry=entry,
         )
-        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._store = HashStore(hass, STORAGE_VERSION, STORAGE_KEY)
         self._runtime_data: dict[str, dict[str, Any]] = {}
+        # Listeners by chore_id; the None key receives updates of every chore.
+        self._chore_listeners: dict[str | None, list[Callable[[str], None]]] = {}
+        # Change stamps by chore_id, bumped whenever a chore's snapshot changes
+        self._stamps: dict[str, int] = {}
+        # Chores changed by the last full refresh, not yet dispatched
+        self._changed: set[str] = set()
+        self.aggregates = HashAggregates()
+        self.assigner = FairShareAssigner()
+        # Decay curve of each chore, as of its last snapshot
+        self._curves: dict[str, DecayCurve] = {}
+        # Days blocked by other calendars, shared with the planner
+        self.blocked = BlockedDays()
+        self.planner = SchedulePlanner(
+            entry.options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET),
+            PLAN_WEEKS,
+            self.blocked,
+        )
+        # Day rules of each chore; options changes reload the entry
+        self._rules: dict[str, DayRules] = {
+            chore[CONF_CHORE_ID]: day_rules(entry.options, chore)
+            for chore in entry.options.get(CONF_CHORES, [])
+        }
+        # Chore configs by id, for the options chore list they were built from
+        self._indexed_chores: list[dict[str, Any]] | None = None
+        self._chore_configs: dict[str, dict[str, Any]] = {}
+        # Local date of the last refresh, shared by all of its due dates
+        self._today = dt_util.now().date()
+        # Scheduled vacations, the persons they currently make away and the
+        # timer for the next start or end
+        self._vacations: list[Vacation] = []
+        self._away: frozenset[str] = frozenset()
+        self._unsub_vacation: CALLBACK_TYPE | None = None
+        self.stats = async_get_stats(hass)
+        # Runtime changes made since the last save
+        self._unsaved = 0
+        # Completions kept in the history, counted as they are added or dropped
+        self._history_events = 0
+
+    @property
+    def runtime_data(self) -> dict[str, dict[str, Any]]:
+        """Return the persisted per-chore runtime data."""
+        return self._runtime_data
 
     async def async_load_store(self) -> None:
         """Load persisted data from store."""
-        stored = await self._store.async_load()
+        with self.stats.timed("store_load"):
+            stored = await self._store.async_load()
         if stored and "chores" in stored:
             self._runtime_data = stored["chores"]
         else:
             self._runtime_data = {}
+        self._vacations = [
+            Vacation.from_dict(vacation)
+            for vacation in (stored or {}).get("vacations", [])
+        ]
+        self._history_events = 0
+        self._async_add_history(
+            sum(
+                len(runtime.get("completed_by_history", ()))
+                for runtime in self._runtime_data.values()
+            )
+        )
+        self._async_schedule_vacations()
 
-    async def _async_save_store(self) -> None:
+    async def async_save_store(self) -> None:
         """Persist runtime data to store."""
-        await self._store.async_save({"chores": self._runtime_data})
+        data = {
+            "chores": self._runtime_data,
+            "vacations": [vacation.as_dict() for vacation in self._vacations],
+        }
+        saving = self._unsaved
+        with self.stats.timed("store_save"):
+            await self._store.async_save(data)
+        if (size := self._store.size) is not None:
+            self.stats.count("bytes_persisted", size)
+            self.stats.gauge("store_bytes", size)
+        self._unsaved -= saving
+        self.stats.gauge("unsaved_changes", self._unsaved)
+
+    @callback
+    def _async_add_history(self, count: int) -> None:
+        """Adjust and publish the number of completions kept in the history."""
+        self._history_events += count
+        self.stats.gauge("history_events", self._history_events)
+
+    @callback
+    def _async_drop_runtime(self, chore_id: str) -> None:
+        """Drop a chore's runtime data and its history."""
+        runtime = self._runtime_data.pop(chore_id)
+        self._async_add_history(-len(runtime.get("completed_by_history", ())))
+
+    @callback
+    def _async_mark_unsaved(self) -> None:
+        """Count a runtime change that is not saved yet."""
+        self._unsaved += 1
+        self.stats.gauge("unsaved_changes", self._unsaved)
+
+    async def async_shutdown(self) -> None:
+        """Cancel the vacation timer along with the refresh."""
+        if self._unsub_vacation is not None:
+            self._unsub_vacation()
+            self._unsub_vacation = None
+        await super().async_shutdown()
+
+    @property
+    def vacations(self) -> list[Vacation]:
+        """Return the scheduled vacations."""
+        return self._vacations
+
+    def vacation_list(self) -> list[str]:
+        """Return the persons on vacation, by toggle or by schedule."""
+        manual = self.config_entry.options.get(CONF_VACATION_PERSONS, [])
+        return [*manual, *sorted(self._away.difference(manual))]
+
+    async def async_add_vacation(
+        self, person: str, start: datetime.datetime, end: datetime.datetime
+    ) -> None:
+        """Schedule a vacation from start up to end."""
+        self._vacations.append(
+            Vacation(person, dt_util.as_utc(start), dt_util.as_utc(end))
+        )
+        self._async_mark_unsaved()
+        await self.async_save_store()
+        self._async_schedule_vacations()
+
+    async def async_remove_vacations(self, person: str) -> None:
+        """Cancel a person's current and upcoming vacations."""
+        self._vacations = [
+            vacation for vacation in self._vacations if vacation.person != person
+        ]
+        self._async_mark_unsaved()
+        await self.async_save_store()
+        self._async_schedule_vacations()
+
+    @callback
+    def _async_schedule_vacations(self, now: datetime.datetime | None = None) -> None:
+        """Apply the vacations that are on now and time the next change."""
+        if self._unsub_vacation is not None:
+            self._unsub_vacation()
+            self._unsub_vacation = None
+        now = now or dt_util.utcnow()
+        # Ended vacations are not needed anymore
+        self._vacations = [
+            vacation for vacation in self._vacations if vacation.end > now
+        ]
+        current = away(self._vacations, now)
+        if current != self._away:
+            self._away = current
+            self._async_reassign()
+        when = next_transition(self._vacations, now)
+        if when is not None:
+            self._unsub_vacation = async_track_point_in_utc_time(
+                self.hass, self._async_schedule_vacations, when
+            )
+
+    @callback
+    def _async_reassign(self) -> None:
+        """Recompute only the chores whose assignee changed with the roster."""
+        if self.data is None:
+            return
+        options = self.config_entry.options
+        chores = options.get(CONF_CHORES, [])
+        persons = _get_all_persons(self.hass)
+        vacation_list = self.vacation_list()
+        self._update_assignments(chores, persons, vacation_list)
+        reassigned = []
+        for chore in chores:
+            chore_id = chore[CONF_CHORE_ID]
+            snapshot = self.data.get(chore_id)
+            runtime = self._ensure_runtime(chore_id, chore[CONF_INTERVAL])
+            assignee = self._get_assignee(chore, runtime, persons, vacation_list)
+            if snapshot is None or snapshot["assigned_to"] != assignee:
+                reassigned.append(chore)
+        self._async_update_chores(reassigned, persons, vacation_list)
+
+    @callback
+    def _async_update_chores(
+        self,
+        chores: list[dict[str, Any]],
+        persons: list[str],
+        vacation_list: list[str],
+    ) -> None:
+        """Recompute several chores and notify the listeners once.
+
+        Assignments must be up to date. The data mapping is copied once and,
+        as after a full refresh, only the changed chores' listeners are called
+        besides the coordinator listeners.
+        """
+        if not chores or self.data is None:
+            return
+        options = self.config_entry.options
+        global_pause = options.get(CONF_GLOBAL_PAUSE, False)
+        area_registry = ar.async_get(self.hass)
+        changed = {}
+        for chore in chores:
+            snapshot = self._plan_snapshot(
+                chore, persons, vacation_list, global_pause, area_registry
+            )
+            chore_id = chore[CONF_CHORE_ID]
+            if snapshot != self.data.get(chore_id):
+                changed[chore_id] = snapshot
+        if not changed:
+            return
+        for chore_id, snapshot in changed.items():
+            self._bump_stamp(chore_id)
+            self.aggregates.update(chore_id, snapshot)
+        self.data = {**self.data, **changed}
+        self.async_update_listeners()
 
     def _ensure_runtime(self, chore_id: str, interval_days: int = 1) -> dict[str, Any]:
         """Ensure runtime data exists for a chore, initializing if needed.
@@ -120,102 +385,462 @@ class HashCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         """Fetch and compute chore data."""
         options = self.config_entry.options
         chores = options.get(CONF_CHORES, [])
-        vacation_list = options.get(CONF_VACATION_PERSONS, [])
+        vacation_list = self.vacation_list()
         global_pause = options.get(CONF_GLOBAL_PAUSE, False)
         persons = _get_all_persons(self.hass)
 
         area_registry = ar.async_get(self.hass)
-        result: dict[str, Any] = {}
+        self._today = dt_util.now().date()
+        await self._async_refresh_blocked()
+
+        self.stats.count("refreshes")
+        with self.stats.timed("refresh"):
+            self._update_assignments(chores, persons, vacation_list)
+            snapshots = {
+                chore[CONF_CHORE_ID]: self._build_chore_data(
+                    chore, persons, vacation_list, global_pause, area_registry
+                )
+                for chore in chores
+            }
+            self.planner.update(
+                {
+                    chore_id: item
+                    for chore_id, snapshot in snapshots.items()
+                    if (item := plan_item(snapshot, self._day_rules(chore_id)))
+                    is not None
+                },
+                self._today,
+            )
 
-        for chore in chores:
-            chore_id = chore[CONF_CHORE_ID]
-            interval_days = chore[CONF_INTERVAL]
-            runtime = self._ensure_runtime(chore_id, interval_days)
+            previous = self.data or {}
+            data: dict[str, Any] = {}
+            changed = 0
+            for chore_id, snapshot in snapshots.items():
+                self._apply_plan(chore_id, snapshot)
+                old = previous.get(chore_id)
+                if old == snapshot:
+                    # Keep the old object so unchanged chores compare by identity
+                    snapshot = old
+                else:
+                    self._bump_stamp(chore_id)
+                    self.aggregates.update(chore_id, snapshot)
+                    changed += 1
+                data[chore_id] = snapshot
+            for chore_id in previous.keys() - data.keys():
+                # Wake the removed chore's listeners so its sensor goes away
+                self._bump_stamp(chore_id)
+                self.aggregates.update(chore_id, None)
+        self.stats.gauge("refresh_changed", changed)
+        return data
+
+    async def _async_refresh_blocked(self) -> None:
+        """Fetch the blocked days the planning horizon has moved onto."""
+        calendars = self.config_entry.options.get(CONF_BLOCKED_CALENDARS, [])
+        if not calendars:
+            return
+        # Occurrences near the horizon may be shifted past it
+        end = self._today + datetime.timedelta(weeks=PLAN_WEEKS + 1)
+        self.blocked.expire(
+            dt_util.utcnow() - datetime.timedelta(minutes=BLOCKED_MAX_AGE_MINUTES)
+        )
+        self.blocked.prune(self._today)
+        missing = self.blocked.missing(self._today, end)
+        if missing is None:
+            return
+        ranges = await async_fetch_blocked(self.hass, calendars, *missing)
+        if ranges is not None:
+            self.blocked.update(*missing, ranges)
+
+    def _bump_stamp(self, chore_id: str) -> None:
+        """Record that a chore's snapshot changed."""
+        self._stamps[chore_id] = self._stamps.get(chore_id, 0) + 1
+        self._changed.add(chore_id)
+
+    @callback
+    def chore_stamp(self, chore_id: str) -> int:
+        """Return the change stamp of a chore; it only grows when it changes."""
+        return self._stamps.get(chore_id, 0)
+
+    def _build_chore_data(
+        self,
+        chore: dict[str, Any],
+        persons: list[str],
+        vacation_list: list[str],
+        global_pause: bool,
+        area_registry: ar.AreaRegistry,
+    ) -> dict[str, Any]:
+        """Compute the data snapshot for a single chore."""
+        chore_id = chore[CONF_CHORE_ID]
+        interval_days = chore[CONF_INTERVAL]
+        runtime = self._ensure_runtime(chore_id, interval_days)
+
+        last_cleaned_str = runtime["last_cleaned"]
+        last_cleaned = datetime.datetime.fromisoformat(last_cleaned_str)
+        if last_cleaned.tzinfo is None:
+            last_cleaned = last_cleaned.replace(tzinfo=datetime.UTC)
+
+        curve = decay_curve(chore.get(CONF_DECAY), chore.get(CONF_DECAY_POINTS))
+        self._curves[chore_id] = curve
+        cleanliness = calculate_cleanliness(last_cleaned, interval_days, curve=curve)
+        status = get_status(cleanliness)
 
-            last_cleaned_str = runtime["last_cleaned"]
-            last_cleaned = datetime.datetime.fromisoformat(last_cleaned_str)
-            if last_cleaned.tzinfo is None:
-                last_cleaned = last_cleaned.replace(tzinfo=datetime.UTC)
+        now = dt_util.utcnow()
+        days_since = (now - last_cleaned).total_seconds() / 86400
 
-            cleanliness = calculate_cleanliness(last_cleaned, interval_days)
-            status = get_status(cleanliness)
+        effective_assignee = self._get_assignee(chore, runtime, persons, vacation_list)
 
-            now = dt_util.utcnow()
-            days_since = (now - last_cleaned).total_seconds() / 86400
+        if global_pause:
+            next_due = None
+        else:
+            # Preferred days and load levelling are left to the planner
+            next_due = calculate_next_due(
+                dt_util.as_local(last_cleaned), interval_days, prefer_weekends=False
+            )
 
-            effective_assignee = get_effective_assignee(
-                chore, runtime, persons, vacation_list
+        area_id = chore.get(CONF_ROOM, "")
+        area_entry = area_registry.async_get_area(area_id) if area_id else None
+        room_name = area_entry.name if area_entry else area_id
+
+        return {
+            "name": chore[CONF_CHORE_NAME],
+            "area_id": area_id,
+            "room": room_name,
+            "interval_days": interval_days,
+            "interval_display": get_interval_display(interval_days),
+            "cleanliness": cleanliness,
+            "status": status,
+            "days_since": round(days_since, 1),
+            "last_cleaned": last_cleaned.isoformat(),
+            "next_due": next_due.isoformat() if next_due else None,
+            "assigned_to": effective_assignee,
+            "chore_id": chore_id,
+            "effort": chore.get(CONF_EFFORT, DEFAULT_EFFORT),
+            "decay": curve.kind,
+            **calculate_threshold_times(last_cleaned, interval_days, curve),
+        }
+
+    @property
+    def fair_share(self) -> bool:
+        """Return whether chores are assigned by fair share instead of rotation."""
+        return (
+            self.config_entry.options.get(CONF_ASSIGNMENT_MODE) == ASSIGNMENT_FAIR_SHARE
+        )
+
+    def _get_assignee(
+        self,
+        chore: dict[str, Any],
+        runtime: dict[str, Any],
+        persons: list[str],
+        vacation_list: list[str],
+    ) -> str | None:
+        """Return the effective assignee of a chore in the configured mode."""
+        if self.fair_share:
+            return self.assigner.assignee(chore[CONF_CHORE_ID])
+        return get_effective_assignee(chore, runtime, persons, vacation_list)
+
+    def _update_assignments(
+        self,
+        chores: list[dict[str, Any]],
+        persons: list[str],
+        vacation_list: list[str],
+    ) -> None:
+        """Place new, changed and released chores in fair-share mode."""
+        if not self.fair_share:
+            return
+        shares = {}
+        for chore in chores:
+            pinned = chore.get(CONF_ASSIGNED_PERSON) or ""
+            shares[chore[CONF_CHORE_ID]] = ChoreShare(
+                chore.get(CONF_EFFORT, DEFAULT_EFFORT),
+                "" if pinned in vacation_list else pinned,
             )
+        placed = self.assigner.update(
+            shares,
+            [person for person in persons if person not in vacation_list],
+            lambda: self._completed_effort(chores),
+            {
+                chore_id: runtime["assignee"]
+                for chore_id, runtime in self._runtime_data.items()
+                if runtime.get("assignee")
+            },
+        )
+        for chore in chores:
+            if chore[CONF_CHORE_ID] in placed:
+                runtime = self._ensure_runtime(
+                    chore[CONF_CHORE_ID], chore[CONF_INTERVAL]
+                )
+                runtime["assignee"] = self.assigner.assignee(chore[CONF_CHORE_ID])
+
+    def _completed_effort(self, chores: list[dict[str, Any]]) -> dict[str, float]:
+        """Return the effort each person completed within the history window."""
+        since = (
+            dt_util.utcnow() - datetime.timedelta(days=FAIR_SHARE_HISTORY_DAYS)
+        ).isoformat()
+        completed: dict[str, float] = {}
+        for chore in chores:
+            runtime = self._runtime_data.get(chore[CONF_CHORE_ID], {})
+            effort = chore.get(CONF_EFFORT, DEFAULT_EFFORT)
+            for entry in runtime.get("completed_by_history", []):
+                if entry["timestamp"] >= since:
+                    person = entry["person"]
+                    completed[person] = completed.get(person, 0) + effort
+        return completed
+
+    def _day_rules(self, chore_id: str) -> DayRules:
+        """Return the day rules of a chore."""
+        rules = self._rules.get(chore_id)
+        if rules is None:
+            rules = self._rules[chore_id] = day_rules(
+                self.config_entry.options, self._find_chore_config(chore_id)
+            )
+        return rules
+
+    def _apply_plan(self, chore_id: str, snapshot: dict[str, Any]) -> None:
+        """Replace a snapshot's raw due date with the first planned date.
 
-            if global_pause:
-                next_due = None
-            else:
-                next_due = calculate_next_due(last_cleaned, interval_days)
+        The later planned dates stay with the planner for the calendars, so
+        snapshots hold only scalars and unchanged chores compare equal
+        field by field in the panel.
+        """
+        dates = self.planner.dates(chore_id)
+        if dates:
+            snapshot["next_due"] = dates[0].isoformat()
+
+    @callback
+    def async_get_chore_snapshot(self, chore_id: str) -> dict[str, Any] | None:
+        """Compute a fresh snapshot for one chore, re-planning only that chore."""
+        chore = self._find_chore_config(chore_id)
+        if chore is None:
+            return None
+        options = self.config_entry.options
+        persons = _get_all_persons(self.hass)
+        vacation_list = self.vacation_list()
+        self._update_assignments(options.get(CONF_CHORES, []), persons, vacation_list)
+        return self._plan_snapshot(
+            chore,
+            persons,
+            vacation_list,
+            options.get(CONF_GLOBAL_PAUSE, False),
+            ar.async_get(self.hass),
+        )
 
-            area_id = chore.get(CONF_ROOM, "")
-            area_entry = area_registry.async_get_area(area_id) if area_id else None
-            room_name = area_entry.name if area_entry else area_id
+    def _plan_snapshot(
+        self,
+        chore: dict[str, Any],
+        persons: list[str],
+        vacation_list: list[str],
+        global_pause: bool,
+        area_registry: ar.AreaRegistry,
+    ) -> dict[str, Any]:
+        """Build a chore's snapshot and re-plan only that chore."""
+        chore_id = chore[CONF_CHORE_ID]
+        snapshot = self._build_chore_data(
+            chore, persons, vacation_list, global_pause, area_registry
+        )
+        self.planner.update_item(
+            chore_id, plan_item(snapshot, self._day_rules(chore_id)), self._today
+        )
+        self._apply_plan(chore_id, snapshot)
+        return snapshot
+
+    @callback
+    def async_most_urgent(
+        self, key: GroupKey = HOME_KEY, limit: int = URGENT_CHORES_LIMIT
+    ) -> list[dict[str, Any]]:
+        """Return a group's most urgent chores, soonest to reach 0% first."""
+        data = self.data or {}
+        result = []
+        for chore_id in self.aggregates.most_urgent(key, limit):
+            snapshot = data[chore_id]
+            due_at = dt_util.utc_from_timestamp(zero_at(snapshot))
+            result.append(
+                {
+                    "chore_id": chore_id,
+                    "name": snapshot["name"],
+                    "room": snapshot["room"],
+                    "assigned_to": snapshot["assigned_to"],
+                    "cleanliness": snapshot["cleanliness"],
+                    "due_at": due_at.isoformat(),
+                }
+            )
+        return result
 
+    @callback
+    def async_forecast(
+        self,
+        at: datetime.datetime,
+        chore_ids: set[str] | None = None,
+        person: str | None = None,
+        area_id: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """Predict cleanliness and status of the matching chores at a time."""
+        result = {}
+        for chore_id, snapshot in (self.data or {}).items():
+            if (
+                (chore_ids is not None and chore_id not in chore_ids)
+                or (person is not None and snapshot["assigned_to"] != person)
+                or (area_id is not None and snapshot["area_id"] != area_id)
+            ):
+                continue
+            last_cleaned = datetime.datetime.fromisoformat(snapshot["last_cleaned"])
+            cleanliness = calculate_cleanliness(
+                last_cleaned,
+                snapshot["interval_days"],
+                at,
+                self._curves.get(chore_id, LINEAR),
+            )
             result[chore_id] = {
-                "name": chore[CONF_CHORE_NAME],
-                "area_id": area_id,
-                "room": room_name,
-                "interval_days": interval_days,
-                "interval_display": get_interval_display(interval_days),
+                "name": snapshot["name"],
                 "cleanliness": cleanliness,
-                "status": status,
-                "days_since": round(days_since, 1),
-                "last_cleaned": last_cleaned.isoformat(),
-                "next_due": next_due.isoformat() if next_due else None,
-                "assigned_to": effective_assignee,
-                "chore_id": chore_id,
+                "status": get_status(cleanliness),
             }
-
         return result
 
+    @callback
+    def async_add_chore_listener(
+        self, update_callback: Callable[[str], None], chore_id: str | None = None
+    ) -> CALLBACK_TYPE:
+        """Listen for changes of chore_id, or single-chore updates of any chore.
+
+        The callback receives the id of the changed chore. Full refreshes
+        call the listeners of each changed chore; listeners for any chore
+        (chore_id None) only hear about single-chore updates and should rely
+        on the regular coordinator listeners for full refreshes.
+        """
+        listeners = self._chore_listeners.setdefault(chore_id, [])
+        listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            listeners.remove(update_callback)
+            if not listeners:
+                self._chore_listeners.pop(chore_id, None)
+
+        return remove_listener
+
+    @callback
+    def async_update_chore(self, chore_id: str) -> None:
+        """Recompute one chore and notify only the listeners depending on it.
+
+        The new data mapping shares every other chore's snapshot with the
+        previous one.
+        """
+        snapshot = self.async_get_chore_snapshot(chore_id)
+        if snapshot is None or self.data is None:
+            return
+        if snapshot == self.data.get(chore_id):
+            return
+        self._stamps[chore_id] = self._stamps.get(chore_id, 0) + 1
+        self.aggregates.update(chore_id, snapshot)
+        self.data = {**self.data, chore_id: snapshot}
+        # Copy the lists first, listeners may remove themselves
+        listeners = tuple(self._chore_listeners.get(chore_id, ())) + tuple(
+            self._chore_listeners.get(None, ())
+        )
+        for update_callback in listeners:
+            update_callback(chore_id)
+        async_dispatcher_send(self.hass, SIGNAL_CHORES_UPDATED, {chore_id: snapshot})
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update listeners, dispatching per-chore only for changed chores."""
+        super().async_update_listeners()
+        changed, self._changed = self._changed, set()
+        if not changed or not self.data:
+            return
+        for chore_id in changed:
+            for update_callback in tuple(self._chore_listeners.get(chore_id, ())):
+                update_callback(chore_id)
+        async_dispatcher_send(
+            self.hass,
+            SIGNAL_CHORES_UPDATED,
+            {
+                chore_id: self.data[chore_id]
+                for chore_id in changed
+                if chore_id in self.data
+            },
+        )
+
     async def async_complete_chore(self, chore_id: str) -> None:
         """Mark a chore as completed: reset timer, advance rotation."""
+        self.apply_completion(chore_id)
+        await self.async_save_store()
+        self.async_update_chore(chore_id)
+
+    def apply_completion(
+        self, chore_id: str, chore_config: dict[str, Any] | None = None
+    ) -> None:
+        """Record a completion in runtime data without saving or refreshing.
+
+        chore_config may be passed for chores not yet written to the options.
+        """
         runtime = self._ensure_runtime(chore_id)
         now = dt_util.utcnow()
 
         # Determine who completed it
-        options = self.config_entry.options
-        vacation_list = options.get(CONF_VACATION_PERSONS, [])
+        vacation_list = self.vacation_list()
         persons = _get_all_persons(self.hass)
-        chore_config = self._find_chore_config(chore_id)
+        if chore_config is None:
+            chore_config = self._find_chore_config(chore_id)
 
         if chore_config:
-            assignee = get_effective_assignee(
-                chore_config, runtime, persons, vacation_list
-            )
+            assignee = self._get_assignee(chore_config, runtime, persons, vacation_list)
         else:
             assignee = None
 
         runtime["last_cleaned"] = now.isoformat()
         runtime["rotation_index"] = runtime.get("rotation_index", 0) + 1
+        self.stats.count("completions")
+        self._async_mark_unsaved()
 
         if assignee:
             history = runtime.get("completed_by_history", [])
             history.append({"person": assignee, "timestamp": now.isoformat()})
             runtime["completed_by_history"] = history
+            self._async_add_history(1)
 
-        await self._async_save_store()
-        await self.async_request_refresh()
+        # The next round goes to whoever then has the least load
+        self.assigner.release(chore_id)
+        runtime.pop("assignee", None)
 
     async def async_reset_chore(self, chore_id: str) -> None:
         """Reset a chore's timer without advancing rotation."""
         runtime = self._ensure_runtime(chore_id)
         runtime["last_cleaned"] = dt_util.utcnow().isoformat()
-        await self._async_save_store()
-        await self.async_request_refresh()
+        self._async_mark_unsaved()
+        await self.async_save_store()
+        self.async_update_chore(chore_id)
 
     def _find_chore_config(self, chore_id: str) -> dict | None:
         """Find a chore config by ID."""
         chores = self.config_entry.options.get(CONF_CHORES, [])
-        for chore in chores:
-            if chore[CONF_CHORE_ID] == chore_id:
-                return chore
-        return None
+        if chores is not self._indexed_chores:
+            self._indexed_chores = chores
+            self._chore_configs = {chore[CONF_CHORE_ID]: chore for chore in chores}
+        return self._chore_configs.get(chore_id)
+
+    async def async_import_runtime(
+        self, runtime: dict[str, dict[str, Any]], keep: set[str]
+    ) -> None:
+        """Merge imported runtime data, drop data for other chores and save once.
+
+        Imported history replaces the chore's history so re-imports are
+        idempotent.
+        """
+        for chore_id, imported in runtime.items():
+            current = self._ensure_runtime(chore_id)
+            if "last_cleaned" in imported:
+                current["last_cleaned"] = imported["last_cleaned"]
+                current["rotation_index"] = imported["rotation_index"]
+            if history := imported.get("completed_by_history"):
+                self._async_add_history(
+                    len(history) - len(current.get("completed_by_history", ()))
+                )
+                current["completed_by_history"] = history
+        for chore_id in [cid for cid in self._runtime_data if cid not in keep]:
+            self._async_drop_runtime(chore_id)
+        self._async_mark_unsaved()
+        await self.async_save_store()
 
     async def async_cleanup_removed_chores(self) -> None:
         """Remove runtime data for chores that no longer exist in config."""
@@ -223,6 +848,16 @@ class HashCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         active_ids = {c[CONF_CHORE_ID] for c in chores}
         removed = [cid for cid in self._runtime_data if cid not in active_ids]
         for cid in removed:
-            del self._runtime_data[cid]
+            self._async_drop_runtime(cid)
         if removed:
-            await self._async_save_store()
+            self._async_mark_unsaved()
+            await self.async_save_store()
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant) -> HashCoordinator | None:
+    """Return the first loaded coordinator, if any."""
+    for coordinator in hass.data.get(DOMAIN, {}).values():
+        if isinstance(coordinator, HashCoordinator):
+            return coordinator
+    return None
@@ -0,0 +1,207 @@
+"""Decay curves for HASH.
+
+A curve maps the fraction of a chore's interval that has elapsed since it
+was cleaned to a cleanliness percentage. Every curve starts at 100% and
+reaches 0% once the interval has elapsed, so due dates and urgency keep
+their meaning. Each curve evaluates, inverts and integrates in closed form,
+or from a small precomputed table, so all of them cost O(1) per chore.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from functools import lru_cache
+
+from .const import (
+    DECAY_EXPONENTIAL,
+    DECAY_EXPONENTIAL_RATE,
+    DECAY_LINEAR,
+    DECAY_PIECEWISE,
+    DECAY_PIECEWISE_DEFAULT_POINTS,
+    DECAY_STEP,
+    DECAY_STEPS,
+)
+
+
+class DecayCurve:
+    """Cleanliness as a function of the elapsed fraction of the interval."""
+
+    kind = DECAY_LINEAR
+
+    def value(self, fraction: float) -> float:
+        """Return the cleanliness after the given fraction of the interval."""
+        return 100.0 * (1.0 - fraction)
+
+    def crossing(self, threshold: float) -> float:
+        """Return the fraction at which cleanliness falls below threshold.
+
+        For a threshold of 0 this is where it reaches 0%, which is 1 for
+        every curve.
+        """
+        return 1.0 - threshold / 100.0
+
+    def integral(self, fraction: float) -> float:
+        """Return the cleanliness integrated over the first fraction."""
+        return 100.0 * (fraction - fraction * fraction / 2)
+
+    def __call__(self, fraction: float) -> float:
+        """Return the cleanliness clamped to 0–100% for any fraction."""
+        if fraction <= 0:
+            return 100.0
+        if fraction >= 1:
+            return 0.0
+        return self.value(fraction)
+
+    def area(self, start: float, end: float) -> float:
+        """Return the cleanliness integrated between two fractions."""
+        return self._area_to(end) - self._area_to(start)
+
+    def _area_to(self, fraction: float) -> float:
+        """Return the clamped integral from 0 to fraction, which may exceed 1."""
+        return self.integral(min(max(fraction, 0.0), 1.0))
+
+
+class ExponentialDecay(DecayCurve):
+    """Gets dirty fast at first, then levels off, like kitchen surfaces."""
+
+    kind = DECAY_EXPONENTIAL
+
+    def __init__(self, rate: float = DECAY_EXPONENTIAL_RATE) -> None:
+        """Initialize the curve; higher rates drop faster at first."""
+        self._rate = rate
+        self._floor = math.exp(-rate)
+        self._scale = 100.0 / (1.0 - self._floor)
+
+    def value(self, fraction: float) -> float:
+        """Return the cleanliness, rescaled so it reaches 0% at the interval."""
+        return self._scale * (math.exp(-self._rate * fraction) - self._floor)
+
+    def crossing(self, threshold: float) -> float:
+        """Invert value in closed form."""
+        return -math.log(threshold / self._scale + self._floor) / self._rate
+
+    def integral(self, fraction: float) -> float:
+        """Integrate value in closed form."""
+        rate = self._rate
+        return self._scale * (
+            (1.0 - math.exp(-rate * fraction)) / rate - self._floor * fraction
+        )
+
+
+class StepDecay(DecayCurve):
+    """Drops in equal steps, e.g. when a chore is only noticed at times."""
+
+    kind = DECAY_STEP
+
+    def __init__(self, steps: int = DECAY_STEPS) -> None:
+        """Initialize the curve with the number of steps down to 0%."""
+        self._steps = steps
+
+    def value(self, fraction: float) -> float:
+        """Return the level of the step the fraction falls in."""
+        return 100.0 * (1.0 - math.floor(fraction * self._steps) / self._steps)
+
+    def crossing(self, threshold: float) -> float:
+        """Return the start of the first step below the threshold."""
+        if threshold <= 0:
+            return 1.0
+        steps = self._steps
+        return math.floor(steps * (1.0 - threshold / 100.0)) / steps + 1.0 / steps
+
+    def integral(self, fraction: float) -> float:
+        """Sum the whole steps and the part of the current one."""
+        steps = self._steps
+        whole = min(math.floor(fraction * steps), steps)
+        full = sum(100.0 * (1.0 - i / steps) for i in range(whole)) / steps
+        return full + (fraction - whole / steps) * self.value(fraction)
+
+
+class PiecewiseDecay(DecayCurve):
+    """Straight segments between points, e.g. slowly then suddenly."""
+
+    kind = DECAY_PIECEWISE
+
+    def __init__(self, points: tuple[tuple[float, float], ...]) -> None:
+        """Initialize from (fraction, cleanliness) points between the ends."""
+        table = [(0.0, 100.0), *points, (1.0, 0.0)]
+        self._fractions = [fraction for fraction, _ in table]
+        self._values = [value for _, value in table]
+        # Cleanliness values ascending, for bisecting the inverse
+        self._ascending = self._values[::-1]
+        # Integral up to each point
+        self._areas = [0.0]
+        for i in range(1, len(table)):
+            width = self._fractions[i] - self._fractions[i - 1]
+            self._areas.append(
+                self._areas[-1] + width * (self._values[i] + self._values[i - 1]) / 2
+            )
+
+    def _segment(self, fraction: float) -> int:
+        """Return the index of the point that ends the fraction's segment."""
+        return min(
+            bisect.bisect_right(self._fractions, fraction), len(self._values) - 1
+        )
+
+    def value(self, fraction: float) -> float:
+        """Interpolate between the surrounding points."""
+        i = self._segment(fraction)
+        x0, x1 = self._fractions[i - 1], self._fractions[i]
+        y0, y1 = self._values[i - 1], self._values[i]
+        return y0 + (y1 - y0) * (fraction - x0) / (x1 - x0)
+
+    def crossing(self, threshold: float) -> float:
+        """Interpolate the inverse within the segment crossing threshold."""
+        if threshold <= 0:
+            return 1.0
+        # Last point still at or above the threshold
+        i = len(self._values) - bisect.bisect_left(self._ascending, threshold) - 1
+        x0, x1 = self._fractions[i], self._fractions[i + 1]
+        y0, y1 = self._values[i], self._values[i + 1]
+        if y0 == y1:
+            return x1
+        return x0 + (x1 - x0) * (y0 - threshold) / (y0 - y1)
+
+    def integral(self, fraction: float) -> float:
+        """Add the area of the partial segment to the precomputed table."""
+        i = self._segment(fraction)
+        x0 = self._fractions[i - 1]
+        return (
+            self._areas[i - 1]
+            + (fraction - x0) * (self._values[i - 1] + self.value(fraction)) / 2
+        )
+
+
+LINEAR = DecayCurve()
+
+
+def parse_points(text: str) -> tuple[tuple[float, float], ...]:
+    """Parse "elapsed%:cleanliness%" pairs, e.g. "60:85, 90:40".
+
+    Raises ValueError unless elapsed percentages strictly increase between
+    0 and 100 and cleanliness does not increase.
+    """
+    points = []
+    for part in text.replace(";", ",").split(","):
+        if not part.strip():
+            continue
+        elapsed, _, cleanliness = part.partition(":")
+        points.append((float(elapsed) / 100, float(cleanliness)))
+    previous = (0.0, 100.0)
+    for fraction, value in [*points, (1.0, 0.0)]:
+        if not previous[0] < fraction <= 1 or not 0 <= value <= previous[1]:
+            raise ValueError(f"invalid decay point {fraction * 100:g}:{value:g}")
+        previous = (fraction, value)
+    return tuple(points)
+
+
+@lru_cache(maxsize=64)
+def decay_curve(kind: str | None, points: str | None = None) -> DecayCurve:
+    """Return the (shared) curve for a chore's decay settings."""
+    if kind == DECAY_EXPONENTIAL:
+        return ExponentialDecay()
+    if kind == DECAY_STEP:
+        return StepDecay()
+    if kind == DECAY_PIECEWISE:
+        return PiecewiseDecay(parse_points(points or DECAY_PIECEWISE_DEFAULT_POINTS))
+    return LINEAR
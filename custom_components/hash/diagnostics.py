@@ -0,0 +1,35 @@
+"""Diagnostics support for HASH."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_CHORES, DOMAIN
+from .coordinator import HashCoordinator
+from .stats import async_get_stats
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: HashCoordinator = hass.data[DOMAIN][entry.entry_id]
+    options = entry.options
+    return {
+        "options": {
+            **{key: value for key, value in options.items() if key != CONF_CHORES},
+            "chores": len(options.get(CONF_CHORES, [])),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "chores": len(coordinator.data or {}),
+            "runtime_chores": len(coordinator.runtime_data),
+            "vacations": [vacation.as_dict() for vacation in coordinator.vacations],
+            "on_vacation": coordinator.vacation_list(),
+            "blocked_ranges": len(coordinator.blocked),
+        },
+        "stats": async_get_stats(hass).as_dict(),
+    }
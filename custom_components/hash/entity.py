@@ -0,0 +1,20 @@
+"""Shared entity helpers for HASH platforms."""
+
+from __future__ import annotations
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+
+def device_info(entry: ConfigEntry) -> DeviceInfo:
+    """Return the device all HASH entities belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name="HASH Cleaning Hub",
+        manufacturer="HASH",
+        model="Sweeping Hub",
+        entry_type=DeviceEntryType.SERVICE,
+    )
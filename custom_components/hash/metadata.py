@@ -0,0 +1,193 @@
+"""Cached area and person lookup tables for the HASH dashboard."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.auth.models import User
+from homeassistant.const import ATTR_FRIENDLY_NAME, EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
+
+from .const import DOMAIN
+
+DATA_METADATA = "_metadata"
+
+PERSON_DOMAIN = "person"
+ATTR_USER_ID = "user_id"
+
+
+@callback
+def async_get_metadata(hass: HomeAssistant) -> HashMetadata:
+    """Return the shared metadata cache, creating it on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    metadata: HashMetadata | None = domain_data.get(DATA_METADATA)
+    if metadata is None:
+        metadata = HashMetadata(hass)
+        metadata.async_setup()
+        domain_data[DATA_METADATA] = metadata
+    return metadata
+
+
+@callback
+def async_shutdown_metadata(hass: HomeAssistant) -> None:
+    """Stop and drop the shared metadata cache; the next use rebuilds it."""
+    metadata: HashMetadata | None = hass.data.get(DOMAIN, {}).pop(DATA_METADATA, None)
+    if metadata is not None:
+        metadata.async_shutdown()
+
+
+@callback
+def _person_changed(data: EventStateChangedData) -> bool:
+    """Return True if a person entity was added, removed or renamed/relinked."""
+    if not data["entity_id"].startswith(f"{PERSON_DOMAIN}."):
+        return False
+    old_state = data["old_state"]
+    new_state = data["new_state"]
+    if old_state is None or new_state is None:
+        return True
+    return any(
+        old_state.attributes.get(attr) != new_state.attributes.get(attr)
+        for attr in (ATTR_FRIENDLY_NAME, ATTR_USER_ID)
+    )
+
+
+class HashMetadata:
+    """Area map, person roster and user->person index, rebuilt on registry changes.
+
+    The tables are built lazily and dropped whenever the area registry or a
+    person entity changes; ``version`` is bumped at the same time so clients
+    know when to refetch.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.version = 1
+        self._areas: dict[str, str] | None = None
+        self._persons: list[dict[str, Any]] | None = None
+        self._linked_users: dict[str, dict[str, Any]] = {}
+        self._user_index: dict[str, str | None] = {}
+        self._unsubs: list[Any] = []
+
+    @callback
+    def async_setup(self) -> None:
+        """Start listening for area and person changes."""
+        self._unsubs.append(
+            self.hass.bus.async_listen(
+                ar.EVENT_AREA_REGISTRY_UPDATED, self._async_invalidate
+            )
+        )
+        self._unsubs.append(
+            self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED,
+                self._async_invalidate,
+                event_filter=_person_changed,
+            )
+        )
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop listening for changes."""
+        for unsub in self._unsubs:
+            unsub()
+        self._unsubs.clear()
+
+    @callback
+    def _async_invalidate(self, _event: Event[Any]) -> None:
+        """Drop cached tables and bump the version."""
+        self._areas = None
+        self._persons = None
+        self._linked_users = {}
+        self._user_index = {}
+        self.version += 1
+
+    @property
+    def areas(self) -> dict[str, str]:
+        """Return a mapping of area_id to area name."""
+        if self._areas is None:
+            self._areas = {
+                area.id: area.name
+                for area in ar.async_get(self.hass).async_list_areas()
+            }
+        return self._areas
+
+    @property
+    def persons(self) -> list[dict[str, Any]]:
+        """Return all person entities with their display names."""
+        if self._persons is None:
+            self._persons = [
+                {
+                    "entity_id": state.entity_id,
+                    "name": state.attributes.get(ATTR_FRIENDLY_NAME)
+                    or state.entity_id.removeprefix(f"{PERSON_DOMAIN}."),
+                    ATTR_USER_ID: state.attributes.get(ATTR_USER_ID),
+                }
+                for state in self.hass.states.async_all(PERSON_DOMAIN)
+            ]
+            self._linked_users = {
+                p[ATTR_USER_ID]: p for p in self._persons if p[ATTR_USER_ID]
+            }
+        return self._persons
+
+    @callback
+    def async_person_name(self, entity_id: str) -> str:
+        """Return a person's display name, or its title-cased slug if unknown."""
+        return (
+            next(
+                (p["name"] for p in self.persons if p["entity_id"] == entity_id),
+                None,
+            )
+            or entity_id.removeprefix(f"{PERSON_DOMAIN}.").replace("_", " ").title()
+        )
+
+    @callback
+    def async_person_for_user(self, user: User | None) -> str | None:
+        """Return the person entity linked to a user.
+
+        Falls back to matching the user name against the person's friendly
+        name, its entity_id slug and finally a partial name match.
+        """
+        if user is None:
+            return None
+        if user.id in self._user_index:
+            return self._user_index[user.id]
+
+        persons = self.persons
+        match = self._linked_users.get(user.id)
+        name = (user.name or "").lower()
+        if match is None and name:
+            match = (
+                next((p for p in persons if p["name"].lower() == name), None)
+                or next(
+                    (
+                        p
+                        for p in persons
+                        if p["entity_id"].split(".", 1)[1].lower() == name
+                    ),
+                    None,
+                )
+                or next(
+                    (
+                        p
+                        for p in persons
+                        if p["name"]
+                        and (name in p["name"].lower() or p["name"].lower() in name)
+                    ),
+                    None,
+                )
+            )
+
+        entity_id = match["entity_id"] if match else None
+        self._user_index[user.id] = entity_id
+        return entity_id
+
+    @callback
+    def async_as_dict(self, user: User | None) -> dict[str, Any]:
+        """Return the lookup tables as sent to the dashboard."""
+        return {
+            "version": self.version,
+            "areas": self.areas,
+            "persons": self.persons,
+            "current_person": self.async_person_for_user(user),
+        }
@@ -2,38 +2,152 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
 import logging
+from http import HTTPStatus
 from pathlib import Path
 
+from aiohttp import hdrs, web
 from homeassistant.components import frontend, panel_custom
-from homeassistant.components.http import StaticPathConfig
+from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
 
 from .const import DOMAIN, PANEL_ICON, PANEL_TITLE, PANEL_URL_PATH
 
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
 _LOGGER = logging.getLogger(__name__)
 
 PANEL_FRONTEND_URL = f"/{DOMAIN}_panel"
-PANEL_JS_URL = f"{PANEL_FRONTEND_URL}/hash-panel.js"
-PANEL_WWW_PATH = Path(__file__).parent / "www"
+PANEL_JS_FILE = "hash-panel.js"
+PANEL_JS_PATH = Path(__file__).parent / "www" / PANEL_JS_FILE
+
+# Asset URLs contain the content digest, so a given URL never changes.
+CACHE_IMMUTABLE = "public, max-age=31536000, immutable"
+CACHE_REVALIDATE = "no-cache"
+
+ENCODING_IDENTITY = "identity"
+# Preferred encodings, best first.
+ENCODING_PREFERENCE = ("br", "gzip", ENCODING_IDENTITY)
+
+DATA_PANEL_VIEW = "_panel_view"
+
+
+class PanelAsset:
+    """The panel script with its content digest and precompressed variants."""
+
+    def __init__(self, digest: str, variants: dict[str, bytes]) -> None:
+        """Initialize the asset."""
+        self.digest = digest
+        self.variants = variants
+
+    @property
+    def url(self) -> str:
+        """Return the content-addressed URL of the script."""
+        return f"{PANEL_FRONTEND_URL}/{self.digest}/{PANEL_JS_FILE}"
+
+
+def build_panel_asset(path: Path = PANEL_JS_PATH) -> PanelAsset:
+    """Read the panel script and precompress it (runs in the executor)."""
+    raw = path.read_bytes()
+    variants = {
+        ENCODING_IDENTITY: raw,
+        "gzip": gzip.compress(raw, compresslevel=9, mtime=0),
+    }
+    if brotli is not None:
+        variants["br"] = brotli.compress(raw, quality=11)
+    return PanelAsset(hashlib.sha256(raw).hexdigest()[:16], variants)
+
+
+def select_encoding(accept_encoding: str, available: dict[str, bytes]) -> str:
+    """Pick the best available content encoding allowed by Accept-Encoding."""
+    accepted: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if coding:
+            accepted[coding.lower()] = quality
+
+    wildcard = accepted.get("*", 0.0)
+    for encoding in ENCODING_PREFERENCE:
+        if encoding == ENCODING_IDENTITY:
+            break
+        if encoding in available and accepted.get(encoding, wildcard) > 0:
+            return encoding
+    return ENCODING_IDENTITY
+
+
+class HashPanelView(HomeAssistantView):
+    """Serve the panel script with long-lived cache headers."""
+
+    url = f"{PANEL_FRONTEND_URL}/{{digest}}/{PANEL_JS_FILE}"
+    name = "hash:panel"
+    requires_auth = False
+
+    def __init__(self, asset: PanelAsset) -> None:
+        """Initialize the view."""
+        self.asset = asset
+
+    async def get(self, request: web.Request, digest: str) -> web.Response:
+        """Return the panel script in the best encoding the client accepts."""
+        asset = self.asset
+        etag = f'"{asset.digest}"'
+        headers = {
+            hdrs.CACHE_CONTROL: (
+                CACHE_IMMUTABLE if digest == asset.digest else CACHE_REVALIDATE
+            ),
+            hdrs.ETAG: etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if request.headers.get(hdrs.IF_NONE_MATCH) == etag:
+            return web.Response(status=HTTPStatus.NOT_MODIFIED, headers=headers)
+
+        encoding = select_encoding(
+            request.headers.get(hdrs.ACCEPT_ENCODING, ""), asset.variants
+        )
+        if encoding != ENCODING_IDENTITY:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+        return web.Response(
+            body=asset.variants[encoding],
+            content_type="text/javascript",
+            charset="utf-8",
+            headers=headers,
+        )
 
 
 async def async_register_panel(hass: HomeAssistant) -> None:
     """Register the HASH frontend panel."""
-    await hass.http.async_register_static_paths(
-        [StaticPathConfig(PANEL_FRONTEND_URL, str(PANEL_WWW_PATH), False)]
-    )
+    asset = await hass.async_add_executor_job(build_panel_asset)
+
+    # Views cannot be removed again, so re-registration only swaps the asset.
+    view: HashPanelView | None = hass.data[DOMAIN].get(DATA_PANEL_VIEW)
+    if view is None:
+        view = HashPanelView(asset)
+        hass.http.register_view(view)
+        hass.data[DOMAIN][DATA_PANEL_VIEW] = view
+    else:
+        view.asset = asset
 
     await panel_custom.async_register_panel(
         hass,
         webcomponent_name="hash-panel",
         frontend_url_path=PANEL_URL_PATH,
-        module_url=PANEL_JS_URL,
+        module_url=asset.url,
         sidebar_title=PANEL_TITLE,
         sidebar_icon=PANEL_ICON,
         require_admin=False,
     )
-    _LOGGER.debug("HASH panel registered")
+    _LOGGER.debug("HASH panel registered at %s", asset.url)
 
 
 async def async_unregister_panel(hass: HomeAssistant) -> None:
@@ -0,0 +1,167 @@
+"""Capacity-aware schedule planner for HASH.
+
+The planner levels chore load over a horizon of a few weeks. Each occurrence
+of a chore may be shifted up to a few days past its raw due date, never onto
+a blackout day. It is put on the first preferred day (by default a Saturday)
+that still fits its assignee's daily budget. If no day fits, it goes on the
+least overloaded candidate day. Candidate days come from a per-weekday shift
+table compiled once per set of day rules, so the rules cost nothing per
+occurrence. Days blocked by another calendar are skipped as well; if every
+candidate is blocked, the occurrence moves to the first open day after.
+
+Placements are greedy and incremental: a changed chore is only re-placed
+against the load of the others, so completing one chore never moves another.
+"""
+
+from __future__ import annotations
+
+import datetime
+from dataclasses import dataclass
+from typing import Any
+
+from .blocked import BlockedDays
+from .scheduler import WEEKEND_RULES, DayRules, shift_table
+
+
+@dataclass(frozen=True, slots=True)
+class PlanItem:
+    """What the planner needs to know about a chore."""
+
+    due: datetime.date
+    interval_days: int
+    person: str
+    effort: int = 1
+    rules: DayRules = WEEKEND_RULES
+
+
+def plan_item(
+    snapshot: dict[str, Any], rules: DayRules = WEEKEND_RULES
+) -> PlanItem | None:
+    """Return the plan item of an unplanned snapshot; None if not scheduled."""
+    if not snapshot["next_due"]:
+        return None
+    return PlanItem(
+        datetime.date.fromisoformat(snapshot["next_due"]),
+        snapshot["interval_days"],
+        snapshot["assigned_to"] or "",
+        snapshot["effort"],
+        rules,
+    )
+
+
+class SchedulePlanner:
+    """Levelled multi-week chore plan."""
+
+    def __init__(
+        self, daily_budget: int, weeks: int, blocked: BlockedDays | None = None
+    ) -> None:
+        """Initialize an empty plan."""
+        self.daily_budget = daily_budget
+        self.weeks = weeks
+        self.blocked = BlockedDays() if blocked is None else blocked
+        self._blocked_version = self.blocked.version
+        self._today = datetime.date.min
+        self._items: dict[str, PlanItem] = {}
+        self._placements: dict[str, list[datetime.date]] = {}
+        # (person, day) -> effort placed on that day
+        self._load: dict[tuple[str, datetime.date], int] = {}
+
+    def dates(self, chore_id: str) -> list[datetime.date]:
+        """Return the planned dates of a chore, soonest first."""
+        return self._placements.get(chore_id, [])
+
+    def load(self, person: str, day: datetime.date) -> int:
+        """Return the effort planned for a person on a day."""
+        return self._load.get((person, day), 0)
+
+    def update(self, items: dict[str, PlanItem], today: datetime.date) -> set[str]:
+        """Bring the plan up to date with all chores.
+
+        Only new and changed chores are placed again; a new day re-plans from
+        scratch. Returns the ids whose planned dates may have changed.
+        """
+        if self._stale(today):
+            self._today = today
+            self._blocked_version = self.blocked.version
+            self._items = {}
+            self._placements = {}
+            self._load = {}
+        changed = {
+            chore_id
+            for chore_id in self._items.keys() | items.keys()
+            if self._items.get(chore_id) != items.get(chore_id)
+        }
+        for chore_id in changed:
+            self._unplace(chore_id)
+        for chore_id in sorted(changed & items.keys(), key=lambda c: (items[c].due, c)):
+            self._place(chore_id, items[chore_id])
+        return changed
+
+    def update_item(
+        self, chore_id: str, item: PlanItem | None, today: datetime.date
+    ) -> bool:
+        """Re-plan one chore; returns whether its planned dates may have changed."""
+        if self._stale(today):
+            items = {**self._items, chore_id: item}
+            if item is None:
+                del items[chore_id]
+            self.update(items, today)
+            return True
+        if self._items.get(chore_id) == item:
+            return False
+        self._unplace(chore_id)
+        if item is not None:
+            self._place(chore_id, item)
+        return True
+
+    def _stale(self, today: datetime.date) -> bool:
+        """Return whether the plan must be redone from scratch."""
+        return today != self._today or self.blocked.version != self._blocked_version
+
+    def _unplace(self, chore_id: str) -> None:
+        """Remove a chore and its load from the plan."""
+        item = self._items.pop(chore_id, None)
+        for day in self._placements.pop(chore_id, []):
+            key = (item.person, day)
+            self._load[key] -= item.effort
+            if not self._load[key]:
+                del self._load[key]
+
+    def _place(self, chore_id: str, item: PlanItem) -> None:
+        """Place the occurrences of a chore within the horizon."""
+        horizon = self._today + datetime.timedelta(weeks=self.weeks)
+        interval = datetime.timedelta(days=item.interval_days)
+        placements: list[datetime.date] = []
+        due = item.due
+        while True:
+            if due <= self._today:
+                # Overdue chores stay put; the next round counts from today.
+                day = due
+                due = self._today
+            else:
+                day = self._best_day(item, due)
+            placements.append(day)
+            self._load[(item.person, day)] = self.load(item.person, day) + item.effort
+            due += interval
+            if due >= horizon:
+                break
+        self._items[chore_id] = item
+        self._placements[chore_id] = placements
+
+    def _best_day(self, item: PlanItem, due: datetime.date) -> datetime.date:
+        """Return the day within the allowed shift to put an occurrence on."""
+        best: tuple[int, int] | None = None
+        shifts = shift_table(item.rules)[due.weekday()]
+        best_day = self.blocked.next_open(due + datetime.timedelta(days=max(shifts)))
+        # Shifts come best first, so the rank breaks ties between equal loads
+        for rank, shift in enumerate(shifts):
+            day = due + datetime.timedelta(days=shift)
+            if day in self.blocked:
+                continue
+            overflow = max(
+                0, self.load(item.person, day) + item.effort - self.daily_budget
+            )
+            key = (overflow, rank)
+            if best is None or key < best:
+                best, best_day = key, day
+        return best_day
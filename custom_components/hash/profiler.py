@@ -0,0 +1,251 @@
+"""On-demand profiling of HASH's hot paths.
+
+The hash.profile service attaches a profiler to the statistics for the next
+N coordinator refreshes and websocket commands. The timed sections check for
+it with a single attribute test, so nothing is added while no profile runs.
+cProfile is used unless another profiler holds the interpreter's hooks or a
+sampling profile is asked for; the sampler then reads the event loop
+thread's stack from a background thread while a profiled section runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+import datetime
+import os
+import pstats
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from .stats import async_get_stats
+
+# Seconds between samples of the sampling profiler
+SAMPLE_INTERVAL = 0.001
+# Functions in the returned summary
+SUMMARY_FUNCTIONS = 15
+
+PROFILER_CPROFILE = "cprofile"
+PROFILER_SAMPLING = "sampling"
+
+
+def _profiled(name: str) -> bool:
+    """Return whether a timed section counts as a profiled call."""
+    return name == "refresh" or name.startswith(f"{DOMAIN}/")
+
+
+def _label(filename: str, line: int, function: str) -> str:
+    """Return a short label for a function."""
+    return f"{os.path.basename(filename)}:{line}({function})"
+
+
+class _Sampler(threading.Thread):
+    """Samples the stack of one thread while sampling is switched on."""
+
+    def __init__(self, thread_id: int) -> None:
+        super().__init__(name="hash_profiler", daemon=True)
+        self._thread_id = thread_id
+        self.active = False
+        self._stopped = threading.Event()
+        # Seconds spent in each function itself and below it
+        self.own: Counter[tuple[str, int, str]] = Counter()
+        self.cumulative: Counter[tuple[str, int, str]] = Counter()
+
+    def run(self) -> None:
+        previous = time.perf_counter()
+        while not self._stopped.wait(SAMPLE_INTERVAL):
+            now = time.perf_counter()
+            elapsed, previous = now - previous, now
+            if not self.active:
+                continue
+            frame = sys._current_frames().get(self._thread_id)
+            if frame is None:
+                continue
+            code = frame.f_code
+            self.own[code.co_filename, code.co_firstlineno, code.co_name] += elapsed
+            seen = set()
+            while frame is not None:
+                code = frame.f_code
+                key = (code.co_filename, code.co_firstlineno, code.co_name)
+                if key not in seen:
+                    seen.add(key)
+                    self.cumulative[key] += elapsed
+                frame = frame.f_back
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self.join()
+
+
+class HashProfiler:
+    """Profiles the next N refreshes and websocket commands.
+
+    Sections nest and may overlap while awaiting; the profiler runs from the
+    first one entered until the last one open has exited.
+    """
+
+    def __init__(self, calls: int, sampling: bool = False) -> None:
+        """Initialize the profiler; call from the event loop thread."""
+        self.remaining = calls
+        self.calls: Counter[str] = Counter()
+        self.finished = asyncio.Event()
+        self.started = time.monotonic()
+        self._depth = 0
+        self._closed = False
+        self._profile: cProfile.Profile | None = None
+        self._sampler: _Sampler | None = None
+        if not sampling:
+            profile = cProfile.Profile()
+            try:
+                profile.enable()
+            except ValueError:
+                # Another profiler is active; sample instead
+                pass
+            else:
+                profile.disable()
+                self._profile = profile
+        if self._profile is None:
+            self._sampler = _Sampler(threading.get_ident())
+            self._sampler.start()
+
+    @property
+    def kind(self) -> str:
+        """Return which profiler is used."""
+        return PROFILER_CPROFILE if self._profile is not None else PROFILER_SAMPLING
+
+    def enter(self, name: str) -> bool:
+        """Start profiling a section; returns whether it is profiled."""
+        if self._depth:
+            self._depth += 1
+            return True
+        if self._closed or self.remaining <= 0 or not _profiled(name):
+            return False
+        self.remaining -= 1
+        self.calls[name] += 1
+        self._depth = 1
+        if self._profile is not None:
+            self._profile.enable()
+        elif self._sampler is not None:
+            self._sampler.active = True
+        return True
+
+    def exit(self) -> None:
+        """Stop profiling a section."""
+        self._depth -= 1
+        if self._depth:
+            return
+        self._pause()
+        if self.remaining <= 0:
+            self.finished.set()
+
+    def _pause(self) -> None:
+        if self._profile is not None:
+            self._profile.disable()
+        elif self._sampler is not None:
+            self._sampler.active = False
+
+    def close(self) -> None:
+        """Stop profiling for good, also in the middle of a section."""
+        self._closed = True
+        self._depth = 0
+        self._pause()
+        if self._sampler is not None:
+            self._sampler.stop()
+
+    def functions(self) -> list[dict[str, Any]]:
+        """Return the functions that took the most time themselves."""
+        if not self.calls:
+            return []
+        if self._profile is not None:
+            rows = [
+                (key, calls, own, cumulative)
+                for key, (_, calls, own, cumulative, _) in pstats.Stats(
+                    self._profile
+                ).stats.items()
+            ]
+        elif self._sampler is not None:
+            rows = [
+                (key, None, own, self._sampler.cumulative[key])
+                for key, own in self._sampler.own.items()
+            ]
+        else:
+            rows = []
+        rows.sort(key=lambda row: row[2], reverse=True)
+        return [
+            {
+                "function": _label(*key),
+                "calls": calls,
+                "own_ms": round(own * 1000, 3),
+                "cumulative_ms": round(cumulative * 1000, 3),
+            }
+            for key, calls, own, cumulative in rows
+        ]
+
+    @property
+    def extension(self) -> str:
+        """Return the file extension of the written profile."""
+        return "prof" if self._profile is not None else "txt"
+
+    def dump(self, path: str) -> None:
+        """Write the profile; cProfile's for pstats, else a text table."""
+        if self._profile is not None:
+            pstats.Stats(self._profile).dump_stats(path)
+            return
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(f"{'own ms':>12} {'cumulative ms':>14}  function\n")
+            for row in self.functions():
+                file.write(
+                    f"{row['own_ms']:>12.3f} {row['cumulative_ms']:>14.3f}"
+                    f"  {row['function']}\n"
+                )
+
+    def summary(self, path: str | None) -> dict[str, Any]:
+        """Return the service response for the finished profile."""
+        return {
+            "profiler": self.kind,
+            "file": path,
+            "duration": round(time.monotonic() - self.started, 3),
+            "calls": dict(self.calls),
+            "functions": self.functions()[:SUMMARY_FUNCTIONS],
+        }
+
+
+async def async_profile(
+    hass: HomeAssistant, calls: int, duration: float, sampling: bool = False
+) -> dict[str, Any]:
+    """Profile the next calls, or as many as come within duration seconds.
+
+    The profile is written to the config directory. Raises ValueError if a
+    profile is already running.
+    """
+    stats = async_get_stats(hass)
+    if stats.profiler is not None:
+        raise ValueError("a profile is already running")
+    profiler = stats.profiler = HashProfiler(calls, sampling)
+
+    @callback
+    def _async_time_up(_now: datetime.datetime) -> None:
+        profiler.finished.set()
+
+    cancel = async_call_later(hass, duration, _async_time_up)
+    try:
+        await profiler.finished.wait()
+    finally:
+        cancel()
+        stats.profiler = None
+        profiler.close()
+    path = None
+    if profiler.calls:
+        path = hass.config.path(
+            f"hash_profile_{dt_util.now():%Y%m%d_%H%M%S}.{profiler.extension}"
+        )
+        await hass.async_add_executor_job(profiler.dump, path)
+    return profiler.summary(path)
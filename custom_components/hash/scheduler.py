@@ -3,17 +3,100 @@
 from __future__ import annotations
 
 import datetime
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+from .const import (
+    CONF_BLACKOUT_DAYS,
+    CONF_MAX_SHIFT_DAYS,
+    CONF_PREFERRED_DAYS,
+    DEFAULT_MAX_SHIFT_DAYS,
+    DEFAULT_PREFERRED_DAYS,
+    WEEKDAYS,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DayRules:
+    """Which days a chore would rather land on, as weekday numbers."""
+
+    preferred: frozenset[int] = frozenset({5})
+    # How many days a chore may be pushed back to land on a preferred day
+    max_shift: int = DEFAULT_MAX_SHIFT_DAYS
+    # Days nothing is scheduled on
+    blackout: frozenset[int] = frozenset()
+
+
+# Shift to the nearest Saturday if it is at most 2 days away
+WEEKEND_RULES = DayRules()
+
+
+def day_rules(
+    settings: dict[str, Any], chore: dict[str, Any] | None = None
+) -> DayRules:
+    """Return the day rules of a chore from the household settings.
+
+    A chore's own preferred days replace the household's; the shift limit
+    and blackout days always come from the household.
+    """
+    preferred = (chore or {}).get(CONF_PREFERRED_DAYS) or settings.get(
+        CONF_PREFERRED_DAYS, DEFAULT_PREFERRED_DAYS
+    )
+    return DayRules(
+        frozenset(WEEKDAYS.index(day) for day in preferred),
+        int(settings.get(CONF_MAX_SHIFT_DAYS, DEFAULT_MAX_SHIFT_DAYS)),
+        frozenset(WEEKDAYS.index(day) for day in settings.get(CONF_BLACKOUT_DAYS, [])),
+    )
+
+
+@lru_cache(maxsize=128)
+def shift_table(rules: DayRules) -> tuple[tuple[int, ...], ...]:
+    """Compile day rules into candidate shifts for each weekday of a due date.
+
+    Entry n lists the shifts allowed for a due date on weekday n, best first:
+    preferred days before others, then the smallest shift. Blackout days are
+    left out; if the allowed shifts only reach blackout days, the entry holds
+    the shift to the next day that is not one. Raises ValueError if every
+    day is a blackout day.
+    """
+    if len(rules.blackout) >= len(WEEKDAYS):
+        raise ValueError("every day is a blackout day")
+    table = []
+    for weekday in range(len(WEEKDAYS)):
+        shifts = [
+            shift
+            for shift in range(rules.max_shift + 1)
+            if (weekday + shift) % 7 not in rules.blackout
+        ]
+        if not shifts:
+            shifts = [
+                next(
+                    shift
+                    for shift in range(rules.max_shift + 1, rules.max_shift + 8)
+                    if (weekday + shift) % 7 not in rules.blackout
+                )
+            ]
+        shifts.sort(
+            key=lambda shift: ((weekday + shift) % 7 not in rules.preferred, shift)
+        )
+        table.append(tuple(shifts))
+    return tuple(table)
 
 
 def calculate_next_due(
     last_cleaned: datetime.datetime,
     interval_days: int,
     prefer_weekends: bool = True,
+    today: datetime.date | None = None,
+    rules: DayRules = WEEKEND_RULES,
 ) -> datetime.date:
     """Calculate the next due date for a chore.
 
-    If prefer_weekends is True and the raw due date falls on a weekday,
-    shift to the nearest upcoming Saturday — but only if the shift is <= 2 days.
+    If prefer_weekends is True and the raw due date is still ahead, shift it
+    to the best day allowed by rules — by default the nearest upcoming
+    Saturday, but only if the shift is <= 2 days. today defaults to the
+    system's date; pass the local date of the current refresh instead.
     """
     raw_due = (last_cleaned + datetime.timedelta(days=interval_days)).date()
 
@@ -21,18 +104,13 @@ def calculate_next_due(
         return raw_due
 
     # If already overdue, keep original date
-    today = datetime.date.today()
+    if today is None:
+        today = datetime.date.today()
     if raw_due <= today:
         return raw_due
 
-    weekday = raw_due.weekday()  # 0=Monday ... 6=Sunday
-    if weekday < 5:  # Mon-Fri
-        # Days until Saturday (5)
-        days_to_saturday = 5 - weekday
-        if days_to_saturday <= 2:
-            return raw_due + datetime.timedelta(days=days_to_saturday)
-
-    return raw_due
+    shift = shift_table(rules)[raw_due.weekday()][0]
+    return raw_due + datetime.timedelta(days=shift)
 
 
 def get_effective_assignee(
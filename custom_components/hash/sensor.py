@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
 from homeassistant.components.sensor import (
+    SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceEntryType
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.const import EntityCategory, UnitOfInformation, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import area_registry as ar
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
+from .aggregates import (
+    GROUP_AREA,
+    GROUP_PERSON,
+    HOME_KEY,
+    AggregateStats,
+    GroupKey,
+)
 from .const import (
+    CONF_ASSIGNED_PERSON,
+    CONF_CHORES,
+    CONF_MIN_CLEANLINESS_DELTA,
+    DEFAULT_MIN_CLEANLINESS_DELTA,
     DOMAIN,
     ICON_DIRTY,
     ICON_FINE,
@@ -23,7 +40,19 @@ from .const import (
     STATUS_FINE,
     STATUS_GREAT,
 )
-from .coordinator import HashCoordinator
+from .coordinator import HashCoordinator, get_status
+from .entity import device_info
+from .metadata import async_get_metadata
+from .stats import HashStats
+
+STATUS_ICONS = {
+    STATUS_GREAT: ICON_GREAT,
+    STATUS_FINE: ICON_FINE,
+    STATUS_DIRTY: ICON_DIRTY,
+}
+
+# Snapshot keys that drift with every refresh; gated by the minimum delta.
+VOLATILE_KEYS = frozenset({"cleanliness", "days_since"})
 
 
 async def async_setup_entry(
@@ -34,18 +63,75 @@ async def async_setup_entry(
     """Set up HASH sensors from a config entry."""
     coordinator: HashCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities = [
+    entities: list[SensorEntity] = [
         HashChoreSensor(coordinator, chore_id, entry) for chore_id in coordinator.data
     ]
+
+    # Aggregates for the household, every area and every assigned person
+    area_registry = ar.async_get(hass)
+    areas: dict[str, str] = {}
+    persons: set[str] = {
+        chore[CONF_ASSIGNED_PERSON]
+        for chore in entry.options.get(CONF_CHORES, [])
+        if chore.get(CONF_ASSIGNED_PERSON)
+    }
+    for data in coordinator.data.values():
+        if data["area_id"]:
+            areas[data["area_id"]] = data["room"]
+        if data["assigned_to"]:
+            persons.add(data["assigned_to"])
+
+    entities.append(HashAggregateSensor(coordinator, entry, HOME_KEY, "Home"))
+    entities.append(HashUrgentChoresSensor(coordinator, entry, HOME_KEY, "Home"))
+    for area_id, room in sorted(areas.items()):
+        area = area_registry.async_get_area(area_id)
+        label = area.name if area else room
+        entities.append(
+            HashAggregateSensor(coordinator, entry, (GROUP_AREA, area_id), label)
+        )
+        entities.append(
+            HashUrgentChoresSensor(coordinator, entry, (GROUP_AREA, area_id), label)
+        )
+    metadata = async_get_metadata(hass)
+    for person_id in sorted(persons):
+        label = metadata.async_person_name(person_id)
+        entities.append(
+            HashAggregateSensor(coordinator, entry, (GROUP_PERSON, person_id), label)
+        )
+        entities.append(
+            HashUrgentChoresSensor(coordinator, entry, (GROUP_PERSON, person_id), label)
+        )
+    # Diagnostic sensors, disabled by default
+    entities.extend(
+        HashStatsSensor(coordinator.stats, entry, description)
+        for description in STATS_SENSORS
+    )
     async_add_entities(entities)
 
 
+def _group_suffix(key: GroupKey) -> str:
+    """Return the unique id suffix of a group's sensors."""
+    kind, member = key
+    return f"{kind}_{member.replace('.', '_')}" if member else kind
+
+
 class HashChoreSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
     """Sensor representing the cleanliness of a single chore."""
 
     _attr_has_entity_name = True
     _attr_native_unit_of_measurement = "%"
     _attr_state_class = SensorStateClass.MEASUREMENT
+    # Volatile or static attributes that only bloat the recorder
+    _unrecorded_attributes = frozenset(
+        {
+            "chore_id",
+            "days_since_cleaning",
+            "area_id",
+            "room",
+            "interval_days",
+            "interval_display",
+        }
+    )
 
     def __init__(
         self,
@@ -56,16 +142,82 @@ class HashChoreSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._chore_id = chore_id
+        # (available, change stamp) and snapshot of the last written state
+        self._written: tuple[bool, int] | None = None
+        self._written_data: dict[str, Any] | None = None
+        # Value, icon and attributes built from the snapshot _cache_data
+        self._cache: tuple[float | None, str, dict[str, Any]] | None = None
+        self._cache_data: dict[str, Any] | None = None
         self._attr_unique_id = f"{entry.entry_id}_{chore_id}"
         chore_data = coordinator.data.get(chore_id, {})
         self._attr_translation_key = "chore_cleanliness"
         self._attr_name = chore_data.get("name", chore_id)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name="HASH Cleaning Hub",
-            manufacturer="HASH",
-            model="Sweeping Hub",
-            entry_type=DeviceEntryType.SERVICE,
+        self._attr_device_info = device_info(entry)
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for changes of this chore."""
+        await super().async_added_to_hass()
+        # The platform writes the initial state right after this
+        self._written = (self.available, self.coordinator.chore_stamp(self._chore_id))
+        self._written_data = self.coordinator.data.get(self._chore_id)
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(
+                self._handle_chore_update, self._chore_id
+            )
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full refresh; only availability changes are written here.
+
+        Changed chores are written by their chore listener, so a refresh
+        leaves the sensors of unchanged chores alone.
+        """
+        if self._written is None or self._written[0] != self.available:
+            self._async_write_if_changed()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Handle a change of this chore."""
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state unless nothing significant changed since the last write."""
+        available = self.available
+        written = (available, self.coordinator.chore_stamp(self._chore_id))
+        data = self.coordinator.data.get(self._chore_id)
+        if self._written is not None and self._written[0] == available:
+            if written == self._written:
+                return
+            if (
+                data is not None
+                and self._written_data is not None
+                and not self._is_significant(self._written_data, data)
+            ):
+                return
+        self._written = written
+        self._written_data = data
+        self.async_write_ha_state()
+
+    def _is_significant(self, old: dict[str, Any], new: dict[str, Any]) -> bool:
+        """Return True if a change is worth a new state.
+
+        Cleanliness drift must reach the configured minimum delta, except
+        when it reaches zero; any other change always counts.
+        """
+        if any(
+            old.get(key) != value
+            for key, value in new.items()
+            if key not in VOLATILE_KEYS
+        ):
+            return True
+        min_delta = self.coordinator.config_entry.options.get(
+            CONF_MIN_CLEANLINESS_DELTA, DEFAULT_MIN_CLEANLINESS_DELTA
+        )
+        old_value, new_value = old["cleanliness"], new["cleanliness"]
+        return abs(new_value - old_value) >= min_delta or (
+            new_value == 0 and old_value != 0
         )
 
     @property
@@ -73,36 +225,44 @@ class HashChoreSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
         """Return True if coordinator data has this chore."""
         return super().available and self._chore_id in self.coordinator.data
 
+    def _cached(self) -> tuple[float | None, str, dict[str, Any]]:
+        """Return value, icon and attributes, rebuilt only if the chore changed.
+
+        Unchanged chores keep their snapshot object across refreshes, so the
+        snapshot identity serves as the version of the cache.
+        """
+        data = self.coordinator.data.get(self._chore_id)
+        if self._cache is None or data is not self._cache_data:
+            self._cache_data = data
+            self._cache = _build_state(data)
+        return self._cache
+
     @property
     def native_value(self) -> float | None:
         """Return cleanliness percentage."""
-        data = self.coordinator.data.get(self._chore_id)
-        if data is None:
-            return None
-        return data["cleanliness"]
+        return self._cached()[0]
 
     @property
     def icon(self) -> str:
         """Return icon based on status."""
-        data = self.coordinator.data.get(self._chore_id)
-        if data is None:
-            return ICON_GREAT
-        status = data["status"]
-        if status == STATUS_GREAT:
-            return ICON_GREAT
-        if status == STATUS_FINE:
-            return ICON_FINE
-        if status == STATUS_DIRTY:
-            return ICON_DIRTY
-        return ICON_URGENT
+        return self._cached()[1]
 
     @property
     def extra_state_attributes(self) -> dict:
         """Return extra state attributes."""
-        data = self.coordinator.data.get(self._chore_id)
-        if data is None:
-            return {}
-        return {
+        return self._cached()[2]
+
+
+def _build_state(
+    data: dict[str, Any] | None,
+) -> tuple[float | None, str, dict[str, Any]]:
+    """Build a sensor's value, icon and attributes from a chore snapshot."""
+    if data is None:
+        return None, ICON_GREAT, {}
+    return (
+        data["cleanliness"],
+        STATUS_ICONS.get(data["status"], ICON_URGENT),
+        {
             "chore_id": data["chore_id"],
             "last_cleaned": data["last_cleaned"],
             "days_since_cleaning": data["days_since"],
@@ -113,4 +273,269 @@ class HashChoreSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
             "interval_display": data["interval_display"],
             "assigned_to": data["assigned_to"],
             "next_due": data["next_due"],
+            "fine_at": data["fine_at"],
+            "dirty_at": data["dirty_at"],
+            "urgent_at": data["urgent_at"],
+            "empty_at": data["empty_at"],
+        },
+    )
+
+
+class HashAggregateSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
+    """Average cleanliness of the household, an area or a person's chores."""
+
+    _attr_has_entity_name = True
+    _attr_native_unit_of_measurement = "%"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(
+        self,
+        coordinator: HashCoordinator,
+        entry: ConfigEntry,
+        key: GroupKey,
+        label: str,
+    ) -> None:
+        """Initialize the aggregate sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        self._attr_unique_id = f"{entry.entry_id}_aggregate_{_group_suffix(key)}"
+        self._attr_name = f"{label} cleanliness"
+        self._attr_device_info = device_info(entry)
+        self._written: tuple[bool, AggregateStats] | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for single-chore updates."""
+        await super().async_added_to_hass()
+        self._written = (self.available, self._stats)
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(self._handle_chore_update)
+        )
+
+    @property
+    def _stats(self) -> AggregateStats:
+        return self.coordinator.aggregates.stats(self._key)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full refresh."""
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Handle an update of a single chore."""
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if availability or the aggregates changed."""
+        written = (self.available, self._stats)
+        if written == self._written:
+            return
+        self._written = written
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the average cleanliness."""
+        return self._stats.average
+
+    @property
+    def icon(self) -> str:
+        """Return icon based on the average status."""
+        average = self._stats.average
+        if average is None:
+            return ICON_GREAT
+        return STATUS_ICONS.get(get_status(average), ICON_URGENT)
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return extra state attributes."""
+        stats = self._stats
+        worst = self.coordinator.data.get(stats.worst_chore_id or "")
+        return {
+            "min_cleanliness": stats.minimum,
+            "overdue_chores": stats.overdue,
+            "chore_count": stats.count,
+            "worst_chore_id": stats.worst_chore_id,
+            "worst_chore": worst["name"] if worst else None,
         }
+
+
+class HashUrgentChoresSensor(CoordinatorEntity[HashCoordinator], SensorEntity):
+    """The most urgent chores of a group, soonest to reach 0% first.
+
+    The state is the name of the most urgent chore. Cleanliness is left out
+    of the attributes so the state only changes when the ranking does.
+    """
+
+    _attr_has_entity_name = True
+    _attr_icon = "mdi:sort-clock-ascending"
+
+    def __init__(
+        self,
+        coordinator: HashCoordinator,
+        entry: ConfigEntry,
+        key: GroupKey,
+        label: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._key = key
+        if key == HOME_KEY:
+            # The household sensor keeps the unique id it had before groups
+            self._attr_unique_id = f"{entry.entry_id}_urgent_chores"
+            self._attr_translation_key = "urgent_chores"
+        else:
+            self._attr_unique_id = (
+                f"{entry.entry_id}_urgent_chores_{_group_suffix(key)}"
+            )
+            self._attr_translation_key = "group_urgent_chores"
+            self._attr_translation_placeholders = {"group": label}
+        self._attr_device_info = device_info(entry)
+        self._chores: list[dict[str, Any]] = self._ranking()
+        self._written_available: bool | None = None
+
+    def _ranking(self) -> list[dict[str, Any]]:
+        """Return the current ranking without the drifting cleanliness."""
+        return [
+            {key: value for key, value in chore.items() if key != "cleanliness"}
+            for chore in self.coordinator.async_most_urgent(self._key)
+        ]
+
+    async def async_added_to_hass(self) -> None:
+        """Also listen for single-chore updates."""
+        await super().async_added_to_hass()
+        self._written_available = self.available
+        self.async_on_remove(
+            self.coordinator.async_add_chore_listener(self._handle_chore_update)
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle a full refresh."""
+        self._async_write_if_changed()
+
+    @callback
+    def _handle_chore_update(self, chore_id: str) -> None:
+        """Handle an update of a single chore."""
+        self._async_write_if_changed()
+
+    @callback
+    def _async_write_if_changed(self) -> None:
+        """Write state only if availability or the ranking changed."""
+        chores = self._ranking()
+        if chores == self._chores and self.available == self._written_available:
+            return
+        self._chores = chores
+        self._written_available = self.available
+        self.async_write_ha_state()
+
+    @property
+    def native_value(self) -> str | None:
+        """Return the name of the most urgent chore."""
+        return self._chores[0]["name"] if self._chores else None
+
+    @property
+    def extra_state_attributes(self) -> dict:
+        """Return the ranked chores."""
+        return {"chores": self._chores}
+
+
+@dataclass(frozen=True, kw_only=True)
+class HashStatsSensorDescription(SensorEntityDescription):
+    """Describes a diagnostic sensor read from the statistics."""
+
+    value_fn: Callable[[HashStats], float | None]
+
+
+STATS_SENSORS: tuple[HashStatsSensorDescription, ...] = (
+    HashStatsSensorDescription(
+        key="last_refresh_duration",
+        name="Last refresh duration",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        value_fn=lambda stats: stats.last("refresh"),
+    ),
+    HashStatsSensorDescription(
+        key="chores_updated_per_refresh",
+        name="Chores updated per refresh",
+        icon="mdi:refresh",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.gauges.get("refresh_changed"),
+    ),
+    HashStatsSensorDescription(
+        key="store_size",
+        name="Store size",
+        icon="mdi:database",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.gauges.get("store_bytes"),
+    ),
+    HashStatsSensorDescription(
+        key="history_events",
+        name="History events",
+        icon="mdi:history",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.gauges.get("history_events"),
+    ),
+    HashStatsSensorDescription(
+        key="unsaved_changes",
+        name="Unsaved changes",
+        icon="mdi:content-save-alert-outline",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.gauges.get("unsaved_changes"),
+    ),
+    HashStatsSensorDescription(
+        key="websocket_subscribers",
+        name="Websocket subscribers",
+        icon="mdi:lan-connect",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda stats: stats.gauges.get("subscribers", 0),
+    ),
+)
+
+
+class HashStatsSensor(SensorEntity):
+    """A diagnostic sensor showing what HASH itself costs.
+
+    Values come straight from the statistics the hot paths already keep, and
+    the state is only written when a gauge is set and the value changed.
+    """
+
+    entity_description: HashStatsSensorDescription
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self,
+        stats: HashStats,
+        entry: ConfigEntry,
+        description: HashStatsSensorDescription,
+    ) -> None:
+        """Initialize the sensor."""
+        self.entity_description = description
+        self._stats = stats
+        self._attr_unique_id = f"{entry.entry_id}_stats_{description.key}"
+        self._attr_device_info = device_info(entry)
+        self._attr_native_value = description.value_fn(stats)
+
+    async def async_added_to_hass(self) -> None:
+        """Listen for gauges being set."""
+        await super().async_added_to_hass()
+        self._attr_native_value = self.entity_description.value_fn(self._stats)
+        self.async_on_remove(self._stats.async_add_listener(self._handle_stats))
+
+    @callback
+    def _handle_stats(self) -> None:
+        """Write the state if the value changed."""
+        value = self.entity_description.value_fn(self._stats)
+        if value == self._attr_native_value:
+            return
+        self._attr_native_value = value
+        self.async_write_ha_state()
@@ -0,0 +1,435 @@
+"""Discrete-event household simulator for HASH.
+
+Fast-forwards a virtual clock over months of completions, vacations and
+assignments without Home Assistant timers or storage. Time only advances
+from one queued event to the next: a chore coming due, or a vacation
+starting or ending. A year of a 500-chore household is a few thousand
+events instead of 500 chores times 365 days.
+
+Persons complete a chore when it comes due, as long as it fits their daily
+budget; otherwise it slips to the next day. Chores whose assignee is away
+with nobody to cover wait until someone returns. Between completions,
+cleanliness follows the same decay curves as the sensors, which are
+integrated per cycle in closed form for the time-weighted results.
+
+Also runnable offline on a file written by hash.export:
+
+    python -m custom_components.hash.simulator export.ndjson --person person.alice
+"""
+
+from __future__ import annotations
+
+import argparse
+import datetime
+import heapq
+import json
+import math
+import sys
+from collections import deque
+from collections.abc import Iterable
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+from .assignment import ChoreShare, FairShareAssigner
+from .const import (
+    ASSIGNMENT_FAIR_SHARE,
+    ASSIGNMENT_ROTATION,
+    CONF_ASSIGNED_PERSON,
+    CONF_ASSIGNMENT_MODE,
+    CONF_CHORE_ID,
+    CONF_CHORES,
+    CONF_DAILY_BUDGET,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
+    CONF_EFFORT,
+    CONF_INTERVAL,
+    DEFAULT_DAILY_BUDGET,
+    DEFAULT_EFFORT,
+    FAIR_SHARE_HISTORY_DAYS,
+    STATUS_DIRTY,
+    STATUS_FINE,
+    STATUS_GREAT,
+    STATUS_URGENT,
+    THRESHOLD_DIRTY,
+    THRESHOLD_FINE,
+    THRESHOLD_GREAT,
+)
+from .coordinator import HashCoordinator
+from .decay import DecayCurve, decay_curve
+from .scheduler import get_effective_assignee
+from .transfer import ImportBuilder, format_for_path
+
+# Event kinds; the order breaks ties so vacations change before chores run
+_VACATION_END = 0
+_VACATION_START = 1
+_DUE = 2
+
+# Threshold each status begins below; Great holds from the start
+_STATUS_THRESHOLDS = (
+    (STATUS_GREAT, None),
+    (STATUS_FINE, THRESHOLD_GREAT),
+    (STATUS_DIRTY, THRESHOLD_FINE),
+    (STATUS_URGENT, THRESHOLD_DIRTY),
+)
+
+
+def _percentile(values: list[float], fraction: float) -> float | None:
+    """Return a nearest-rank percentile of sorted values."""
+    if not values:
+        return None
+    index = max(0, math.ceil(fraction * len(values)) - 1)
+    return values[index]
+
+
+def _round(value: float | None) -> float | None:
+    """Round a day count for the result."""
+    return None if value is None else round(value, 1)
+
+
+class _Cycles:
+    """Time-weighted cleanliness and status totals over decay cycles."""
+
+    def __init__(self) -> None:
+        self.area = 0.0
+        self.time = 0.0
+        self.status = dict.fromkeys([status for status, _ in _STATUS_THRESHOLDS], 0.0)
+
+    def add(
+        self, curve: DecayCurve, length: float, interval: float, offset: float = 0.0
+    ) -> None:
+        """Add the part of a cycle from offset to length days after cleaning."""
+        if length <= offset:
+            return
+        self.time += length - offset
+        self.area += interval * curve.area(offset / interval, length / interval)
+        starts = [
+            0.0 if threshold is None else curve.crossing(threshold) * interval
+            for _, threshold in _STATUS_THRESHOLDS
+        ]
+        for (status, _), start, end in zip(
+            _STATUS_THRESHOLDS, starts, [*starts[1:], math.inf], strict=True
+        ):
+            low = max(start, offset)
+            high = min(end, length)
+            if high > low:
+                self.status[status] += high - low
+
+
+def simulate(
+    chores: list[dict[str, Any]],
+    persons: list[str],
+    start: datetime.datetime,
+    days: int = 365,
+    last_cleaned: dict[str, datetime.datetime] | None = None,
+    vacations: Iterable[tuple[str, datetime.datetime, datetime.datetime]] = (),
+    daily_budget: int = DEFAULT_DAILY_BUDGET,
+    assignment_mode: str = ASSIGNMENT_ROTATION,
+    rotation_index: dict[str, int] | None = None,
+) -> dict[str, Any]:
+    """Simulate a household from start for a number of days.
+
+    chores are chore configs as stored in the options. Chores without a
+    last_cleaned time start out due, like new chores do. vacations are
+    (person, start, end) tuples. Returns per-person load and overdue days,
+    and the cleanliness distribution over the simulated period.
+    """
+    last_cleaned = last_cleaned or {}
+    rotation_index = rotation_index or {}
+    fair_share = assignment_mode == ASSIGNMENT_FAIR_SHARE
+
+    def offset(moment: datetime.datetime) -> float:
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=datetime.UTC)
+        return (moment - start).total_seconds() / 86400
+
+    configs = {chore[CONF_CHORE_ID]: chore for chore in chores}
+    runtime = {
+        chore_id: {"rotation_index": rotation_index.get(chore_id, 0)}
+        for chore_id in configs
+    }
+    interval = {chore_id: chore[CONF_INTERVAL] for chore_id, chore in configs.items()}
+    effort = {
+        chore_id: chore.get(CONF_EFFORT, DEFAULT_EFFORT)
+        for chore_id, chore in configs.items()
+    }
+    curves = {
+        chore_id: decay_curve(chore.get(CONF_DECAY), chore.get(CONF_DECAY_POINTS))
+        for chore_id, chore in configs.items()
+    }
+    # Last cleaned, in days relative to start
+    last = {
+        chore_id: offset(last_cleaned[chore_id])
+        if chore_id in last_cleaned
+        else -interval[chore_id]
+        for chore_id in configs
+    }
+
+    queue: list[tuple[float, int, int, str]] = []
+    seq = 0
+
+    def push(at: float, kind: int, key: str) -> None:
+        nonlocal seq
+        seq += 1
+        heapq.heappush(queue, (at, kind, seq, key))
+
+    for chore_id in configs:
+        push(max(0.0, last[chore_id] + interval[chore_id]), _DUE, chore_id)
+    away: dict[str, int] = {}
+    for index, (person, begin, end) in enumerate(vacations):
+        key = f"{index}:{person}"
+        push(max(0.0, offset(begin)), _VACATION_START, key)
+        push(offset(end), _VACATION_END, key)
+
+    # Completed effort in the fair-share window, per person
+    recent: dict[str, deque[tuple[float, int]]] = {p: deque() for p in persons}
+    recent_total = dict.fromkeys(persons, 0)
+
+    def credit(now: float) -> dict[str, float]:
+        for person, entries in recent.items():
+            while entries and entries[0][0] < now - FAIR_SHARE_HISTORY_DAYS:
+                recent_total[person] -= entries.popleft()[1]
+        return dict(recent_total)
+
+    def vacation_list() -> list[str]:
+        return [person for person, count in away.items() if count]
+
+    def share(chore_id: str) -> ChoreShare:
+        pinned = configs[chore_id].get(CONF_ASSIGNED_PERSON) or ""
+        return ChoreShare(effort[chore_id], "" if away.get(pinned) else pinned)
+
+    assigner = FairShareAssigner()
+
+    def refresh_assigner(now: float) -> None:
+        # Only chores held by someone who left or pinned to someone who
+        # came back are placed again
+        assigner.update(
+            {chore_id: share(chore_id) for chore_id in configs},
+            [person for person in persons if not away.get(person)],
+            lambda: credit(now),
+        )
+
+    if fair_share:
+        refresh_assigner(0.0)
+
+    used: dict[tuple[str, int], int] = {}
+    waiting: list[str] = []
+    cycles = _Cycles()
+    lateness: list[float] = []
+    person_stats = {
+        person: {"completions": 0, "effort": 0, "overdue_days": 0.0}
+        for person in persons
+    }
+    overdue_days = 0.0
+    completions = 0
+    events = 0
+
+    while queue and queue[0][0] < days:
+        now, kind, _, key = heapq.heappop(queue)
+        events += 1
+        if kind != _DUE:
+            person = key.split(":", 1)[1]
+            away[person] = away.get(person, 0) + (1 if kind == _VACATION_START else -1)
+            if fair_share:
+                refresh_assigner(now)
+            if kind == _VACATION_END:
+                for chore_id in waiting:
+                    push(now, _DUE, chore_id)
+                waiting.clear()
+            continue
+
+        chore_id = key
+        if fair_share:
+            person = assigner.assignee(chore_id)
+        else:
+            person = get_effective_assignee(
+                configs[chore_id], runtime[chore_id], persons, vacation_list()
+            )
+        if person is None or away.get(person):
+            waiting.append(chore_id)
+            continue
+        day = math.floor(now)
+        load = used.get((person, day), 0)
+        # A chore bigger than the budget still gets done on an empty day
+        if load and load + effort[chore_id] > daily_budget:
+            push(day + 1.0, _DUE, chore_id)
+            continue
+        used[(person, day)] = load + effort[chore_id]
+
+        elapsed = now - last[chore_id]
+        cycles.add(
+            curves[chore_id], elapsed, interval[chore_id], max(0.0, -last[chore_id])
+        )
+        late = max(0.0, now - max(0.0, last[chore_id] + interval[chore_id]))
+        overdue_days += late
+        lateness.append(late)
+        completions += 1
+        stats = person_stats.setdefault(
+            person, {"completions": 0, "effort": 0, "overdue_days": 0.0}
+        )
+        stats["completions"] += 1
+        stats["effort"] += effort[chore_id]
+        stats["overdue_days"] += late
+        if person in recent:
+            recent[person].append((now, effort[chore_id]))
+            recent_total[person] += effort[chore_id]
+
+        last[chore_id] = now
+        runtime[chore_id]["rotation_index"] += 1
+        if fair_share:
+            assigner.place(chore_id, share(chore_id), credit(now))
+        push(now + interval[chore_id], _DUE, chore_id)
+
+    # Close the cycles still open at the end
+    for chore_id in configs:
+        elapsed = days - last[chore_id]
+        cycles.add(
+            curves[chore_id], elapsed, interval[chore_id], max(0.0, -last[chore_id])
+        )
+        overdue_days += max(0.0, days - max(0.0, last[chore_id] + interval[chore_id]))
+
+    lateness.sort()
+    return {
+        "days": days,
+        "chores": len(configs),
+        "events": events,
+        "completions": completions,
+        "overdue_days": round(overdue_days, 1),
+        "persons": {
+            person: {**stats, "overdue_days": round(stats["overdue_days"], 1)}
+            for person, stats in person_stats.items()
+        },
+        "lateness_days": {
+            "p50": _round(_percentile(lateness, 0.5)),
+            "p90": _round(_percentile(lateness, 0.9)),
+            "max": _round(lateness[-1] if lateness else None),
+        },
+        # Time-weighted over all chores
+        "cleanliness": {
+            "mean": round(cycles.area / cycles.time, 1) if cycles.time else None,
+            "status_share": {
+                status: round(total / cycles.time, 3) if cycles.time else 0.0
+                for status, total in cycles.status.items()
+            },
+        },
+    }
+
+
+async def async_simulate(
+    coordinator: HashCoordinator,
+    days: int,
+    persons: list[str] | None = None,
+    vacations: Iterable[tuple[str, datetime.datetime, datetime.datetime]] = (),
+    intervals: dict[str, int] | None = None,
+    daily_budget: int | None = None,
+    assignment_mode: str | None = None,
+) -> dict[str, Any]:
+    """Simulate the configured household, optionally with changes.
+
+    Starts from the current chores, their runtime state and the scheduled
+    vacations, to which vacations adds more. persons replaces the
+    household's persons, intervals overrides chore intervals by id, and
+    daily_budget and assignment_mode override the settings. Runs in the
+    executor.
+    """
+    hass = coordinator.hass
+    options = coordinator.config_entry.options
+    intervals = intervals or {}
+    chores = [
+        {
+            **chore,
+            CONF_INTERVAL: intervals.get(chore[CONF_CHORE_ID], chore[CONF_INTERVAL]),
+        }
+        for chore in options.get(CONF_CHORES, [])
+    ]
+    runtime = coordinator.runtime_data
+    states = {
+        chore[CONF_CHORE_ID]: runtime[chore[CONF_CHORE_ID]]
+        for chore in chores
+        if chore[CONF_CHORE_ID] in runtime
+    }
+    if persons is None:
+        persons = [state.entity_id for state in hass.states.async_all("person")]
+    return await hass.async_add_executor_job(
+        partial(
+            simulate,
+            chores,
+            persons,
+            start=dt_util.utcnow(),
+            days=days,
+            last_cleaned={
+                chore_id: datetime.datetime.fromisoformat(state["last_cleaned"])
+                for chore_id, state in states.items()
+            },
+            vacations=[
+                *(
+                    (vacation.person, vacation.start, vacation.end)
+                    for vacation in coordinator.vacations
+                ),
+                *vacations,
+            ],
+            daily_budget=daily_budget
+            or options.get(CONF_DAILY_BUDGET, DEFAULT_DAILY_BUDGET),
+            assignment_mode=assignment_mode
+            or options.get(CONF_ASSIGNMENT_MODE, ASSIGNMENT_ROTATION),
+            rotation_index={
+                chore_id: state.get("rotation_index", 0)
+                for chore_id, state in states.items()
+            },
+        )
+    )
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Simulate the household in a hash.export file and print the result."""
+    parser = argparse.ArgumentParser(
+        description="Simulate a HASH household from an export file."
+    )
+    parser.add_argument("export", type=Path, help="NDJSON or CSV export file")
+    parser.add_argument(
+        "--person", action="append", default=[], dest="persons", help="person entity"
+    )
+    parser.add_argument("--days", type=int, default=365)
+    parser.add_argument("--daily-budget", type=int, default=DEFAULT_DAILY_BUDGET)
+    parser.add_argument(
+        "--assignment-mode",
+        choices=(ASSIGNMENT_ROTATION, ASSIGNMENT_FAIR_SHARE),
+        default=ASSIGNMENT_ROTATION,
+    )
+    args = parser.parse_args(argv)
+
+    builder = ImportBuilder(format_for_path(str(args.export), None))
+    with args.export.open(encoding="utf-8") as file:
+        for line in file:
+            builder.feed_line(line)
+    builder.finish(())
+    if builder.errors:
+        raise SystemExit("\n".join(builder.errors))
+
+    states = {
+        chore_id: runtime
+        for chore_id, runtime in builder.runtime.items()
+        if "last_cleaned" in runtime
+    }
+    result = simulate(
+        list(builder.chores.values()),
+        args.persons,
+        start=datetime.datetime.now(datetime.UTC),
+        days=args.days,
+        last_cleaned={
+            chore_id: datetime.datetime.fromisoformat(runtime["last_cleaned"])
+            for chore_id, runtime in states.items()
+        },
+        daily_budget=args.daily_budget,
+        assignment_mode=args.assignment_mode,
+        rotation_index={
+            chore_id: runtime["rotation_index"] for chore_id, runtime in states.items()
+        },
+    )
+    sys.stdout.write(json.dumps(result, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
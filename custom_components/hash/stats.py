@@ -0,0 +1,162 @@
+"""Timing and counter statistics for HASH.
+
+Hot paths record their durations with the monotonic performance counter into
+a fixed-bucket histogram and a fixed-size ring buffer of recent samples, so
+recording is O(1) and memory stays bounded however long HASH runs. Gauges
+hold the current value of a quantity and tell their listeners when they are
+set. The statistics are shared by all entries and shown in the diagnostics
+download, by the hash/debug/stats websocket command and by the diagnostic
+sensors.
+"""
+
+from __future__ import annotations
+
+import bisect
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from .profiler import HashProfiler
+
+DATA_STATS = "_stats"
+
+# Upper bounds of the histogram buckets in milliseconds; one more bucket
+# counts everything slower
+BUCKETS_MS = (0.1, 0.5, 1, 5, 10, 50, 100, 500, 1000)
+# Recent samples kept per operation for percentiles
+SAMPLES = 256
+
+
+class Timing:
+    """Histogram and recent samples of one operation's durations."""
+
+    __slots__ = ("buckets", "count", "max", "samples", "total")
+
+    def __init__(self) -> None:
+        """Initialize without samples."""
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+        self.samples: deque[float] = deque(maxlen=SAMPLES)
+
+    def add(self, milliseconds: float) -> None:
+        """Record one duration."""
+        self.count += 1
+        self.total += milliseconds
+        self.max = max(self.max, milliseconds)
+        self.buckets[bisect.bisect_left(BUCKETS_MS, milliseconds)] += 1
+        self.samples.append(milliseconds)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the totals, recent percentiles and histogram in ms."""
+        recent = sorted(self.samples)
+        return {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else None,
+            "max": round(self.max, 3),
+            **{
+                f"p{percent}": round(
+                    recent[min(len(recent) - 1, len(recent) * percent // 100)], 3
+                )
+                if recent
+                else None
+                for percent in (50, 95, 99)
+            },
+            "histogram": {
+                **{
+                    f"<={bound}": count
+                    for bound, count in zip(BUCKETS_MS, self.buckets, strict=False)
+                },
+                f">{BUCKETS_MS[-1]}": self.buckets[-1],
+            },
+        }
+
+
+class HashStats:
+    """Durations of the hot paths and counters of what they did."""
+
+    def __init__(self) -> None:
+        """Initialize empty statistics."""
+        self.started = time.monotonic()
+        self.timings: dict[str, Timing] = {}
+        self.counters: Counter[str] = Counter()
+        self.gauges: dict[str, float] = {}
+        self._listeners: list[Callable[[], None]] = []
+        # Set by hash.profile while it runs
+        self.profiler: HashProfiler | None = None
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record a duration of an operation."""
+        timing = self.timings.get(name)
+        if timing is None:
+            timing = self.timings[name] = Timing()
+        timing.add(seconds * 1000)
+
+    @contextmanager
+    def timed(self, name: str) -> Iterator[None]:
+        """Record the duration of the block, also when it raises."""
+        profiler = self.profiler
+        profiled = profiler is not None and profiler.enter(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+            if profiled:
+                profiler.exit()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Add to a counter."""
+        self.counters[name] += amount
+
+    def last(self, name: str) -> float | None:
+        """Return the latest duration of an operation in ms."""
+        timing = self.timings.get(name)
+        return timing.samples[-1] if timing else None
+
+    @callback
+    def gauge(self, name: str, value: float) -> None:
+        """Set a gauge and tell the listeners."""
+        self.gauges[name] = value
+        for listener in tuple(self._listeners):
+            listener()
+
+    @callback
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Listen for gauges being set; returns a function to stop."""
+        self._listeners.append(listener)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(listener)
+
+        return remove_listener
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics in a JSON serializable form."""
+        return {
+            "uptime": round(time.monotonic() - self.started),
+            "counters": dict(sorted(self.counters.items())),
+            "gauges": dict(sorted(self.gauges.items())),
+            "timings_ms": {
+                name: timing.as_dict() for name, timing in sorted(self.timings.items())
+            },
+        }
+
+
+@callback
+def async_get_stats(hass: HomeAssistant) -> HashStats:
+    """Return the shared statistics, creating them on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    stats: HashStats | None = domain_data.get(DATA_STATS)
+    if stats is None:
+        stats = domain_data[DATA_STATS] = HashStats()
+    return stats
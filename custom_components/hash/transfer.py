@@ -0,0 +1,566 @@
+"""Streaming import/export of chores and runtime state for HASH.
+
+Exports are produced record by record (one chore, state or history entry per
+line) so the full document is never built in memory. Imports are validated
+line by line and only committed once every record is known to be valid.
+"""
+
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any
+
+import voluptuous as vol
+from aiohttp import hdrs, web
+from homeassistant.components.http import KEY_HASS, HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import Unauthorized
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    CONF_ASSIGNED_PERSON,
+    CONF_CHORE_ID,
+    CONF_CHORE_NAME,
+    CONF_CHORES,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
+    CONF_EFFORT,
+    CONF_INTERVAL,
+    CONF_PREFERRED_DAYS,
+    CONF_ROOM,
+    DECAY_LABELS,
+    DECAY_LINEAR,
+    DEFAULT_EFFORT,
+    WEEKDAYS,
+)
+from .coordinator import HashCoordinator, async_get_coordinator
+from .decay import parse_points
+
+FORMAT_NDJSON = "ndjson"
+FORMAT_CSV = "csv"
+FORMATS = (FORMAT_NDJSON, FORMAT_CSV)
+
+CONTENT_TYPES = {FORMAT_NDJSON: "application/x-ndjson", FORMAT_CSV: "text/csv"}
+
+# Directory below the configuration directory that holds export files
+TRANSFER_DIR = "hash"
+
+MODE_MERGE = "merge"
+MODE_REPLACE = "replace"
+MODES = (MODE_MERGE, MODE_REPLACE)
+
+RECORD_CHORE = "chore"
+RECORD_STATE = "state"
+RECORD_HISTORY = "history"
+
+CSV_FIELDS = (
+    "type",
+    CONF_CHORE_ID,
+    CONF_CHORE_NAME,
+    CONF_ROOM,
+    CONF_INTERVAL,
+    CONF_ASSIGNED_PERSON,
+    CONF_EFFORT,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
+    CONF_PREFERRED_DAYS,
+    "last_cleaned",
+    "rotation_index",
+    "person",
+    "timestamp",
+)
+
+# Size of the chunks written to HTTP responses and files.
+CHUNK_SIZE = 64 * 1024
+# Stop collecting validation errors after this many.
+MAX_ERRORS = 20
+
+
+def _timestamp(value: Any) -> str:
+    """Validate an ISO 8601 timestamp and normalize it to UTC."""
+    parsed = dt_util.parse_datetime(str(value))
+    if parsed is None:
+        raise vol.Invalid(f"invalid timestamp: {value!r}")
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=dt_util.UTC)
+    return dt_util.as_utc(parsed).isoformat()
+
+
+def _decay_points(value: Any) -> str:
+    """Validate the points of a piecewise decay curve."""
+    text = str(value or "").strip()
+    if text:
+        try:
+            parse_points(text)
+        except ValueError as err:
+            raise vol.Invalid(str(err)) from err
+    return text
+
+
+def _weekdays(value: Any) -> list[str]:
+    """Validate comma-separated weekdays such as "tue,sat"."""
+    days = [day.strip().lower() for day in str(value or "").split(",")]
+    days = [day for day in days if day]
+    for day in days:
+        if day not in WEEKDAYS:
+            raise vol.Invalid(f"invalid weekday: {day!r}")
+    return days
+
+
+_NON_EMPTY = vol.All(str, vol.Length(min=1))
+
+RECORD_SCHEMAS: dict[str, vol.Schema] = {
+    RECORD_CHORE: vol.Schema(
+        {
+            vol.Required("type"): RECORD_CHORE,
+            vol.Required(CONF_CHORE_ID): _NON_EMPTY,
+            vol.Required(CONF_CHORE_NAME): _NON_EMPTY,
+            vol.Optional(CONF_ROOM, default=""): vol.Any(None, str),
+            vol.Required(CONF_INTERVAL): vol.All(vol.Coerce(int), vol.Range(min=1)),
+            vol.Optional(CONF_ASSIGNED_PERSON, default=""): vol.Any(None, str),
+            vol.Optional(CONF_EFFORT, default=DEFAULT_EFFORT): vol.All(
+                vol.Coerce(int), vol.Range(min=1)
+            ),
+            vol.Optional(CONF_DECAY, default=DECAY_LINEAR): vol.Any(
+                None, "", vol.In(DECAY_LABELS)
+            ),
+            vol.Optional(CONF_DECAY_POINTS, default=""): _decay_points,
+            vol.Optional(CONF_PREFERRED_DAYS, default=""): _weekdays,
+        },
+        extra=vol.REMOVE_EXTRA,
+    ),
+    RECORD_STATE: vol.Schema(
+        {
+            vol.Required("type"): RECORD_STATE,
+            vol.Required(CONF_CHORE_ID): _NON_EMPTY,
+            vol.Required("last_cleaned"): _timestamp,
+            vol.Optional("rotation_index", default=0): vol.All(
+                vol.Coerce(int), vol.Range(min=0)
+            ),
+        },
+        extra=vol.REMOVE_EXTRA,
+    ),
+    RECORD_HISTORY: vol.Schema(
+        {
+            vol.Required("type"): RECORD_HISTORY,
+            vol.Required(CONF_CHORE_ID): _NON_EMPTY,
+            vol.Required("person"): _NON_EMPTY,
+            vol.Required("timestamp"): _timestamp,
+        },
+        extra=vol.REMOVE_EXTRA,
+    ),
+}
+
+
+def iter_records(
+    chores: list[dict[str, Any]],
+    runtime_data: dict[str, dict[str, Any]],
+    include_history: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yield export records for every chore, its state and optionally history."""
+    for chore in chores:
+        chore_id = chore[CONF_CHORE_ID]
+        yield {
+            "type": RECORD_CHORE,
+            CONF_CHORE_ID: chore_id,
+            CONF_CHORE_NAME: chore[CONF_CHORE_NAME],
+            CONF_ROOM: chore.get(CONF_ROOM, ""),
+            CONF_INTERVAL: chore[CONF_INTERVAL],
+            CONF_ASSIGNED_PERSON: chore.get(CONF_ASSIGNED_PERSON, ""),
+            CONF_EFFORT: chore.get(CONF_EFFORT, DEFAULT_EFFORT),
+            CONF_DECAY: chore.get(CONF_DECAY, DECAY_LINEAR),
+            CONF_DECAY_POINTS: chore.get(CONF_DECAY_POINTS, ""),
+            CONF_PREFERRED_DAYS: ",".join(chore.get(CONF_PREFERRED_DAYS, [])),
+        }
+        runtime = runtime_data.get(chore_id)
+        if runtime is None:
+            continue
+        yield {
+            "type": RECORD_STATE,
+            CONF_CHORE_ID: chore_id,
+            "last_cleaned": runtime["last_cleaned"],
+            "rotation_index": runtime.get("rotation_index", 0),
+        }
+        if include_history:
+            for entry in runtime.get("completed_by_history", []):
+                yield {
+                    "type": RECORD_HISTORY,
+                    CONF_CHORE_ID: chore_id,
+                    "person": entry["person"],
+                    "timestamp": entry["timestamp"],
+                }
+
+
+def iter_lines(records: Iterable[dict[str, Any]], fmt: str) -> Iterator[str]:
+    """Encode records as NDJSON or CSV lines."""
+    if fmt == FORMAT_NDJSON:
+        for record in records:
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+        return
+
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=CSV_FIELDS, lineterminator="\n")
+    writer.writeheader()
+    for record in records:
+        writer.writerow(record)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def iter_chunks(lines: Iterable[str], size: int = CHUNK_SIZE) -> Iterator[str]:
+    """Group lines into chunks of roughly the given size."""
+    parts: list[str] = []
+    length = 0
+    for line in lines:
+        parts.append(line)
+        length += len(line)
+        if length >= size:
+            yield "".join(parts)
+            parts.clear()
+            length = 0
+    if parts:
+        yield "".join(parts)
+
+
+class CsvLineDecoder:
+    """Turn a stream of text lines into CSV rows, one line at a time.
+
+    Quoted fields may span several lines; a row is complete once its quotes
+    are balanced. The first row is the header.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._pending = ""
+        self._header: list[str] | None = None
+
+    def feed(self, line: str) -> dict[str, Any] | None:
+        """Feed one line and return a row once a full record is available."""
+        self._pending += line
+        if self._pending.count('"') % 2:
+            return None
+        text, self._pending = self._pending, ""
+        if not text.strip():
+            return None
+        values = next(csv.reader([text]))
+        if self._header is None:
+            self._header = values
+            return None
+        return {
+            key: value
+            for key, value in zip(self._header, values, strict=False)
+            if value != ""
+        }
+
+
+class ImportBuilder:
+    """Validate import records incrementally and collect the resulting state."""
+
+    def __init__(self, fmt: str) -> None:
+        """Initialize the builder."""
+        self.fmt = fmt
+        self.chores: dict[str, dict[str, Any]] = {}
+        self.runtime: dict[str, dict[str, Any]] = {}
+        self.errors: list[str] = []
+        self.counts = {RECORD_CHORE: 0, RECORD_STATE: 0, RECORD_HISTORY: 0}
+        self._line = 0
+        self._csv = CsvLineDecoder() if fmt == FORMAT_CSV else None
+
+    def feed_line(self, line: str) -> None:
+        """Parse and validate one line of input."""
+        self._line += 1
+        if len(self.errors) >= MAX_ERRORS:
+            return
+        if self._csv is not None:
+            raw = self._csv.feed(line)
+            if raw is None:
+                return
+        else:
+            if not line.strip():
+                return
+            try:
+                raw = json.loads(line)
+            except ValueError as err:
+                self._error(f"invalid JSON: {err}")
+                return
+        self.add_record(raw)
+
+    def feed_bytes(self, line: bytes) -> None:
+        """Decode and validate one line of UTF-8 input."""
+        try:
+            text = line.decode("utf-8")
+        except UnicodeDecodeError as err:
+            self._line += 1
+            if len(self.errors) < MAX_ERRORS:
+                self._error(f"invalid UTF-8: {err.reason}")
+            return
+        self.feed_line(text)
+
+    def add_record(self, raw: Any) -> None:
+        """Validate one decoded record."""
+        record_type = raw.get("type") if isinstance(raw, dict) else None
+        schema = (
+            RECORD_SCHEMAS.get(record_type) if isinstance(record_type, str) else None
+        )
+        if schema is None:
+            self._error(f"unknown record type {record_type!r}")
+            return
+        try:
+            record = schema(raw)
+        except vol.Invalid as err:
+            self._error(str(err))
+            return
+
+        chore_id = record[CONF_CHORE_ID]
+        if record_type == RECORD_CHORE:
+            if chore_id in self.chores:
+                self._error(f"duplicate chore_id {chore_id!r}")
+                return
+            self.chores[chore_id] = {
+                CONF_CHORE_ID: chore_id,
+                CONF_CHORE_NAME: record[CONF_CHORE_NAME],
+                CONF_ROOM: record[CONF_ROOM] or "",
+                CONF_INTERVAL: record[CONF_INTERVAL],
+                CONF_ASSIGNED_PERSON: record[CONF_ASSIGNED_PERSON] or "",
+                CONF_EFFORT: record[CONF_EFFORT],
+                CONF_DECAY: record[CONF_DECAY] or DECAY_LINEAR,
+                CONF_DECAY_POINTS: record[CONF_DECAY_POINTS],
+                CONF_PREFERRED_DAYS: record[CONF_PREFERRED_DAYS],
+            }
+        elif record_type == RECORD_STATE:
+            runtime = self.runtime.setdefault(chore_id, {"completed_by_history": []})
+            runtime["last_cleaned"] = record["last_cleaned"]
+            runtime["rotation_index"] = record["rotation_index"]
+        else:
+            runtime = self.runtime.setdefault(chore_id, {"completed_by_history": []})
+            runtime["completed_by_history"].append(
+                {"person": record["person"], "timestamp": record["timestamp"]}
+            )
+        self.counts[record_type] += 1
+
+    def finish(self, existing_ids: Iterable[str]) -> None:
+        """Check references between records once all input was read."""
+        known = set(self.chores) | set(existing_ids)
+        for chore_id in self.runtime:
+            if chore_id not in known:
+                self.errors.append(f"state/history for unknown chore {chore_id!r}")
+
+    def _error(self, message: str) -> None:
+        self.errors.append(f"line {self._line}: {message}")
+
+
+def _resolve_path(hass: HomeAssistant, path: str) -> Path:
+    """Resolve a path relative to the transfer directory, refusing to leave it.
+
+    Only NDJSON and CSV files are allowed.
+    """
+    transfer_dir = Path(hass.config.path(TRANSFER_DIR)).resolve()
+    resolved = (transfer_dir / path).resolve()
+    if not resolved.is_relative_to(transfer_dir):
+        raise ValueError(f"{path} is outside the {TRANSFER_DIR} directory")
+    if resolved.suffix.lower().lstrip(".") not in FORMATS:
+        raise ValueError(f"{path} is not an .ndjson or .csv file")
+    return resolved
+
+
+def _snapshot_runtime(coordinator: HashCoordinator) -> dict[str, dict[str, Any]]:
+    """Copy runtime data so it can be read outside the event loop."""
+    return {
+        chore_id: {
+            **runtime,
+            "completed_by_history": list(runtime.get("completed_by_history", [])),
+        }
+        for chore_id, runtime in coordinator.runtime_data.items()
+    }
+
+
+def _write_export(
+    path: Path,
+    chores: list[dict[str, Any]],
+    runtime_data: dict[str, dict[str, Any]],
+    fmt: str,
+    include_history: bool,
+    overwrite: bool,
+) -> int:
+    """Stream an export to a file (runs in the executor)."""
+    records = 0
+
+    def _counted() -> Iterator[dict[str, Any]]:
+        nonlocal records
+        for record in iter_records(chores, runtime_data, include_history):
+            records += 1
+            yield record
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        file = path.open("w" if overwrite else "x", encoding="utf-8", newline="")
+    except FileExistsError:
+        raise ValueError(f"{path.name} already exists") from None
+    with file:
+        for chunk in iter_chunks(iter_lines(_counted(), fmt)):
+            file.write(chunk)
+    return records
+
+
+def _read_import(path: Path, fmt: str) -> ImportBuilder:
+    """Validate an import file line by line (runs in the executor)."""
+    builder = ImportBuilder(fmt)
+    with path.open("rb") as file:
+        for line in file:
+            builder.feed_bytes(line)
+    return builder
+
+
+def format_for_path(path: str, fmt: str | None) -> str:
+    """Return the explicit format or infer it from the file extension."""
+    if fmt:
+        return fmt
+    return FORMAT_CSV if path.lower().endswith(".csv") else FORMAT_NDJSON
+
+
+async def async_export_to_file(
+    coordinator: HashCoordinator,
+    path: str,
+    fmt: str,
+    include_history: bool,
+    overwrite: bool = False,
+) -> dict[str, Any]:
+    """Export chores and runtime state to a file in the transfer directory.
+
+    Raises ValueError if the file exists and overwrite is not set.
+    """
+    hass = coordinator.hass
+    target = _resolve_path(hass, path)
+    chores = list(coordinator.config_entry.options.get(CONF_CHORES, []))
+    records = await hass.async_add_executor_job(
+        _write_export,
+        target,
+        chores,
+        _snapshot_runtime(coordinator),
+        fmt,
+        include_history,
+        overwrite,
+    )
+    return {"path": str(target), "chores": len(chores), "records": records}
+
+
+async def async_import_from_file(
+    coordinator: HashCoordinator, path: str, fmt: str, mode: str
+) -> ImportBuilder:
+    """Validate and, if valid, commit an import file."""
+    hass = coordinator.hass
+    source = _resolve_path(hass, path)
+    builder = await hass.async_add_executor_job(_read_import, source, fmt)
+    await async_commit_import(coordinator, builder, mode)
+    return builder
+
+
+async def async_commit_import(
+    coordinator: HashCoordinator, builder: ImportBuilder, mode: str
+) -> None:
+    """Apply a validated import with one store save and one options write.
+
+    Nothing is changed if the builder collected any errors. If the chores
+    themselves are unchanged, the coordinator is refreshed instead of the
+    entry being reloaded.
+    """
+    entry = coordinator.config_entry
+    current = entry.options.get(CONF_CHORES, [])
+    builder.finish(() if mode == MODE_REPLACE else (c[CONF_CHORE_ID] for c in current))
+    if builder.errors:
+        return
+
+    if mode == MODE_REPLACE:
+        chores = list(builder.chores.values())
+    else:
+        chores = [builder.chores.pop(c[CONF_CHORE_ID], c) for c in current]
+        chores.extend(builder.chores.values())
+
+    await coordinator.async_import_runtime(
+        builder.runtime, keep={c[CONF_CHORE_ID] for c in chores}
+    )
+    if not coordinator.hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_CHORES: chores}
+    ):
+        # Unchanged options do not reload the entry; show the imported state
+        await coordinator.async_request_refresh()
+
+
+def _require_admin(request: web.Request) -> None:
+    """Raise Unauthorized unless the request comes from an admin user."""
+    user = request.get("hass_user")
+    if user is None or not user.is_admin:
+        raise Unauthorized
+
+
+class HashExportView(HomeAssistantView):
+    """Stream an export of chores and runtime state."""
+
+    url = "/api/hash/export"
+    name = "api:hash:export"
+
+    async def get(self, request: web.Request) -> web.StreamResponse:
+        """Stream the export as NDJSON or CSV."""
+        _require_admin(request)
+        hass = request.app[KEY_HASS]
+        coordinator = async_get_coordinator(hass)
+        if coordinator is None:
+            return self.json_message("No HASH coordinator found", HTTPStatus.NOT_FOUND)
+
+        fmt = request.query.get("format", FORMAT_NDJSON)
+        if fmt not in FORMATS:
+            return self.json_message("Unsupported format", HTTPStatus.BAD_REQUEST)
+        include_history = request.query.get("history", "") in ("1", "true")
+
+        chores = list(coordinator.config_entry.options.get(CONF_CHORES, []))
+        response = web.StreamResponse(
+            headers={
+                hdrs.CONTENT_TYPE: CONTENT_TYPES[fmt],
+                hdrs.CONTENT_DISPOSITION: f'attachment; filename="hash_export.{fmt}"',
+            }
+        )
+        await response.prepare(request)
+        records = iter_records(chores, _snapshot_runtime(coordinator), include_history)
+        for chunk in iter_chunks(iter_lines(records, fmt)):
+            await response.write(chunk.encode())
+        await response.write_eof()
+        return response
+
+
+class HashImportView(HomeAssistantView):
+    """Import chores and runtime state from an NDJSON or CSV request body."""
+
+    url = "/api/hash/import"
+    name = "api:hash:import"
+
+    async def post(self, request: web.Request) -> web.Response:
+        """Validate the body line by line and commit it in one transaction."""
+        _require_admin(request)
+        hass = request.app[KEY_HASS]
+        coordinator = async_get_coordinator(hass)
+        if coordinator is None:
+            return self.json_message("No HASH coordinator found", HTTPStatus.NOT_FOUND)
+
+        fmt = request.query.get("format", FORMAT_NDJSON)
+        mode = request.query.get("mode", MODE_MERGE)
+        if fmt not in FORMATS or mode not in MODES:
+            return self.json_message(
+                "Unsupported format or mode", HTTPStatus.BAD_REQUEST
+            )
+
+        builder = ImportBuilder(fmt)
+        async for line in request.content:
+            builder.feed_bytes(line)
+        await async_commit_import(coordinator, builder, mode)
+
+        if builder.errors:
+            return self.json({"errors": builder.errors}, HTTPStatus.BAD_REQUEST)
+        return self.json({"imported": builder.counts})
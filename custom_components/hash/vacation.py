@@ -0,0 +1,63 @@
+"""Scheduled vacations for HASH.
+
+A vacation is a date range for one person. The coordinator keeps the ranges
+in its store and sets a single timer for the next start or end, so persons
+go on and return from vacation without anyone toggling it.
+"""
+
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(frozen=True, slots=True)
+class Vacation:
+    """A person's absence from start up to, but not including, end."""
+
+    person: str
+    start: datetime.datetime
+    end: datetime.datetime
+
+    def active(self, now: datetime.datetime) -> bool:
+        """Return whether the vacation is on at a given time."""
+        return self.start <= now < self.end
+
+    def as_dict(self) -> dict[str, str]:
+        """Return the stored form of the vacation."""
+        return {
+            "person": self.person,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> Vacation:
+        """Return a vacation from its stored form."""
+        return cls(
+            data["person"],
+            datetime.datetime.fromisoformat(data["start"]),
+            datetime.datetime.fromisoformat(data["end"]),
+        )
+
+
+def away(vacations: Iterable[Vacation], now: datetime.datetime) -> frozenset[str]:
+    """Return the persons on vacation at a given time."""
+    return frozenset(vacation.person for vacation in vacations if vacation.active(now))
+
+
+def next_transition(
+    vacations: Iterable[Vacation], now: datetime.datetime
+) -> datetime.datetime | None:
+    """Return the next time a vacation starts or ends after now."""
+    return min(
+        (
+            moment
+            for vacation in vacations
+            for moment in (vacation.start, vacation.end)
+            if moment > now
+        ),
+        default=None,
+    )
@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import uuid
+from collections.abc import Callable
+from functools import wraps
+from inspect import iscoroutinefunction
 from typing import Any
 
 import voluptuous as vol
 from homeassistant.components import websocket_api
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import Unauthorized
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.json import json_bytes
 
 from .const import (
     CONF_ASSIGNED_PERSON,
@@ -17,39 +23,109 @@ from .const import (
     CONF_GLOBAL_PAUSE,
     CONF_INTERVAL,
     CONF_ROOM,
-    CONF_VACATION_PERSONS,
-    DOMAIN,
+    SIGNAL_CHORES_UPDATED,
 )
-from .coordinator import HashCoordinator
+from .coordinator import async_get_coordinator
+from .metadata import async_get_metadata
+from .stats import async_get_stats
 
 
-def _get_coordinator(hass: HomeAssistant) -> HashCoordinator | None:
-    """Get the first available coordinator."""
-    entries = hass.data.get(DOMAIN, {})
-    for coordinator in entries.values():
-        if isinstance(coordinator, HashCoordinator):
-            return coordinator
-    return None
+@callback
+def _send(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    message: dict[str, Any],
+) -> None:
+    """Send a message encoded once, counting the bytes sent."""
+    encoded = json_bytes(message)
+    async_get_stats(hass).count("bytes_sent", len(encoded))
+    connection.send_message(encoded)
+
+
+@callback
+def _send_result(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg_id: int,
+    result: Any = None,
+) -> None:
+    """Send a command result, counting the bytes sent."""
+    _send(hass, connection, websocket_api.result_message(msg_id, result))
+
+
+def _timed(handler: Callable[..., Any]) -> Callable[..., Any]:
+    """Record how long a command handler takes, under its command type."""
+    if iscoroutinefunction(handler):
+
+        @wraps(handler)
+        async def async_timed(
+            hass: HomeAssistant,
+            connection: websocket_api.ActiveConnection,
+            msg: dict[str, Any],
+        ) -> None:
+            with async_get_stats(hass).timed(msg["type"]):
+                await handler(hass, connection, msg)
+
+        return async_timed
+
+    @wraps(handler)
+    def timed(
+        hass: HomeAssistant,
+        connection: websocket_api.ActiveConnection,
+        msg: dict[str, Any],
+    ) -> None:
+        with async_get_stats(hass).timed(msg["type"]):
+            handler(hass, connection, msg)
+
+    return timed
+
+
+def _new_chore(data: dict[str, Any]) -> dict[str, Any]:
+    """Build a chore config from add_chore style fields."""
+    return {
+        CONF_CHORE_ID: data.get(CONF_CHORE_ID) or str(uuid.uuid4()),
+        CONF_CHORE_NAME: data["name"],
+        CONF_ROOM: data["room"],
+        CONF_INTERVAL: data["interval"],
+        CONF_ASSIGNED_PERSON: data["assigned_person"],
+    }
+
+
+def _edit_chore(chore: dict[str, Any], data: dict[str, Any]) -> None:
+    """Apply edit_chore style fields to a chore config in place."""
+    if "name" in data:
+        chore[CONF_CHORE_NAME] = data["name"]
+    if "room" in data:
+        chore[CONF_ROOM] = data["room"]
+    if "interval" in data:
+        chore[CONF_INTERVAL] = data["interval"]
+    if "assigned_person" in data:
+        chore[CONF_ASSIGNED_PERSON] = data["assigned_person"]
 
 
 def register_websocket_commands(hass: HomeAssistant) -> None:
     """Register WebSocket commands for HASH."""
     websocket_api.async_register_command(hass, ws_handle_dashboard)
+    websocket_api.async_register_command(hass, ws_handle_metadata)
+    websocket_api.async_register_command(hass, ws_handle_subscribe)
     websocket_api.async_register_command(hass, ws_handle_complete_chore)
     websocket_api.async_register_command(hass, ws_handle_add_chore)
     websocket_api.async_register_command(hass, ws_handle_edit_chore)
     websocket_api.async_register_command(hass, ws_handle_delete_chore)
+    websocket_api.async_register_command(hass, ws_handle_batch)
+    websocket_api.async_register_command(hass, ws_handle_debug_stats)
 
 
 @callback
 @websocket_api.websocket_command({vol.Required("type"): "hash/dashboard"})
+@_timed
 def ws_handle_dashboard(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle hash/dashboard command."""
-    coordinator = _get_coordinator(hass)
+    coordinator = async_get_coordinator(hass)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
         return
@@ -57,16 +133,69 @@ def ws_handle_dashboard(
     options = coordinator.config_entry.options
     chores = coordinator.data or {}
 
-    connection.send_result(
+    _send_result(
+        hass,
+        connection,
         msg["id"],
         {
             "chores": chores,
-            "vacation_persons": options.get(CONF_VACATION_PERSONS, []),
+            "vacation_persons": coordinator.vacation_list(),
             "global_pause": options.get(CONF_GLOBAL_PAUSE, False),
+            "metadata_version": async_get_metadata(hass).version,
         },
     )
 
 
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "hash/metadata"})
+@_timed
+def ws_handle_metadata(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle hash/metadata command."""
+    _send_result(
+        hass,
+        connection,
+        msg["id"],
+        async_get_metadata(hass).async_as_dict(connection.user),
+    )
+
+
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "hash/subscribe"})
+@_timed
+def ws_handle_subscribe(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle hash/subscribe command.
+
+    Sends an event with the snapshots of the updated chores whenever
+    chores are updated, either one at a time or by a full refresh.
+    """
+
+    @callback
+    def forward_chores(chores: dict[str, Any]) -> None:
+        _send(
+            hass, connection, websocket_api.event_message(msg["id"], {"chores": chores})
+        )
+
+    stats = async_get_stats(hass)
+    unsub = async_dispatcher_connect(hass, SIGNAL_CHORES_UPDATED, forward_chores)
+
+    @callback
+    def unsubscribe() -> None:
+        unsub()
+        stats.gauge("subscribers", stats.gauges["subscribers"] - 1)
+
+    stats.gauge("subscribers", stats.gauges.get("subscribers", 0) + 1)
+    connection.subscriptions[msg["id"]] = unsubscribe
+    _send_result(hass, connection, msg["id"])
+
+
 @websocket_api.websocket_command(
     {
         vol.Required("type"): "hash/complete_chore",
@@ -74,20 +203,26 @@ def ws_handle_dashboard(
     }
 )
 @websocket_api.async_response
+@_timed
 async def ws_handle_complete_chore(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle hash/complete_chore command."""
-    coordinator = _get_coordinator(hass)
+    coordinator = async_get_coordinator(hass)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
         return
 
     chore_id = msg["chore_id"]
     await coordinator.async_complete_chore(chore_id)
-    connection.send_result(msg["id"], {"success": True})
+    _send_result(
+        hass,
+        connection,
+        msg["id"],
+        {"success": True, "chore": (coordinator.data or {}).get(chore_id)},
+    )
 
 
 @websocket_api.require_admin
@@ -101,13 +236,14 @@ async def ws_handle_complete_chore(
     }
 )
 @websocket_api.async_response
+@_timed
 async def ws_handle_add_chore(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle hash/add_chore command (admin only)."""
-    coordinator = _get_coordinator(hass)
+    coordinator = async_get_coordinator(hass)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
         return
@@ -116,21 +252,18 @@ async def ws_handle_add_chore(
     current_options = dict(entry.options)
     chores = list(current_options.get(CONF_CHORES, []))
 
-    new_chore = {
-        CONF_CHORE_ID: str(uuid.uuid4()),
-        CONF_CHORE_NAME: msg["name"],
-        CONF_ROOM: msg["room"],
-        CONF_INTERVAL: msg["interval"],
-        CONF_ASSIGNED_PERSON: msg["assigned_person"],
-    }
+    new_chore = _new_chore(msg)
     chores.append(new_chore)
     current_options[CONF_CHORES] = chores
 
     hass.config_entries.async_update_entry(entry, options=current_options)
     await coordinator.async_request_refresh()
 
-    connection.send_result(
-        msg["id"], {"success": True, "chore_id": new_chore[CONF_CHORE_ID]}
+    _send_result(
+        hass,
+        connection,
+        msg["id"],
+        {"success": True, "chore_id": new_chore[CONF_CHORE_ID]},
     )
 
 
@@ -146,13 +279,14 @@ async def ws_handle_add_chore(
     }
 )
 @websocket_api.async_response
+@_timed
 async def ws_handle_edit_chore(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle hash/edit_chore command (admin only)."""
-    coordinator = _get_coordinator(hass)
+    coordinator = async_get_coordinator(hass)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
         return
@@ -165,14 +299,7 @@ async def ws_handle_edit_chore(
     found = False
     for chore in chores:
         if chore.get(CONF_CHORE_ID) == chore_id:
-            if "name" in msg:
-                chore[CONF_CHORE_NAME] = msg["name"]
-            if "room" in msg:
-                chore[CONF_ROOM] = msg["room"]
-            if "interval" in msg:
-                chore[CONF_INTERVAL] = msg["interval"]
-            if "assigned_person" in msg:
-                chore[CONF_ASSIGNED_PERSON] = msg["assigned_person"]
+            _edit_chore(chore, msg)
             found = True
             break
 
@@ -184,7 +311,7 @@ async def ws_handle_edit_chore(
     hass.config_entries.async_update_entry(entry, options=current_options)
     await coordinator.async_request_refresh()
 
-    connection.send_result(msg["id"], {"success": True})
+    _send_result(hass, connection, msg["id"], {"success": True})
 
 
 @websocket_api.require_admin
@@ -195,13 +322,14 @@ async def ws_handle_edit_chore(
     }
 )
 @websocket_api.async_response
+@_timed
 async def ws_handle_delete_chore(
     hass: HomeAssistant,
     connection: websocket_api.ActiveConnection,
     msg: dict[str, Any],
 ) -> None:
     """Handle hash/delete_chore command (admin only)."""
-    coordinator = _get_coordinator(hass)
+    coordinator = async_get_coordinator(hass)
     if coordinator is None:
         connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
         return
@@ -220,4 +348,153 @@ async def ws_handle_delete_chore(
     hass.config_entries.async_update_entry(entry, options=current_options)
     await coordinator.async_request_refresh()
 
-    connection.send_result(msg["id"], {"success": True})
+    _send_result(hass, connection, msg["id"], {"success": True})
+
+
+BATCH_OPERATION_SCHEMAS: dict[str, vol.Schema] = {
+    "add": vol.Schema(
+        {
+            vol.Required("op"): "add",
+            vol.Optional("chore_id"): str,
+            vol.Required("name"): str,
+            vol.Optional("room", default=""): str,
+            vol.Required("interval"): int,
+            vol.Optional("assigned_person", default=""): str,
+        }
+    ),
+    "edit": vol.Schema(
+        {
+            vol.Required("op"): "edit",
+            vol.Required("chore_id"): str,
+            vol.Optional("name"): str,
+            vol.Optional("room"): str,
+            vol.Optional("interval"): int,
+            vol.Optional("assigned_person"): str,
+        }
+    ),
+    "delete": vol.Schema({vol.Required("op"): "delete", vol.Required("chore_id"): str}),
+    "complete": vol.Schema(
+        {vol.Required("op"): "complete", vol.Required("chore_id"): str}
+    ),
+}
+
+
+class BatchError(Exception):
+    """Raised when an operation in a batch is invalid."""
+
+
+def _plan_batch(
+    chores: list[dict[str, Any]], operations: list[dict[str, Any]]
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]], list[dict[str, Any]]]:
+    """Validate and apply operations to a copy of the chore list.
+
+    Returns the new chore list, the chore configs to complete (in order) and
+    the per-operation results. Raises BatchError naming the first invalid
+    operation; nothing is applied in that case.
+    """
+    new_chores = [dict(chore) for chore in chores]
+    by_id = {chore[CONF_CHORE_ID]: chore for chore in new_chores}
+    completions: list[dict[str, Any]] = []
+    results: list[dict[str, Any]] = []
+
+    for index, raw in enumerate(operations):
+        op_name = raw.get("op") if isinstance(raw, dict) else None
+        schema = BATCH_OPERATION_SCHEMAS.get(op_name)
+        if schema is None:
+            raise BatchError(f"Operation {index}: unknown op {op_name!r}")
+        try:
+            op = schema(raw)
+        except vol.Invalid as err:
+            raise BatchError(f"Operation {index} ({op_name}): {err}") from err
+
+        chore_id = op.get(CONF_CHORE_ID)
+        if op_name == "add":
+            if chore_id in by_id:
+                raise BatchError(f"Operation {index} (add): chore_id already exists")
+            chore = _new_chore(op)
+            new_chores.append(chore)
+            by_id[chore[CONF_CHORE_ID]] = chore
+            chore_id = chore[CONF_CHORE_ID]
+        elif chore_id not in by_id:
+            raise BatchError(f"Operation {index} ({op_name}): Chore not found")
+        elif op_name == "edit":
+            _edit_chore(by_id[chore_id], op)
+        elif op_name == "delete":
+            new_chores.remove(by_id.pop(chore_id))
+        else:
+            completions.append(by_id[chore_id])
+
+        results.append({"op": op_name, "chore_id": chore_id, "success": True})
+
+    return new_chores, completions, results
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "hash/batch",
+        vol.Required("operations"): [
+            vol.Schema({vol.Required("op"): str}, extra=vol.ALLOW_EXTRA)
+        ],
+    }
+)
+@websocket_api.async_response
+@_timed
+async def ws_handle_batch(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle hash/batch command.
+
+    Applies an ordered list of add/edit/delete/complete operations with a
+    single options write, a single store save and a single refresh. Batches
+    that only complete chores update just those chores.
+    Changing chore configuration requires an admin user.
+    """
+    coordinator = async_get_coordinator(hass)
+    if coordinator is None:
+        connection.send_error(msg["id"], "not_found", "No HASH coordinator found")
+        return
+
+    operations = msg["operations"]
+    if not connection.user.is_admin and any(
+        op.get("op") != "complete" for op in operations
+    ):
+        raise Unauthorized
+
+    entry = coordinator.config_entry
+    chores = entry.options.get(CONF_CHORES, [])
+    try:
+        new_chores, completions, results = _plan_batch(chores, operations)
+    except BatchError as err:
+        connection.send_error(msg["id"], websocket_api.ERR_INVALID_FORMAT, str(err))
+        return
+
+    # Persist runtime changes before the options write schedules a reload.
+    if completions:
+        for chore in completions:
+            coordinator.apply_completion(chore[CONF_CHORE_ID], chore)
+        await coordinator.async_save_store()
+
+    if new_chores != chores:
+        hass.config_entries.async_update_entry(
+            entry, options={**entry.options, CONF_CHORES: new_chores}
+        )
+    else:
+        for chore in completions:
+            coordinator.async_update_chore(chore[CONF_CHORE_ID])
+
+    _send_result(hass, connection, msg["id"], {"success": True, "results": results})
+
+
+@websocket_api.require_admin
+@callback
+@websocket_api.websocket_command({vol.Required("type"): "hash/debug/stats"})
+@_timed
+def ws_handle_debug_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle hash/debug/stats command with the timing statistics."""
+    _send_result(hass, connection, msg["id"], async_get_stats(hass).as_dict())
@@ -4,6 +4,14 @@ import {
   css,
 } from "https://unpkg.com/lit-element@4.1.1/lit-element.js?module";
 
+// Lists longer than this are rendered through the virtual scroller.
+const VIRTUALIZE_THRESHOLD = 60;
+// Estimated row heights (px) for the virtual scroller; cards are re-measured.
+const ROOM_ROW_HEIGHT = 54;
+const DEFAULT_CARD_HEIGHT = 88;
+// Extra pixels rendered above and below the viewport.
+const OVERSCAN_PX = 600;
+
 class HashPanel extends LitElement {
   static get properties() {
     return {
@@ -16,9 +24,10 @@ class HashPanel extends LitElement {
       _formMode: { type: String, state: true },
       _editChoreId: { type: String, state: true },
       _form: { type: Object, state: true },
-      _completingChore: { type: String, state: true },
-      _areas: { type: Array, state: true },
+      _completing: { type: Object, state: true },
+      _metadata: { type: Object, state: true },
       _activeTab: { type: String, state: true },
+      _virtualRange: { type: Object, state: true },
     };
   }
 
@@ -30,9 +39,18 @@ class HashPanel extends LitElement {
     this._formMode = "add"; // "add" | "edit"
     this._editChoreId = null;
     this._form = { name: "", room: "", interval: 14, assigned_person: "" };
-    this._completingChore = null;
-    this._areas = [];
+    this._completing = new Set();
+    this._metadata = null;
     this._activeTab = "mine";
+    this._virtualRange = { start: 0, end: 0 };
+    this._dataVersion = 0;
+    this._viewMemo = null;
+    this._cardCache = new Map();
+    this._cardHeight = DEFAULT_CARD_HEIGHT;
+    this._scrollTargets = [];
+    this._scrollFrame = null;
+    this._onScroll = () => this._scheduleVirtualUpdate();
+    this._unsubscribe = null;
   }
 
   connectedCallback() {
@@ -46,94 +64,164 @@ class HashPanel extends LitElement {
     if (this._refreshInterval) {
       clearInterval(this._refreshInterval);
     }
+    if (this._unsubscribe) {
+      this._unsubscribe.then((unsub) => unsub()).catch(() => {});
+      this._unsubscribe = null;
+    }
+    this._detachScrollListeners();
+  }
+
+  shouldUpdate(changedProps) {
+    // hass changes on every state change in HA; only the user matters here.
+    if (changedProps.size === 1 && changedProps.has("hass")) {
+      const oldHass = changedProps.get("hass");
+      return !oldHass || oldHass.user !== this.hass.user;
+    }
+    return true;
+  }
+
+  updated() {
+    if (this._isVirtual()) {
+      this._attachScrollListeners();
+      this._measureCardHeight();
+    } else {
+      this._detachScrollListeners();
+    }
   }
 
   async _fetchData() {
     if (!this.hass) return;
     try {
       const result = await this.hass.callWS({ type: "hash/dashboard" });
-      this._data = result;
+      // Area and person tables only change with the registries; the
+      // dashboard carries their version so they are refetched on demand.
+      if (
+        !this._metadata ||
+        this._metadata.version !== result.metadata_version
+      ) {
+        this._applyMetadata(await this.hass.callWS({ type: "hash/metadata" }));
+      }
+      this._applyDashboard(result);
       this._loading = false;
-
-      const areaReg = await this.hass.callWS({
-        type: "config/area_registry/list",
-      });
-      this._areas = areaReg || [];
+      this._subscribe();
     } catch (e) {
       console.error("HASH: Failed to fetch dashboard data", e);
       this._loading = false;
     }
   }
 
-  _getCurrentPersonEntityId() {
-    if (!this.hass || !this.hass.user) return null;
-    const userId = this.hass.user.id;
-    const userName = this.hass.user.name || "";
-    const userNameLower = userName.toLowerCase();
-    const states = this.hass.states;
-
-    // 1) Match by HA user_id attribute on person entity
-    for (const entityId of Object.keys(states)) {
-      if (!entityId.startsWith("person.")) continue;
-      const attrs = states[entityId].attributes || {};
-      if (attrs.user_id === userId) {
-        return entityId;
-      }
+  _subscribe() {
+    // Completions elsewhere push just the changed chores.
+    if (this._unsubscribe) return;
+    this._unsubscribe = this.hass.connection.subscribeMessage(
+      (event) => this._applyChoreUpdates(event.chores || {}),
+      { type: "hash/subscribe" },
+    );
+    this._unsubscribe.catch((e) => {
+      console.error("HASH: Failed to subscribe to chore updates", e);
+      this._unsubscribe = null;
+    });
+  }
+
+  _applyChoreUpdates(updates) {
+    if (!this._data) return;
+    const prev = this._data.chores;
+    let chores = null;
+    for (const [id, chore] of Object.entries(updates)) {
+      // New chores arrive with the next dashboard fetch.
+      if (!(id in prev) || this._sameChore(prev[id], chore)) continue;
+      if (!chores) chores = { ...prev };
+      chores[id] = chore;
     }
+    if (!chores) return;
+    this._data = { ...this._data, chores };
+    this._dataVersion += 1;
+  }
 
-    // 2) Match by friendly_name
-    if (userNameLower) {
-      for (const entityId of Object.keys(states)) {
-        if (!entityId.startsWith("person.")) continue;
-        const attrs = states[entityId].attributes || {};
-        if ((attrs.friendly_name || "").toLowerCase() === userNameLower) {
-          return entityId;
-        }
-      }
+  _applyDashboard(result) {
+    const prev = this._data;
+    const chores = this._reconcileChores(result.chores || {});
+    if (
+      prev &&
+      chores === prev.chores &&
+      result.global_pause === prev.global_pause &&
+      this._sameList(result.vacation_persons, prev.vacation_persons)
+    ) {
+      return;
     }
+    this._data = { ...result, chores };
+    this._dataVersion += 1;
+  }
 
-    // 3) Match by entity_id slug (person.kevin → "kevin")
-    if (userNameLower) {
-      for (const entityId of Object.keys(states)) {
-        if (!entityId.startsWith("person.")) continue;
-        const slug = entityId.split(".")[1] || "";
-        if (slug.toLowerCase() === userNameLower) {
-          return entityId;
-        }
+  _reconcileChores(incoming) {
+    // Keep the previous object for every unchanged chore so memoized
+    // views and cached card templates stay valid across refreshes.
+    const prev = (this._data && this._data.chores) || {};
+    const next = {};
+    let changed = Object.keys(prev).length !== Object.keys(incoming).length;
+    for (const [id, chore] of Object.entries(incoming)) {
+      const old = prev[id];
+      if (old && this._sameChore(old, chore)) {
+        next[id] = old;
+      } else {
+        next[id] = chore;
+        changed = true;
       }
     }
+    return changed ? next : prev;
+  }
 
-    // 4) Partial / contains match (user "Kevin M" → person with friendly_name "Kevin")
-    if (userNameLower) {
-      for (const entityId of Object.keys(states)) {
-        if (!entityId.startsWith("person.")) continue;
-        const attrs = states[entityId].attributes || {};
-        const fn = (attrs.friendly_name || "").toLowerCase();
-        if (fn && (userNameLower.includes(fn) || fn.includes(userNameLower))) {
-          return entityId;
-        }
-      }
+  _sameChore(a, b) {
+    const keys = Object.keys(b);
+    if (Object.keys(a).length !== keys.length) return false;
+    return keys.every((k) => a[k] === b[k]);
+  }
+
+  _sameList(a, b) {
+    if (a === b) return true;
+    if (!a || !b || a.length !== b.length) return false;
+    return a.every((v, i) => v === b[i]);
+  }
+
+  _applyMetadata(metadata) {
+    const personNames = new Map();
+    for (const person of metadata.persons || []) {
+      personNames.set(person.entity_id, person.name);
     }
+    this._metadata = { ...metadata, personNames };
+    // Assignee labels on cached cards come from the person roster.
+    this._cardCache.clear();
+  }
 
-    console.warn(
-      "HASH: Could not match current user to a person entity.",
-      "User ID:", userId,
-      "User name:", userName,
-      "Person entities:",
-      Object.keys(states)
-        .filter((e) => e.startsWith("person."))
-        .map((e) => ({
-          entity_id: e,
-          friendly_name: (states[e].attributes || {}).friendly_name,
-          user_id: (states[e].attributes || {}).user_id,
-        }))
-    );
-    return null;
+  _getCurrentPersonEntityId() {
+    return this._metadata ? this._metadata.current_person : null;
   }
 
-  _getChoresForTab(tab) {
-    if (!this._data || !this._data.chores) return [];
+  _getTabView(tab) {
     const myPersonId = this._getCurrentPersonEntityId();
+    const memo = this._viewMemo;
+    if (
+      !memo ||
+      memo.version !== this._dataVersion ||
+      memo.person !== myPersonId
+    ) {
+      this._viewMemo = {
+        version: this._dataVersion,
+        person: myPersonId,
+        tabs: {},
+      };
+      this._pruneCardCache();
+    }
+    const tabs = this._viewMemo.tabs;
+    if (!tabs[tab]) {
+      const chores = this._getChoresForTab(tab, myPersonId);
+      tabs[tab] = { chores, groups: this._groupByRoom(chores), rows: null };
+    }
+    return tabs[tab];
+  }
+
+  _getChoresForTab(tab, myPersonId) {
+    if (!this._data || !this._data.chores) return [];
     const chores = Object.values(this._data.chores);
 
     let filtered;
@@ -184,11 +272,8 @@ class HashPanel extends LitElement {
   }
 
   _getPersonName(entityId) {
-    if (!this.hass || !this.hass.states[entityId]) return entityId;
-    return (
-      this.hass.states[entityId].attributes.friendly_name ||
-      entityId.replace("person.", "")
-    );
+    const names = this._metadata && this._metadata.personNames;
+    return (names && names.get(entityId)) || entityId;
   }
 
   _getStatusColor(status) {
@@ -207,18 +292,53 @@ class HashPanel extends LitElement {
   }
 
   async _completeChore(choreId) {
-    this._completingChore = choreId;
+    const previous = this._data && this._data.chores[choreId];
+    if (!previous || this._completing.has(choreId)) return;
+    this._completing = new Set(this._completing).add(choreId);
+
+    // Show the chore as freshly cleaned right away; the server response
+    // carries the authoritative snapshot (rotation, weekend shift, ...).
+    const now = new Date();
+    const due = new Date(now);
+    due.setDate(due.getDate() + (previous.interval_days || 0));
+    this._patchChore(choreId, {
+      ...previous,
+      cleanliness: 100,
+      status: "Great",
+      days_since: 0,
+      last_cleaned: now.toISOString(),
+      next_due: previous.next_due ? this._toDateString(due) : null,
+    });
+
     try {
-      await this.hass.callWS({
+      const result = await this.hass.callWS({
         type: "hash/complete_chore",
         chore_id: choreId,
       });
-      await new Promise((r) => setTimeout(r, 600));
-      await this._fetchData();
+      if (result && result.chore) {
+        this._patchChore(choreId, result.chore);
+      }
     } catch (e) {
       console.error("HASH: Failed to complete chore", e);
+      this._patchChore(choreId, previous);
     }
-    this._completingChore = null;
+    const completing = new Set(this._completing);
+    completing.delete(choreId);
+    this._completing = completing;
+  }
+
+  _patchChore(choreId, chore) {
+    if (!this._data || !(choreId in this._data.chores)) return;
+    this._data = {
+      ...this._data,
+      chores: { ...this._data.chores, [choreId]: chore },
+    };
+    this._dataVersion += 1;
+  }
+
+  _toDateString(date) {
+    const pad = (n) => String(n).padStart(2, "0");
+    return `${date.getFullYear()}-${pad(date.getMonth() + 1)}-${pad(date.getDate())}`;
   }
 
   _openAddForm() {
@@ -292,6 +412,131 @@ class HashPanel extends LitElement {
 
   _setTab(tab) {
     this._activeTab = tab;
+    this._virtualRange = { start: 0, end: 0 };
+  }
+
+  /* ---- Virtual scrolling ---- */
+
+  _isVirtual() {
+    if (this._loading || !this._data) return false;
+    return this._getTabView(this._activeTab).chores.length > VIRTUALIZE_THRESHOLD;
+  }
+
+  _getVirtualRows(view) {
+    if (view.rows && view.rowsCardHeight === this._cardHeight) {
+      return view.rows;
+    }
+    const items = [];
+    const offsets = [0];
+    for (const [room, chores] of view.groups.entries()) {
+      items.push({ type: "room", room });
+      offsets.push(offsets[offsets.length - 1] + ROOM_ROW_HEIGHT);
+      chores.forEach((chore, i) => {
+        items.push({
+          type: "chore",
+          chore,
+          first: i === 0,
+          last: i === chores.length - 1,
+        });
+        offsets.push(offsets[offsets.length - 1] + this._cardHeight);
+      });
+    }
+    view.rows = { items, offsets };
+    view.rowsCardHeight = this._cardHeight;
+    return view.rows;
+  }
+
+  _findRow(offsets, y) {
+    // Index of the last row whose top offset is <= y.
+    let lo = 0;
+    let hi = offsets.length - 2;
+    while (lo < hi) {
+      const mid = (lo + hi + 1) >> 1;
+      if (offsets[mid] <= y) lo = mid;
+      else hi = mid - 1;
+    }
+    return Math.max(0, lo);
+  }
+
+  _computeVirtualRange() {
+    const list = this.renderRoot && this.renderRoot.querySelector(".vlist");
+    if (!list) return;
+    const { offsets, items } = this._getVirtualRows(
+      this._getTabView(this._activeTab)
+    );
+    const rect = list.getBoundingClientRect();
+    const top = Math.max(0, -rect.top - OVERSCAN_PX);
+    const bottom = -rect.top + window.innerHeight + OVERSCAN_PX;
+    const start = this._findRow(offsets, top);
+    const end = Math.min(items.length, this._findRow(offsets, bottom) + 1);
+    const range = this._virtualRange;
+    if (range.start !== start || range.end !== end) {
+      this._virtualRange = { start, end };
+    }
+  }
+
+  _scheduleVirtualUpdate() {
+    if (this._scrollFrame) return;
+    this._scrollFrame = requestAnimationFrame(() => {
+      this._scrollFrame = null;
+      this._computeVirtualRange();
+    });
+  }
+
+  _attachScrollListeners() {
+    if (this._scrollTargets.length) {
+      this._scheduleVirtualUpdate();
+      return;
+    }
+    // The panel may be scrolled by the window or by any ancestor across
+    // shadow roots, so listen on every scrollable container above us.
+    const targets = [window];
+    let node = this.parentNode || (this.getRootNode && this.getRootNode().host);
+    while (node && node !== document) {
+      if (node instanceof Element) {
+        const overflow = getComputedStyle(node).overflowY;
+        if (overflow === "auto" || overflow === "scroll") targets.push(node);
+      }
+      node = node.parentNode || node.host;
+    }
+    for (const target of targets) {
+      target.addEventListener("scroll", this._onScroll, { passive: true });
+    }
+    window.addEventListener("resize", this._onScroll, { passive: true });
+    this._scrollTargets = targets;
+    this._scheduleVirtualUpdate();
+  }
+
+  _detachScrollListeners() {
+    for (const target of this._scrollTargets) {
+      target.removeEventListener("scroll", this._onScroll);
+    }
+    if (this._scrollTargets.length) {
+      window.removeEventListener("resize", this._onScroll);
+    }
+    this._scrollTargets = [];
+    if (this._scrollFrame) {
+      cancelAnimationFrame(this._scrollFrame);
+      this._scrollFrame = null;
+    }
+  }
+
+  _measureCardHeight() {
+    const card = this.renderRoot.querySelector(".vlist .v-card");
+    if (!card) return;
+    const height = card.offsetHeight;
+    if (height && Math.abs(height - this._cardHeight) > 1) {
+      this._cardHeight = height;
+      this._scheduleVirtualUpdate();
+      this.requestUpdate();
+    }
+  }
+
+  _pruneCardCache() {
+    const chores = (this._data && this._data.chores) || {};
+    for (const id of this._cardCache.keys()) {
+      if (!(id in chores)) this._cardCache.delete(id);
+    }
   }
 
   /* ---- Render helpers ---- */
@@ -325,9 +570,9 @@ class HashPanel extends LitElement {
   }
 
   _renderTabs() {
-    const mineCount = this._getChoresForTab("mine").length;
-    const othersCount = this._getChoresForTab("others").length;
-    const allCount = this._getChoresForTab("all").length;
+    const mineCount = this._getTabView("mine").chores.length;
+    const othersCount = this._getTabView("others").chores.length;
+    const allCount = this._getTabView("all").chores.length;
 
     const tabs = [
       { id: "mine", label: "My Tasks", count: mineCount, icon: "\u2709" },
@@ -356,7 +601,8 @@ class HashPanel extends LitElement {
 
   _renderTabContent() {
     const showAssignee = this._activeTab !== "mine";
-    const chores = this._getChoresForTab(this._activeTab);
+    const view = this._getTabView(this._activeTab);
+    const chores = view.chores;
 
     if (chores.length === 0) {
       const emoji =
@@ -380,11 +626,36 @@ class HashPanel extends LitElement {
       `;
     }
 
-    return this._renderChoreList(chores, showAssignee);
+    if (chores.length > VIRTUALIZE_THRESHOLD) {
+      return this._renderVirtualList(view, showAssignee);
+    }
+    return this._renderChoreList(view.groups, showAssignee);
+  }
+
+  _renderVirtualList(view, showAssignee) {
+    const { items, offsets } = this._getVirtualRows(view);
+    let { start, end } = this._virtualRange;
+    if (end === 0 || end > items.length) {
+      // First paint before the viewport is measured.
+      start = 0;
+      end = Math.min(items.length, this._findRow(offsets, window.innerHeight) + 1);
+    }
+    return html`
+      <div class="vlist" style="height:${offsets[items.length]}px">
+        <div class="vlist-window" style="transform:translateY(${offsets[start]}px)">
+          ${items.slice(start, end).map((item) =>
+            item.type === "room"
+              ? html`<div class="room-header v-room-header">${item.room}</div>`
+              : html`<div class="v-card ${item.first ? "v-first" : ""} ${item.last ? "v-last" : ""}">
+                  ${this._renderChoreCard(item.chore, showAssignee)}
+                </div>`
+          )}
+        </div>
+      </div>
+    `;
   }
 
-  _renderChoreList(chores, showAssignee) {
-    const groups = this._groupByRoom(chores);
+  _renderChoreList(groups, showAssignee) {
     return html`
       ${[...groups.entries()].map(
         ([room, roomChores]) =>
@@ -419,10 +690,38 @@ class HashPanel extends LitElement {
   }
 
   _renderChoreCard(chore, showAssignee) {
-    const isCompleting = this._completingChore === chore.chore_id;
+    const isCompleting = this._completing.has(chore.chore_id);
+    const isAdmin = !!(this.hass && this.hass.user && this.hass.user.is_admin);
+    const day = new Date().toDateString();
+
+    // Only cards whose chore snapshot or display flags changed are rebuilt.
+    const cached = this._cardCache.get(chore.chore_id);
+    if (
+      cached &&
+      cached.chore === chore &&
+      cached.showAssignee === showAssignee &&
+      cached.isCompleting === isCompleting &&
+      cached.isAdmin === isAdmin &&
+      cached.day === day
+    ) {
+      return cached.template;
+    }
+
+    const template = this._buildChoreCard(chore, showAssignee, isCompleting, isAdmin);
+    this._cardCache.set(chore.chore_id, {
+      chore,
+      showAssignee,
+      isCompleting,
+      isAdmin,
+      day,
+      template,
+    });
+    return template;
+  }
+
+  _buildChoreCard(chore, showAssignee, isCompleting, isAdmin) {
     const color = this._getStatusColor(chore.status);
     const pct = Math.round(chore.cleanliness);
-    const isAdmin = this.hass && this.hass.user && this.hass.user.is_admin;
 
     let assigneeLabel = "";
     if (showAssignee && chore.assigned_to) {
@@ -430,7 +729,7 @@ class HashPanel extends LitElement {
     }
 
     return html`
-      <div class="chore-card ${isCompleting ? "completing" : ""} ${isAdmin ? "editable" : ""}">
+      <div class="chore-card ${isAdmin ? "editable" : ""}">
         <div class="status-stripe" style="background:${color}"></div>
         <div class="card-body"
           @click=${isAdmin ? () => this._openEditForm(chore) : null}
@@ -467,9 +766,8 @@ class HashPanel extends LitElement {
   }
 
   _renderFormModal() {
-    const persons = Object.keys(this.hass.states).filter((e) =>
-      e.startsWith("person.")
-    );
+    const persons = (this._metadata && this._metadata.persons) || [];
+    const areas = Object.entries((this._metadata && this._metadata.areas) || {});
     const isEdit = this._formMode === "edit";
     const title = isEdit ? "Edit Chore" : "New Chore";
     const saveLabel = isEdit ? "Save" : "Add Chore";
@@ -501,9 +799,9 @@ class HashPanel extends LitElement {
                     (this._form = { ...this._form, room: e.target.value })}
                 >
                   <option value="">None</option>
-                  ${this._areas.map(
-                    (a) =>
-                      html`<option value=${a.area_id}>${a.name}</option>`
+                  ${areas.map(
+                    ([areaId, name]) =>
+                      html`<option value=${areaId}>${name}</option>`
                   )}
                 </select>
               </div>
@@ -537,12 +835,7 @@ class HashPanel extends LitElement {
               >
                 <option value="">Unassigned</option>
                 ${persons.map(
-                  (p) => html`
-                    <option value=${p}>
-                      ${this.hass.states[p].attributes.friendly_name ||
-                      p.replace("person.", "")}
-                    </option>
-                  `
+                  (p) => html`<option value=${p.entity_id}>${p.name}</option>`
                 )}
               </select>
             </div>
@@ -786,12 +1079,44 @@ class HashPanel extends LitElement {
           0 4px 12px rgba(0, 0, 0, 0.04);
       }
 
+      /* ======== Virtual List ======== */
+      .vlist {
+        position: relative;
+      }
+      .vlist-window {
+        will-change: transform;
+      }
+      .v-room-header {
+        box-sizing: border-box;
+        height: 54px;
+        padding-top: 24px;
+        overflow: hidden;
+      }
+      .v-card {
+        overflow: hidden;
+        box-shadow: 0 1px 3px rgba(0, 0, 0, 0.06);
+      }
+      .v-card .chore-card {
+        border-bottom: 1px solid var(--hash-divider);
+      }
+      .v-card.v-first {
+        border-top-left-radius: var(--hash-radius);
+        border-top-right-radius: var(--hash-radius);
+      }
+      .v-card.v-last {
+        border-bottom-left-radius: var(--hash-radius);
+        border-bottom-right-radius: var(--hash-radius);
+      }
+      .v-card.v-last .chore-card {
+        border-bottom: none;
+      }
+
       /* ======== Chore Card ======== */
       .chore-card {
         display: flex;
         background: var(--hash-card-bg);
         border-bottom: 1px solid var(--hash-divider);
-        transition: opacity 0.4s, transform 0.4s, background 0.15s;
+        transition: background 0.15s;
       }
       .chore-card:last-child {
         border-bottom: none;
@@ -803,10 +1128,6 @@ class HashPanel extends LitElement {
           var(--hash-text)
         );
       }
-      .chore-card.completing {
-        opacity: 0.25;
-        transform: scale(0.97);
-      }
       .chore-card.editable .card-body {
         cursor: pointer;
       }
@@ -0,0 +1,200 @@
+"""Synthetic households for the benchmarks.
+
+Households are generated from a fixed seed, so every run times the same
+data. A regular test run only smoke-tests the smallest one; the larger ones
+are built when benchmarks are run explicitly with ``--benchmark-only``.
+"""
+
+from __future__ import annotations
+
+import datetime
+import random
+import sys
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.hash.const import (
+    CONF_ASSIGNED_PERSON,
+    CONF_CHORE_ID,
+    CONF_CHORE_NAME,
+    CONF_CHORES,
+    CONF_DECAY,
+    CONF_EFFORT,
+    CONF_GLOBAL_PAUSE,
+    CONF_INTERVAL,
+    CONF_PREFERRED_DAYS,
+    CONF_ROOM,
+    CONF_VACATION_PERSONS,
+    DECAY_EXPONENTIAL,
+    DECAY_LINEAR,
+    DECAY_STEP,
+    DOMAIN,
+    WEEKDAYS,
+)
+from custom_components.hash.coordinator import HashCoordinator
+
+
+@dataclass(frozen=True, slots=True)
+class Household:
+    """A generated household: chores, persons and completion history."""
+
+    chores: int
+    persons: int
+    history: int
+
+
+# Chores -> household; the history gets shorter as households grow so the
+# largest one still fits in memory
+HOUSEHOLDS = {
+    10: Household(10, 3, 365),
+    1_000: Household(1_000, 12, 52),
+    50_000: Household(50_000, 40, 12),
+}
+
+
+def household_options(household: Household, seed: int = 0) -> dict[str, Any]:
+    """Return config entry options for a household."""
+    rng = random.Random(seed)
+    persons = [f"person.p{i}" for i in range(household.persons)]
+    chores = []
+    for i in range(household.chores):
+        chore = {
+            CONF_CHORE_ID: f"chore-{i:06d}",
+            CONF_CHORE_NAME: f"Chore {i}",
+            CONF_ROOM: f"room_{i % 40}",
+            CONF_INTERVAL: rng.choice((1, 3, 7, 7, 14, 14, 30, 90)),
+            # A third of the chores are pinned
+            CONF_ASSIGNED_PERSON: rng.choice(persons) if i % 3 == 0 else "",
+            CONF_EFFORT: rng.randint(1, 5),
+            CONF_DECAY: rng.choice((DECAY_LINEAR, DECAY_EXPONENTIAL, DECAY_STEP)),
+        }
+        if i % 5 == 0:
+            chore[CONF_PREFERRED_DAYS] = rng.sample(WEEKDAYS, 2)
+        chores.append(chore)
+    return {
+        CONF_CHORES: chores,
+        CONF_VACATION_PERSONS: persons[:1],
+        CONF_GLOBAL_PAUSE: False,
+    }
+
+
+def household_runtime(
+    household: Household, now: datetime.datetime, seed: int = 0
+) -> dict[str, dict[str, Any]]:
+    """Return stored runtime data with a completion history for every chore."""
+    rng = random.Random(seed)
+    persons = [f"person.p{i}" for i in range(household.persons)]
+    # Timestamps are shared between chores to keep the large household small
+    stamps = [
+        (now - datetime.timedelta(days=day, hours=rng.randint(0, 23))).isoformat()
+        for day in range(household.history * 7)
+    ]
+    runtime = {}
+    for i in range(household.chores):
+        offset = rng.randrange(len(stamps) - household.history)
+        runtime[f"chore-{i:06d}"] = {
+            "last_cleaned": stamps[offset],
+            "rotation_index": rng.randrange(household.persons),
+            "completed_by_history": [
+                {"person": rng.choice(persons), "timestamp": stamps[offset + n]}
+                for n in range(household.history)
+            ],
+        }
+    return runtime
+
+
+class MemoryStore:
+    """Store double that keeps the encoded JSON like a real save would."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self.blob = json_bytes(data)
+        self.size = len(self.blob)
+
+    async def async_load(self) -> Any:
+        return json_loads(self.blob)
+
+    async def async_save(self, data: dict[str, Any]) -> None:
+        self.blob = json_bytes(data)
+        self.size = len(self.blob)
+
+
+def run(func: Callable[..., Coroutine[Any, Any, Any]], *args: Any) -> Any:
+    """Run a coroutine function that never suspends, without the event loop.
+
+    The benchmark fixture is synchronous, so coroutines are driven to their
+    first await; one that actually waits for I/O is an error.
+    """
+    coro = func(*args)
+    try:
+        coro.send(None)
+    except StopIteration as done:
+        return done.value
+    coro.close()
+    raise RuntimeError("coroutine suspended while being benchmarked")
+
+
+def count_lines(func: Callable[..., Any], *args: Any) -> int:
+    """Return how many Python lines a call executes, loop iterations included.
+
+    Unlike timings, the count does not depend on the machine, so it can bound
+    how work grows with the household in a regular test run. Only Python
+    lines are counted: work done in C, such as copying a dict, is invisible
+    to it. A tracer already installed, e.g. by coverage, is restored after.
+    """
+    lines = 0
+
+    def trace(frame: Any, event: str, arg: Any) -> Callable[..., Any]:
+        nonlocal lines
+        if event == "line":
+            lines += 1
+        return trace
+
+    previous = sys.gettrace()
+    sys.settrace(trace)
+    try:
+        func(*args)
+    finally:
+        sys.settrace(previous)
+    return lines
+
+
+@pytest.fixture(params=sorted(HOUSEHOLDS), ids=lambda size: f"{size}_chores")
+def household(request: pytest.FixtureRequest) -> Household:
+    """Return each household size; the larger ones only with --benchmark-only."""
+    if request.param > min(HOUSEHOLDS) and not request.config.getoption(
+        "benchmark_only"
+    ):
+        pytest.skip("larger households only run with --benchmark-only")
+    return HOUSEHOLDS[request.param]
+
+
+async def async_build_coordinator(
+    hass: HomeAssistant, household: Household
+) -> HashCoordinator:
+    """Return a refreshed coordinator for a household, without entities."""
+    for i in range(household.persons):
+        hass.states.async_set(f"person.p{i}", "home")
+    entry = MockConfigEntry(domain=DOMAIN, options=household_options(household))
+    entry.add_to_hass(hass)
+    coordinator = HashCoordinator(hass, entry)
+    coordinator._store = MemoryStore(
+        {"chores": household_runtime(household, dt_util.utcnow()), "vacations": []}
+    )
+    await coordinator.async_load_store()
+    coordinator.data = await coordinator._async_update_data()
+    hass.data.setdefault(DOMAIN, {})[entry.entry_id] = coordinator
+    return coordinator
+
+
+@pytest.fixture
+async def coordinator(hass: HomeAssistant, household: Household) -> HashCoordinator:
+    """Return a refreshed coordinator for the household, without entities."""
+    return await async_build_coordinator(hass, household)
@@ -0,0 +1,129 @@
+"""Benchmarks of the hot paths for generated households."""
+
+from __future__ import annotations
+
+import datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+
+from custom_components.hash.calendar import _build_events
+from custom_components.hash.const import CONF_CHORES, SIGNAL_CHORES_UPDATED
+from custom_components.hash.coordinator import HashCoordinator, _get_all_persons
+from custom_components.hash.scheduler import get_effective_assignee
+from custom_components.hash.websocket import ws_handle_dashboard
+
+from .conftest import Household, async_build_coordinator, count_lines, run
+
+
+class _Connection:
+    """Websocket connection that keeps the last encoded message."""
+
+    def __init__(self) -> None:
+        self.sent = b""
+
+    def send_message(self, message: bytes) -> None:
+        self.sent = message
+
+    def send_error(self, msg_id: int, code: str, message: str) -> None:
+        raise AssertionError(message)
+
+
+def test_update_data(benchmark, coordinator: HashCoordinator):
+    data = benchmark(run, coordinator._async_update_data)
+
+    assert len(data) == len(coordinator.config_entry.options[CONF_CHORES])
+
+
+def test_build_events(benchmark, coordinator: HashCoordinator):
+    today = coordinator._today
+    events = benchmark(
+        _build_events,
+        coordinator.data,
+        today,
+        today + datetime.timedelta(weeks=5),
+        planned=coordinator.planner.dates,
+    )
+
+    assert events
+
+
+def test_effective_assignee(benchmark, hass: HomeAssistant, coordinator):
+    chores = coordinator.config_entry.options[CONF_CHORES]
+    runtime = coordinator.runtime_data
+    persons = _get_all_persons(hass)
+    vacation_list = coordinator.vacation_list()
+
+    def assign_all() -> list[str | None]:
+        return [
+            get_effective_assignee(
+                chore, runtime[chore["chore_id"]], persons, vacation_list
+            )
+            for chore in chores
+        ]
+
+    assert all(benchmark(assign_all))
+
+
+def test_store_load(benchmark, coordinator: HashCoordinator):
+    runtime = coordinator.runtime_data
+    benchmark(run, coordinator.async_load_store)
+
+    assert coordinator.runtime_data == runtime
+
+
+def test_store_save(benchmark, coordinator: HashCoordinator):
+    benchmark(run, coordinator.async_save_store)
+
+    assert coordinator._store.blob
+
+
+def test_complete_chore(benchmark, coordinator: HashCoordinator):
+    chore_ids = iter(list(coordinator.data) * 1_000)
+
+    benchmark(lambda: run(coordinator.async_complete_chore, next(chore_ids)))
+
+
+def test_dashboard(benchmark, hass: HomeAssistant, coordinator):
+    connection = _Connection()
+    benchmark(
+        ws_handle_dashboard, hass, connection, {"id": 1, "type": "hash/dashboard"}
+    )
+
+    assert len(connection.sent) > len(coordinator.data)
+
+
+async def test_single_chore_update_does_not_scale(hass: HomeAssistant):
+    # The same ten chores' updates must not do more work in a household ten
+    # times the size; timings are too noisy to guard this across machines.
+    # Copying the data dict on each update is linear too, but done in C, so
+    # the line count cannot see it; that copy is accepted as cheap
+    work = []
+    for size in (1_000, 10_000):
+        coordinator = await async_build_coordinator(hass, Household(size, 12, 4))
+        lines = 0
+        for chore_id in list(coordinator.data)[:: size // 10]:
+            coordinator.apply_completion(chore_id)
+            lines += count_lines(coordinator.async_update_chore, chore_id)
+        work.append(lines)
+
+    assert work[1] < 2 * work[0]
+
+
+async def test_vacation_transition_updates_once(hass: HomeAssistant):
+    # A vacation starting reassigns most chores in rotation mode; they must be
+    # recomputed together, with one data swap and one notification
+    work = []
+    for size in (500, 5_000):
+        coordinator = await async_build_coordinator(hass, Household(size, 12, 4))
+        updates = []
+        unsub = async_dispatcher_connect(hass, SIGNAL_CHORES_UPDATED, updates.append)
+        coordinator._away = {"person.p1"}
+        work.append(count_lines(coordinator._async_reassign))
+        unsub()
+
+        assert len(updates) == 1
+        assert len(updates[0]) > size // 4
+
+    # Linear in the household, not in the household times the reassigned chores
+    assert work[1] < 15 * work[0]
@@ -123,10 +123,12 @@ def mock_config_entry_two_chores(mock_options_two_chores: dict) -> MockConfigEnt
 def bypass_store() -> Generator[AsyncMock]:
     with (
         patch(
-            "custom_components.hash.coordinator.Store",
+            "custom_components.hash.coordinator.HashStore",
         ) as mock_store_cls,
     ):
         instance = mock_store_cls.return_value
+        # Size of the file the last save would have written
+        instance.size = 128
         instance.async_load = AsyncMock(return_value=None)
         instance.async_save = AsyncMock(return_value=None)
         instance.async_remove = AsyncMock(return_value=None)
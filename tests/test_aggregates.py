@@ -0,0 +1,189 @@
+"""Tests for the cleanliness aggregates."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+
+from custom_components.hash.aggregates import (
+    GROUP_AREA,
+    GROUP_PERSON,
+    HOME_KEY,
+    AggregateGroup,
+    HashAggregates,
+)
+from custom_components.hash.const import DOMAIN, SERVICE_URGENT_CHORES
+from custom_components.hash.coordinator import HashCoordinator
+
+from .conftest import MOCK_CHORE_ID, MOCK_CHORE_ID_2
+
+
+def _snapshot(
+    cleanliness: float,
+    area: str = "",
+    person: str | None = None,
+    last_cleaned: str = "2026-01-01T00:00:00+00:00",
+    interval_days: int = 7,
+):
+    return {
+        "cleanliness": cleanliness,
+        "area_id": area,
+        "assigned_to": person,
+        "last_cleaned": last_cleaned,
+        "interval_days": interval_days,
+    }
+
+
+class TestAggregateGroup:
+    """Tests for AggregateGroup."""
+
+    def test_running_stats(self):
+        group = AggregateGroup()
+        group.set("a", 80.0, 0.0)
+        group.set("b", 0.0, 0.0)
+        group.set("c", 40.5, 0.0)
+
+        stats = group.stats()
+        assert stats.count == 3
+        assert stats.average == 40.2
+        assert stats.minimum == 0.0
+        assert stats.overdue == 1
+        assert stats.worst_chore_id == "b"
+
+        group.set("b", 100.0, 0.0)
+        group.discard("c")
+        stats = group.stats()
+        assert stats.average == 90.0
+        assert stats.minimum == 80.0
+        assert stats.overdue == 0
+        assert stats.worst_chore_id == "a"
+
+    def test_heap_stays_bounded(self):
+        group = AggregateGroup()
+        for step in range(1000):
+            group.set("a", step % 100, 0.0)
+            group.set("b", 50.0, 0.0)
+        assert len(group._heap) <= 2 * len(group) + 16
+        assert group.stats().worst_chore_id == "b"
+        group.set("a", 1.0, 0.0)
+        assert group.stats().worst_chore_id == "a"
+
+    def test_most_urgent(self):
+        group = AggregateGroup()
+        for index, chore_id in enumerate("abcdef"):
+            group.set(chore_id, 50.0, float(index))
+        group.set("a", 100.0, 10.0)
+        group.discard("c")
+
+        assert group.most_urgent(3) == ["b", "d", "e"]
+        assert group.most_urgent(10) == ["b", "d", "e", "f", "a"]
+        # Reading does not consume the heap
+        assert group.most_urgent(1) == ["b"]
+
+
+def test_memberships_follow_snapshot_changes():
+    aggregates = HashAggregates()
+    aggregates.update("a", _snapshot(50.0, "kitchen", "person.alice"))
+    aggregates.update("b", _snapshot(10.0, "kitchen", "person.bob"))
+    assert aggregates.stats((GROUP_AREA, "kitchen")).average == 30.0
+    assert aggregates.stats((GROUP_PERSON, "person.bob")).count == 1
+
+    # Rotation moves chore b to Alice
+    aggregates.update("b", _snapshot(100.0, "kitchen", "person.alice"))
+    assert aggregates.stats((GROUP_PERSON, "person.alice")).count == 2
+    assert aggregates.stats((GROUP_PERSON, "person.bob")).count == 0
+
+    aggregates.update("a", None)
+    assert aggregates.stats(HOME_KEY).count == 1
+    assert aggregates.stats(HOME_KEY).average == 100.0
+
+
+def test_urgency_uses_time_to_zero():
+    aggregates = HashAggregates()
+    # Cleaned earlier, but with a longer interval, so it reaches zero later
+    aggregates.update(
+        "a", _snapshot(50.0, last_cleaned="2026-01-01T00:00:00+00:00", interval_days=30)
+    )
+    aggregates.update(
+        "b", _snapshot(50.0, last_cleaned="2026-01-10T00:00:00+00:00", interval_days=7)
+    )
+    assert aggregates.most_urgent(HOME_KEY, 5) == ["b", "a"]
+    assert aggregates.most_urgent((GROUP_AREA, "missing"), 5) == []
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_home_sensor(hass: HomeAssistant, mock_config_entry_two_chores):
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][
+        mock_config_entry_two_chores.entry_id
+    ]
+    state = hass.states.get("sensor.hash_cleaning_hub_home_cleanliness")
+    assert float(state.state) == 0.0
+    assert state.attributes["overdue_chores"] == 2
+    assert state.attributes["chore_count"] == 2
+
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    await hass.async_block_till_done()
+    state = hass.states.get("sensor.hash_cleaning_hub_home_cleanliness")
+    assert float(state.state) == 50.0
+    assert state.attributes["overdue_chores"] == 1
+    assert state.attributes["worst_chore_id"] == MOCK_CHORE_ID_2
+
+    state = hass.states.get("sensor.hash_cleaning_hub_most_urgent_chores")
+    ids = [chore["chore_id"] for chore in state.attributes["chores"]]
+    assert ids == [MOCK_CHORE_ID_2, MOCK_CHORE_ID]
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_urgent_chores_service(hass: HomeAssistant, mock_config_entry_two_chores):
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.services.async_call(
+        DOMAIN, SERVICE_URGENT_CHORES, {"limit": 1}, blocking=True, return_response=True
+    )
+    assert len(result["chores"]) == 1
+    assert result["chores"][0]["cleanliness"] == 0.0
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_URGENT_CHORES,
+        {"area_id": "nowhere"},
+        blocking=True,
+        return_response=True,
+    )
+    assert result == {"chores": []}
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_group_urgent_chores_sensors(
+    hass: HomeAssistant, mock_config_entry_two_chores
+):
+    hass.states.async_set("person.alice", "home")
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    # The only person is assigned both chores
+    state = hass.states.get("sensor.hash_cleaning_hub_alice_most_urgent_chores")
+    assert {chore["chore_id"] for chore in state.attributes["chores"]} == {
+        MOCK_CHORE_ID,
+        MOCK_CHORE_ID_2,
+    }
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor",
+        DOMAIN,
+        f"{mock_config_entry_two_chores.entry_id}_urgent_chores_area_kitchen",
+    )
+    assert entity_id == "sensor.hash_cleaning_hub_kitchen_most_urgent_chores"
+    state = hass.states.get(entity_id)
+    assert state.state == "Mop Kitchen"
+    assert [chore["chore_id"] for chore in state.attributes["chores"]] == [
+        MOCK_CHORE_ID_2
+    ]
@@ -0,0 +1,105 @@
+"""Tests for the assignment module."""
+
+from __future__ import annotations
+
+from unittest.mock import Mock
+
+from custom_components.hash.assignment import ChoreShare, FairShareAssigner
+
+ALICE = "person.alice"
+BOB = "person.bob"
+CAROL = "person.carol"
+
+
+def _no_credit() -> dict[str, float]:
+    return {}
+
+
+def test_balances_effort():
+    assigner = FairShareAssigner()
+    chores = {
+        "big": ChoreShare(5),
+        "medium": ChoreShare(3),
+        "small1": ChoreShare(1),
+        "small2": ChoreShare(1),
+    }
+    placed = assigner.update(chores, [ALICE, BOB], _no_credit)
+
+    assert placed == set(chores)
+    assert assigner.assignee("big") != assigner.assignee("medium")
+    assert assigner.held(ALICE) == assigner.held(BOB) == 5
+
+
+def test_pinned_chores_count_toward_load():
+    assigner = FairShareAssigner()
+    chores = {"pinned": ChoreShare(4, ALICE), "shared": ChoreShare(2)}
+    assigner.update(chores, [ALICE, BOB], _no_credit)
+
+    assert assigner.assignee("pinned") == ALICE
+    assert assigner.assignee("shared") == BOB
+
+
+def test_credit_favours_those_who_did_less():
+    assigner = FairShareAssigner()
+    assigner.update({"chore": ChoreShare(1)}, [ALICE, BOB], lambda: {ALICE: 3})
+    assert assigner.assignee("chore") == BOB
+
+
+def test_cached_until_something_changes():
+    assigner = FairShareAssigner()
+    chores = {"a": ChoreShare(1), "b": ChoreShare(1)}
+    assigner.update(chores, [ALICE, BOB], _no_credit)
+
+    credit = Mock(return_value={})
+    assert assigner.update(chores, [ALICE, BOB], credit) == set()
+    credit.assert_not_called()
+
+    assigner.release("a")
+    assert assigner.update(chores, [ALICE, BOB], credit) == {"a"}
+    credit.assert_called_once()
+
+
+def test_roster_change_only_moves_affected_chores():
+    assigner = FairShareAssigner()
+    chores = {f"c{i}": ChoreShare(1) for i in range(6)}
+    assigner.update(chores, [ALICE, BOB, CAROL], _no_credit)
+    before = {chore_id: assigner.assignee(chore_id) for chore_id in chores}
+
+    placed = assigner.update(chores, [ALICE, BOB], _no_credit)
+
+    assert placed == {c for c, person in before.items() if person == CAROL}
+    for chore_id, person in before.items():
+        if person != CAROL:
+            assert assigner.assignee(chore_id) == person
+    assert assigner.held(ALICE) == assigner.held(BOB) == 3
+    assert assigner.held(CAROL) == 0
+
+
+def test_vacation_of_pinned_person():
+    assigner = FairShareAssigner()
+    assigner.update({"pinned": ChoreShare(2, ALICE)}, [ALICE, BOB], _no_credit)
+
+    # The pin is lifted while the pinned person is on vacation
+    assigner.update({"pinned": ChoreShare(2)}, [BOB], _no_credit)
+    assert assigner.assignee("pinned") == BOB
+
+    assigner.update({"pinned": ChoreShare(2, ALICE)}, [ALICE, BOB], _no_credit)
+    assert assigner.assignee("pinned") == ALICE
+    assert assigner.held(BOB) == 0
+
+
+def test_hints_keep_earlier_assignments():
+    assigner = FairShareAssigner()
+    chores = {"a": ChoreShare(1), "b": ChoreShare(1)}
+    assigner.update(chores, [ALICE, BOB], _no_credit, {"a": BOB, "b": BOB})
+    assert assigner.assignee("a") == assigner.assignee("b") == BOB
+
+    assigner.release("a")
+    assigner.update(chores, [ALICE, BOB], _no_credit, {"a": CAROL})
+    assert assigner.assignee("a") == ALICE
+
+
+def test_nobody_active():
+    assigner = FairShareAssigner()
+    assigner.update({"chore": ChoreShare(1)}, [], _no_credit)
+    assert assigner.assignee("chore") is None
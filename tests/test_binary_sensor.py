@@ -0,0 +1,98 @@
+"""Tests for the binary sensor platform."""
+
+from __future__ import annotations
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hash.binary_sensor import overdue_at
+from custom_components.hash.const import DOMAIN
+from custom_components.hash.coordinator import HashCoordinator
+
+from .conftest import MOCK_CHORE_ID_2
+
+CHORE_ENTITY = "binary_sensor.hash_cleaning_hub_mop_kitchen_overdue"
+PERSON_ENTITY = "binary_sensor.hash_cleaning_hub_alice_has_overdue_chores"
+
+
+def test_overdue_at():
+    assert overdue_at({"next_due": None}) is None
+    deadline = overdue_at({"next_due": "2026-03-14"})
+    assert deadline == dt_util.start_of_local_day(datetime.date(2026, 3, 15))
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_overdue_flips_at_deadline(
+    hass: HomeAssistant, mock_config_entry_two_chores, freezer
+):
+    hass.states.async_set("person.alice", "home")
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    # New chores are due today and become overdue at the next local midnight
+    state = hass.states.get(CHORE_ENTITY)
+    assert state.state == STATE_OFF
+    assert hass.states.get(PERSON_ENTITY).state == STATE_OFF
+    deadline = dt_util.parse_datetime(state.attributes["overdue_at"])
+
+    freezer.move_to(deadline + datetime.timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get(CHORE_ENTITY).state == STATE_ON
+    assert hass.states.get(PERSON_ENTITY).state == STATE_ON
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][
+        mock_config_entry_two_chores.entry_id
+    ]
+    await coordinator.async_complete_chore(MOCK_CHORE_ID_2)
+    await hass.async_block_till_done()
+    state = hass.states.get(CHORE_ENTITY)
+    assert state.state == STATE_OFF
+    assert dt_util.parse_datetime(state.attributes["overdue_at"]) > dt_util.utcnow()
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_person_overdue_uses_friendly_name(
+    hass: HomeAssistant, mock_config_entry_two_chores
+):
+    hass.states.async_set("person.alice", "home", {"friendly_name": "Alice Liddell"})
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get(
+        "binary_sensor.hash_cleaning_hub_alice_liddell_has_overdue_chores"
+    )
+    assert state.name == "HASH Cleaning Hub Alice Liddell has overdue chores"
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_refresh_keeps_unchanged_deadline_timers(
+    hass: HomeAssistant, mock_config_entry_two_chores
+):
+    hass.states.async_set("person.alice", "home")
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][
+        mock_config_entry_two_chores.entry_id
+    ]
+    with patch(
+        "custom_components.hash.binary_sensor.async_track_point_in_utc_time"
+    ) as track:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        track.assert_not_called()
+
+        await coordinator.async_complete_chore(MOCK_CHORE_ID_2)
+        await hass.async_block_till_done()
+    # Only the chore's sensor moves; Alice's next deadline is her other chore's
+    assert track.call_count == 1
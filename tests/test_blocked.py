@@ -0,0 +1,105 @@
+"""Tests for the blocked module."""
+
+from __future__ import annotations
+
+import datetime
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.hash.blocked import BlockedDays, event_range
+
+DAY = datetime.timedelta(days=1)
+START = datetime.date(2027, 1, 4)
+
+
+def _days(first: int, last: int) -> tuple[datetime.date, datetime.date]:
+    return START + first * DAY, START + last * DAY
+
+
+def test_ranges_merge_and_bisect():
+    blocked = BlockedDays()
+    blocked.update(*_days(0, 30), [_days(2, 4), _days(10, 12), _days(4, 6)])
+
+    assert len(blocked) == 2
+    assert START + 2 * DAY in blocked
+    assert START + 5 * DAY in blocked
+    assert START + 6 * DAY not in blocked
+    assert START + 11 * DAY in blocked
+    assert blocked.next_open(START + 3 * DAY) == START + 6 * DAY
+    assert blocked.next_open(START) == START
+
+
+def test_overlap_bridges_ranges():
+    blocked = BlockedDays()
+    blocked.update(*_days(0, 30), [_days(2, 4), _days(8, 10), _days(3, 9)])
+
+    assert len(blocked) == 1
+    assert blocked.next_open(START + 2 * DAY) == START + 10 * DAY
+
+
+def test_only_delta_is_missing():
+    blocked = BlockedDays()
+    assert blocked.missing(*_days(0, 35)) == _days(0, 35)
+    blocked.update(*_days(0, 35), [])
+
+    assert blocked.missing(*_days(0, 35)) is None
+    # The horizon moved on by a day
+    blocked.prune(START + DAY)
+    assert blocked.missing(*_days(1, 36)) == _days(35, 36)
+
+
+def test_version_tracks_changes():
+    blocked = BlockedDays()
+    blocked.update(*_days(0, 35), [])
+    assert blocked.version == 0
+
+    assert blocked.update(*_days(35, 36), [_days(35, 36)])
+    assert blocked.version == 1
+    # Already known days change nothing
+    assert not blocked.update(*_days(36, 37), [_days(35, 36)])
+    assert blocked.version == 1
+
+
+def test_prune_drops_past_ranges():
+    blocked = BlockedDays()
+    blocked.update(*_days(0, 35), [_days(1, 3), _days(10, 12)])
+    blocked.prune(START + 5 * DAY)
+
+    assert len(blocked) == 1
+    assert START + 11 * DAY in blocked
+
+
+def test_expired_span_is_fetched_again(freezer):
+    freezer.move_to("2027-01-04 08:00:00+00:00")
+    blocked = BlockedDays()
+    blocked.update(*_days(0, 35), [_days(2, 4)])
+    blocked.expire(dt_util.utcnow())
+    assert blocked.missing(*_days(0, 35)) is None
+
+    freezer.tick(datetime.timedelta(hours=2))
+    blocked.expire(dt_util.utcnow() - datetime.timedelta(hours=1))
+    assert blocked.missing(*_days(0, 35)) == _days(0, 35)
+    # The same days again are no change
+    assert not blocked.update(*_days(0, 35), [_days(2, 4)])
+    assert blocked.version == 1
+
+    blocked.expire(dt_util.utcnow() + DAY)
+    assert blocked.update(*_days(0, 35), [_days(20, 22)])
+    assert blocked.version == 2
+    assert START + 2 * DAY not in blocked
+    assert START + 20 * DAY in blocked
+
+
+def test_event_range():
+    # All-day events end on the day after
+    assert event_range({"start": "2027-01-04", "end": "2027-01-06"}) == (
+        START,
+        START + 2 * DAY,
+    )
+    # Timed events block every day they touch
+    assert event_range(
+        {"start": "2027-01-04T18:00:00+00:00", "end": "2027-01-05T10:00:00+00:00"}
+    ) == (START, START + 2 * DAY)
+    assert event_range(
+        {"start": "2027-01-04T18:00:00+00:00", "end": "2027-01-05T00:00:00+00:00"}
+    ) == (START, START + DAY)
@@ -32,6 +32,33 @@ class TestBuildEvents:
         assert events[0].start == datetime.date(2025, 2, 1)
         assert events[0].end == datetime.date(2025, 2, 2)
 
+    def test_schedule_events(self):
+        data = {
+            "chore1": {
+                "name": "Vacuum",
+                "room": "Living Room",
+                "assigned_to": "person.alice",
+                "next_due": "2025-02-01",
+            }
+        }
+        schedule = {
+            "chore1": [
+                datetime.date(2025, 2, 1),
+                datetime.date(2025, 2, 15),
+                datetime.date(2025, 3, 1),
+            ]
+        }
+        events = _build_events(
+            data,
+            datetime.date(2025, 1, 1),
+            datetime.date(2025, 3, 1),
+            planned=schedule.__getitem__,
+        )
+        assert [event.start for event in events] == [
+            datetime.date(2025, 2, 1),
+            datetime.date(2025, 2, 15),
+        ]
+
     def test_event_out_of_range(self):
         data = {
             "chore1": {
@@ -9,15 +9,23 @@ from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
 
 from custom_components.hash.const import (
+    CONF_BLACKOUT_DAYS,
     CONF_CHORE_ID,
     CONF_CHORE_NAME,
     CONF_CHORES,
+    CONF_DAILY_BUDGET,
+    CONF_DECAY,
+    CONF_DECAY_POINTS,
     CONF_GLOBAL_PAUSE,
     CONF_INTERVAL,
     CONF_INTERVAL_PRESET,
+    CONF_MAX_SHIFT_DAYS,
+    CONF_MIN_CLEANLINESS_DELTA,
+    CONF_PREFERRED_DAYS,
     CONF_ROOM,
     CONF_VACATION_PERSONS,
     DOMAIN,
+    WEEKDAY_LABELS,
 )
 
 
@@ -70,6 +78,44 @@ async def test_options_flow_add_chore(hass: HomeAssistant, mock_config_entry):
     assert result["step_id"] == "init"
 
 
+async def test_options_flow_add_chore_invalid_decay_points(
+    hass: HomeAssistant, mock_config_entry
+):
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.hash.async_setup_entry", return_value=True):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"action": "add_chore"}
+    )
+    user_input = {
+        CONF_CHORE_NAME: "Clean Oven",
+        CONF_INTERVAL_PRESET: "4_weeks",
+        CONF_DECAY: "piecewise",
+        CONF_DECAY_POINTS: "80:90, 50:20",
+    }
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert result["step_id"] == "add_chore"
+    assert result["errors"] == {CONF_DECAY_POINTS: "invalid_decay_points"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={**user_input, CONF_DECAY_POINTS: "50:90"}
+    )
+    assert result["step_id"] == "init"
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"action": "done"}
+    )
+    chore = mock_config_entry.options[CONF_CHORES][-1]
+    assert chore[CONF_DECAY] == "piecewise"
+    assert chore[CONF_DECAY_POINTS] == "50:90"
+
+
 async def test_options_flow_add_chore_custom_interval(
     hass: HomeAssistant, mock_config_entry
 ):
@@ -170,3 +216,52 @@ async def test_options_flow_done_saves(hass: HomeAssistant, mock_config_entry):
         result["flow_id"], user_input={"action": "done"}
     )
     assert result["type"] is FlowResultType.CREATE_ENTRY
+
+
+async def test_options_flow_settings_saved(hass: HomeAssistant, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+
+    with patch("custom_components.hash.async_setup_entry", return_value=True):
+        await hass.config_entries.async_setup(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"action": "settings"}
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "settings"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_MIN_CLEANLINESS_DELTA: 2.5,
+            CONF_DAILY_BUDGET: 2,
+            CONF_BLACKOUT_DAYS: list(WEEKDAY_LABELS),
+        },
+    )
+    assert result["step_id"] == "settings"
+    assert result["errors"] == {CONF_BLACKOUT_DAYS: "all_days_blacked_out"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            CONF_MIN_CLEANLINESS_DELTA: 2.5,
+            CONF_DAILY_BUDGET: 2,
+            CONF_PREFERRED_DAYS: ["tue", "sat"],
+            CONF_BLACKOUT_DAYS: ["sun"],
+        },
+    )
+    assert result["step_id"] == "init"
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={"action": "done"}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options[CONF_MIN_CLEANLINESS_DELTA] == 2.5
+    assert mock_config_entry.options[CONF_DAILY_BUDGET] == 2
+    assert mock_config_entry.options[CONF_PREFERRED_DAYS] == ["tue", "sat"]
+    assert mock_config_entry.options[CONF_MAX_SHIFT_DAYS] == 2
+    assert mock_config_entry.options[CONF_BLACKOUT_DAYS] == ["sun"]
+    assert len(mock_config_entry.options[CONF_CHORES]) == 1
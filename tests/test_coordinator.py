@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import datetime
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
 from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from custom_components.hash.const import CONF_GLOBAL_PAUSE
+from custom_components.hash.const import (
+    ASSIGNMENT_FAIR_SHARE,
+    BLOCKED_MAX_AGE_MINUTES,
+    CONF_ASSIGNMENT_MODE,
+    CONF_BLOCKED_CALENDARS,
+    CONF_GLOBAL_PAUSE,
+)
 from custom_components.hash.coordinator import (
     HashCoordinator,
     calculate_cleanliness,
+    calculate_threshold_times,
     get_interval_display,
     get_status,
 )
+from custom_components.hash.decay import decay_curve
 
-from .conftest import MOCK_CHORE_ID
+from .conftest import MOCK_CHORE_ID, MOCK_CHORE_ID_2
 
 
 class TestCalculateCleanliness:
@@ -59,6 +68,37 @@ class TestCalculateCleanliness:
         assert result == 0.0
 
 
+class TestCalculateThresholdTimes:
+    """Tests for calculate_threshold_times."""
+
+    def test_thresholds_split_interval(self):
+        last = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+        times = calculate_threshold_times(last, 8)
+        assert times == {
+            "fine_at": "2025-01-03T12:00:00+00:00",
+            "dirty_at": "2025-01-05T12:00:00+00:00",
+            "urgent_at": "2025-01-07T12:00:00+00:00",
+            "empty_at": "2025-01-09T12:00:00+00:00",
+        }
+
+    def test_matches_cleanliness(self):
+        last = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+        times = calculate_threshold_times(last, 14)
+        for key, expected in (("fine_at", 75.0), ("urgent_at", 25.0)):
+            at = datetime.datetime.fromisoformat(times[key])
+            assert calculate_cleanliness(last, 14, at) == expected
+
+    def test_follows_decay_curve(self):
+        last = datetime.datetime(2025, 1, 1, 12, 0, 0, tzinfo=datetime.UTC)
+        curve = decay_curve("step")
+        times = calculate_threshold_times(last, 8, curve)
+        # Drops from 75% to 50% halfway through the interval
+        assert times["fine_at"] == "2025-01-05T12:00:00+00:00"
+        assert times["empty_at"] == "2025-01-09T12:00:00+00:00"
+        at = datetime.datetime.fromisoformat(times["dirty_at"])
+        assert calculate_cleanliness(last, 8, at, curve) == 25.0
+
+
 class TestGetStatus:
     """Tests for get_status."""
 
@@ -154,6 +194,119 @@ class TestCoordinator:
         await hass.async_block_till_done()
         assert runtime["rotation_index"] == 1
 
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_fair_share_reassigns_completed_chore(
+        self, hass: HomeAssistant, mock_config_entry_two_chores
+    ):
+        hass.states.async_set("person.alice", "home")
+        hass.states.async_set("person.bob", "home")
+        options = {
+            **mock_config_entry_two_chores.options,
+            CONF_ASSIGNMENT_MODE: ASSIGNMENT_FAIR_SHARE,
+        }
+        mock_config_entry_two_chores.add_to_hass(hass)
+        hass.config_entries.async_update_entry(
+            mock_config_entry_two_chores, options=options
+        )
+        coordinator = HashCoordinator(hass, mock_config_entry_two_chores)
+        await coordinator.async_load_store()
+        await coordinator.async_refresh()
+
+        # Alice holds the pinned chore, so the shared one goes to Bob
+        assert coordinator.data[MOCK_CHORE_ID_2]["assigned_to"] == "person.alice"
+        assert coordinator.data[MOCK_CHORE_ID]["assigned_to"] == "person.bob"
+        runtime = coordinator._ensure_runtime(MOCK_CHORE_ID)
+        assert runtime["assignee"] == "person.bob"
+
+        await coordinator.async_complete_chore(MOCK_CHORE_ID)
+        await hass.async_block_till_done()
+
+        # Bob's completion counts as load, so Alice gets the next round
+        assert runtime["completed_by_history"][-1]["person"] == "person.bob"
+        assert coordinator.data[MOCK_CHORE_ID]["assigned_to"] == "person.alice"
+        assert runtime["assignee"] == "person.alice"
+
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_blocked_calendar_moves_due_date(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        options = {
+            **mock_config_entry.options,
+            CONF_BLOCKED_CALENDARS: ["calendar.guests"],
+        }
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(mock_config_entry, options=options)
+        coordinator = HashCoordinator(hass, mock_config_entry)
+        await coordinator.async_load_store()
+        runtime = coordinator._ensure_runtime(MOCK_CHORE_ID, 14)
+        runtime["last_cleaned"] = (
+            dt_util.utcnow() - datetime.timedelta(days=9)
+        ).isoformat()
+        today = dt_util.now().date()
+        day = datetime.timedelta(days=1)
+
+        with patch(
+            "custom_components.hash.coordinator.async_fetch_blocked",
+            AsyncMock(return_value=[(today + 3 * day, today + 12 * day)]),
+        ) as fetch:
+            await coordinator.async_refresh()
+            await coordinator.async_refresh()
+
+        # Due in 5 days, but nothing is open before the guests leave
+        assert coordinator.data[MOCK_CHORE_ID]["next_due"] == (
+            (today + 12 * day).isoformat()
+        )
+        # The horizon was fetched once
+        fetch.assert_awaited_once()
+        assert fetch.await_args.args[1:] == (
+            ["calendar.guests"],
+            today,
+            today + datetime.timedelta(weeks=5),
+        )
+
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_blocked_calendar_changes_are_picked_up(
+        self, hass: HomeAssistant, mock_config_entry, freezer
+    ):
+        options = {
+            **mock_config_entry.options,
+            CONF_BLOCKED_CALENDARS: ["calendar.guests"],
+        }
+        mock_config_entry.add_to_hass(hass)
+        hass.config_entries.async_update_entry(mock_config_entry, options=options)
+        coordinator = HashCoordinator(hass, mock_config_entry)
+        await coordinator.async_load_store()
+        runtime = coordinator._ensure_runtime(MOCK_CHORE_ID, 14)
+        runtime["last_cleaned"] = (
+            dt_util.utcnow() - datetime.timedelta(days=9)
+        ).isoformat()
+        today = dt_util.now().date()
+        day = datetime.timedelta(days=1)
+
+        with patch(
+            "custom_components.hash.coordinator.async_fetch_blocked",
+            AsyncMock(return_value=[(today + 3 * day, today + 12 * day)]),
+        ):
+            await coordinator.async_refresh()
+        assert coordinator.data[MOCK_CHORE_ID]["next_due"] == (
+            (today + 12 * day).isoformat()
+        )
+
+        # The guests cancelled; once the fetch has expired the whole horizon
+        # is fetched again
+        freezer.tick(datetime.timedelta(minutes=BLOCKED_MAX_AGE_MINUTES + 1))
+        with patch(
+            "custom_components.hash.coordinator.async_fetch_blocked",
+            AsyncMock(return_value=[]),
+        ) as fetch:
+            await coordinator.async_refresh()
+
+        fetch.assert_awaited_once()
+        assert fetch.await_args.args[2] == dt_util.now().date()
+        assert coordinator.data[MOCK_CHORE_ID]["next_due"] != (
+            (today + 12 * day).isoformat()
+        )
+
     @pytest.mark.usefixtures("bypass_store")
     async def test_reset_chore_does_not_advance_rotation(
         self, hass: HomeAssistant, mock_config_entry
@@ -203,3 +356,76 @@ class TestCoordinator:
 
         await coordinator.async_cleanup_removed_chores()
         assert "orphan-chore" not in coordinator._runtime_data
+
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_chore_snapshot(self, hass: HomeAssistant, mock_config_entry):
+        mock_config_entry.add_to_hass(hass)
+        coordinator = HashCoordinator(hass, mock_config_entry)
+        await coordinator.async_load_store()
+
+        runtime = coordinator._ensure_runtime(MOCK_CHORE_ID)
+        runtime["last_cleaned"] = datetime.datetime.now(tz=datetime.UTC).isoformat()
+
+        snapshot = coordinator.async_get_chore_snapshot(MOCK_CHORE_ID)
+        assert snapshot is not None
+        assert snapshot["chore_id"] == MOCK_CHORE_ID
+        assert snapshot["cleanliness"] > 99
+        assert coordinator.async_get_chore_snapshot("missing") is None
+
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_update_chore_notifies_only_its_listeners(
+        self, hass: HomeAssistant, mock_config_entry_two_chores
+    ):
+        mock_config_entry_two_chores.add_to_hass(hass)
+        coordinator = HashCoordinator(hass, mock_config_entry_two_chores)
+        await coordinator.async_load_store()
+        await coordinator.async_refresh()
+        previous = coordinator.data
+
+        updated: list[tuple[str, str | None]] = []
+        coordinator.async_add_chore_listener(
+            lambda chore_id: updated.append((chore_id, MOCK_CHORE_ID)), MOCK_CHORE_ID
+        )
+        remove = coordinator.async_add_chore_listener(
+            lambda chore_id: updated.append((chore_id, MOCK_CHORE_ID_2)),
+            MOCK_CHORE_ID_2,
+        )
+        coordinator.async_add_chore_listener(
+            lambda chore_id: updated.append((chore_id, None))
+        )
+
+        await coordinator.async_complete_chore(MOCK_CHORE_ID)
+        assert updated == [(MOCK_CHORE_ID, MOCK_CHORE_ID), (MOCK_CHORE_ID, None)]
+        assert coordinator.data[MOCK_CHORE_ID]["cleanliness"] > 99
+        # Unchanged chores keep their snapshot
+        assert coordinator.data[MOCK_CHORE_ID_2] is previous[MOCK_CHORE_ID_2]
+        assert previous[MOCK_CHORE_ID] is not coordinator.data[MOCK_CHORE_ID]
+
+        remove()
+        updated.clear()
+        await coordinator.async_reset_chore(MOCK_CHORE_ID_2)
+        assert updated == [(MOCK_CHORE_ID_2, None)]
+
+    @pytest.mark.usefixtures("bypass_store")
+    async def test_chore_listener_may_remove_itself(
+        self, hass: HomeAssistant, mock_config_entry
+    ):
+        mock_config_entry.add_to_hass(hass)
+        coordinator = HashCoordinator(hass, mock_config_entry)
+        await coordinator.async_load_store()
+        await coordinator.async_refresh()
+
+        updated: list[str] = []
+
+        def once(chore_id: str) -> None:
+            updated.append("once")
+            remove()
+
+        remove = coordinator.async_add_chore_listener(once, MOCK_CHORE_ID)
+        coordinator.async_add_chore_listener(
+            lambda chore_id: updated.append("always"), MOCK_CHORE_ID
+        )
+
+        await coordinator.async_complete_chore(MOCK_CHORE_ID)
+        await coordinator.async_reset_chore(MOCK_CHORE_ID)
+        assert updated == ["once", "always", "always"]
@@ -0,0 +1,95 @@
+"""Tests for the decay module."""
+
+from __future__ import annotations
+
+import pytest
+
+from custom_components.hash.decay import (
+    LINEAR,
+    ExponentialDecay,
+    PiecewiseDecay,
+    StepDecay,
+    decay_curve,
+    parse_points,
+)
+
+CURVES = [
+    LINEAR,
+    ExponentialDecay(),
+    StepDecay(),
+    PiecewiseDecay(((0.6, 85.0), (0.85, 50.0))),
+]
+
+
+@pytest.mark.parametrize("curve", CURVES, ids=lambda c: c.kind)
+def test_curves_span_the_interval(curve):
+    assert curve(0.0) == 100.0
+    assert curve(1.0) == 0.0
+    assert curve(1.5) == 0.0
+    assert curve.crossing(0) == 1.0
+
+
+@pytest.mark.parametrize("curve", CURVES, ids=lambda c: c.kind)
+@pytest.mark.parametrize("threshold", [75, 50, 25])
+def test_crossing_inverts_value(curve, threshold):
+    fraction = curve.crossing(threshold)
+
+    assert curve(fraction - 1e-6) >= threshold - 1e-3
+    assert curve(fraction + 1e-6) < threshold
+
+
+@pytest.mark.parametrize("curve", CURVES, ids=lambda c: c.kind)
+def test_integral_matches_numeric(curve):
+    steps = 10_000
+    numeric = sum(curve((i + 0.5) / steps) for i in range(steps)) / steps
+
+    assert curve.area(0.0, 1.0) == pytest.approx(numeric, abs=0.01)
+    assert curve.area(0.0, 3.0) == curve.area(0.0, 1.0)
+    assert curve.area(0.2, 0.7) == pytest.approx(
+        curve.area(0.0, 0.7) - curve.area(0.0, 0.2)
+    )
+
+
+def test_linear_area():
+    assert LINEAR.area(0.0, 1.0) == 50.0
+
+
+def test_exponential_drops_early():
+    curve = ExponentialDecay()
+
+    assert curve(0.25) < LINEAR(0.25)
+    assert curve.crossing(75) < LINEAR.crossing(75)
+
+
+def test_step_holds_between_drops():
+    curve = StepDecay(4)
+
+    assert curve(0.1) == curve(0.24) == 100.0
+    assert curve(0.3) == 75.0
+    # 75% still counts as Great, so Fine starts at the next drop
+    assert curve.crossing(75) == 0.5
+
+
+def test_piecewise_plateau():
+    curve = PiecewiseDecay(((0.5, 100.0),))
+
+    assert curve(0.4) == 100.0
+    assert curve.crossing(100) == 0.5
+    assert curve.crossing(50) == 0.75
+
+
+def test_parse_points():
+    assert parse_points("60:85, 85:50") == ((0.6, 85.0), (0.85, 50.0))
+    assert parse_points("") == ()
+
+
+@pytest.mark.parametrize("text", ["60", "abc:10", "60:85, 50:40", "30:50, 60:70"])
+def test_parse_points_rejects(text):
+    with pytest.raises(ValueError):
+        parse_points(text)
+
+
+def test_decay_curve_is_shared():
+    assert decay_curve(None) is LINEAR
+    assert decay_curve("exponential") is decay_curve("exponential")
+    assert decay_curve("piecewise", "50:50")(0.5) == 50.0
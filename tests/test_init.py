@@ -2,22 +2,30 @@
 
 from __future__ import annotations
 
+import datetime
+
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.util import dt as dt_util
 
 from custom_components.hash.const import (
     CONF_CHORE_ID,
     CONF_GLOBAL_PAUSE,
     CONF_VACATION_PERSONS,
     DOMAIN,
+    SERVICE_CANCEL_VACATION,
     SERVICE_COMPLETE_CHORE,
+    SERVICE_FORECAST,
+    SERVICE_PROFILE,
     SERVICE_RESET_CHORE,
+    SERVICE_SCHEDULE_VACATION,
     SERVICE_SET_GLOBAL_PAUSE,
     SERVICE_SET_VACATION,
 )
 from custom_components.hash.coordinator import HashCoordinator
 
-from .conftest import MOCK_CHORE_ID
+from .conftest import MOCK_CHORE_ID, MOCK_CHORE_ID_2
 
 
 @pytest.mark.usefixtures("bypass_store")
@@ -42,8 +50,12 @@ async def test_services_registered(hass: HomeAssistant, mock_config_entry):
     await hass.async_block_till_done()
 
     assert hass.services.has_service(DOMAIN, SERVICE_COMPLETE_CHORE)
+    assert hass.services.has_service(DOMAIN, SERVICE_FORECAST)
+    assert hass.services.has_service(DOMAIN, SERVICE_PROFILE)
     assert hass.services.has_service(DOMAIN, SERVICE_RESET_CHORE)
     assert hass.services.has_service(DOMAIN, SERVICE_SET_VACATION)
+    assert hass.services.has_service(DOMAIN, SERVICE_SCHEDULE_VACATION)
+    assert hass.services.has_service(DOMAIN, SERVICE_CANCEL_VACATION)
     assert hass.services.has_service(DOMAIN, SERVICE_SET_GLOBAL_PAUSE)
 
 
@@ -114,6 +126,48 @@ async def test_service_set_vacation(hass: HomeAssistant, mock_config_entry):
     assert "person.alice" not in mock_config_entry.options[CONF_VACATION_PERSONS]
 
 
+@pytest.mark.usefixtures("bypass_store")
+async def test_service_schedule_vacation(hass: HomeAssistant, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    today = dt_util.now().date()
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SCHEDULE_VACATION,
+        {"person_entity_id": "person.alice", "start": today, "end": today},
+        blocking=True,
+    )
+
+    # The end day is included
+    (vacation,) = coordinator.vacations
+    assert vacation.end - vacation.start == datetime.timedelta(days=1)
+    assert coordinator.vacation_list() == ["person.alice"]
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_SCHEDULE_VACATION,
+            {
+                "person_entity_id": "person.bob",
+                "start": today,
+                "end": today - datetime.timedelta(days=1),
+            },
+            blocking=True,
+        )
+
+    await hass.services.async_call(
+        DOMAIN,
+        SERVICE_CANCEL_VACATION,
+        {"person_entity_id": "person.alice"},
+        blocking=True,
+    )
+    assert coordinator.vacations == []
+    assert coordinator.vacation_list() == []
+
+
 @pytest.mark.usefixtures("bypass_store")
 async def test_service_set_global_pause(hass: HomeAssistant, mock_config_entry):
     mock_config_entry.add_to_hass(hass)
@@ -128,3 +182,38 @@ async def test_service_set_global_pause(hass: HomeAssistant, mock_config_entry):
     )
 
     assert mock_config_entry.options[CONF_GLOBAL_PAUSE] is True
+
+
+async def test_service_forecast(hass: HomeAssistant, mock_config_entry_two_chores):
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    at = dt_util.utcnow() + datetime.timedelta(days=400)
+    result = await hass.services.async_call(
+        DOMAIN, SERVICE_FORECAST, {"at": at}, blocking=True, return_response=True
+    )
+    assert result["at"] == at.isoformat()
+    assert set(result["chores"]) == {MOCK_CHORE_ID, MOCK_CHORE_ID_2}
+    assert all(
+        chore == {"name": chore["name"], "cleanliness": 0.0, "status": "Urgent"}
+        for chore in result["chores"].values()
+    )
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FORECAST,
+        {"at": at, "area_id": "kitchen"},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(result["chores"]) == [MOCK_CHORE_ID_2]
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_FORECAST,
+        {"at": at, "chore_ids": [MOCK_CHORE_ID]},
+        blocking=True,
+        return_response=True,
+    )
+    assert list(result["chores"]) == [MOCK_CHORE_ID]
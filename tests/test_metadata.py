@@ -0,0 +1,76 @@
+"""Tests for the dashboard metadata cache."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import area_registry as ar
+
+from custom_components.hash.metadata import async_get_metadata
+
+
+def _user(user_id: str, name: str) -> MagicMock:
+    user = MagicMock()
+    user.id = user_id
+    user.name = name
+    return user
+
+
+async def test_person_lookup(hass: HomeAssistant):
+    hass.states.async_set(
+        "person.alice", "home", {"friendly_name": "Alice", "user_id": "user-a"}
+    )
+    hass.states.async_set("person.bob", "home", {"friendly_name": "Bob"})
+    metadata = async_get_metadata(hass)
+
+    assert metadata.async_person_for_user(_user("user-a", "Someone")) == (
+        "person.alice"
+    )
+    # Falls back to name matching when no person is linked to the user
+    assert metadata.async_person_for_user(_user("user-b", "bob")) == "person.bob"
+    assert metadata.async_person_for_user(_user("user-c", "Carol")) is None
+    assert metadata.async_person_for_user(None) is None
+
+
+async def test_version_bumps_on_registry_changes(hass: HomeAssistant):
+    hass.states.async_set("person.alice", "home", {"friendly_name": "Alice"})
+    metadata = async_get_metadata(hass)
+    version = metadata.version
+    assert metadata.async_as_dict(None)["persons"][0]["name"] == "Alice"
+
+    # Presence changes do not affect the lookup tables
+    hass.states.async_set("person.alice", "not_home", {"friendly_name": "Alice"})
+    await hass.async_block_till_done()
+    assert metadata.version == version
+
+    hass.states.async_set("person.alice", "not_home", {"friendly_name": "Alicia"})
+    await hass.async_block_till_done()
+    assert metadata.version == version + 1
+    assert metadata.persons[0]["name"] == "Alicia"
+
+    area = ar.async_get(hass).async_create("Kitchen")
+    await hass.async_block_till_done()
+    assert metadata.version == version + 2
+    assert metadata.areas[area.id] == "Kitchen"
+
+    metadata.async_shutdown()
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_metadata_stops_on_unload(hass: HomeAssistant, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    metadata = async_get_metadata(hass)
+    version = metadata.version
+
+    assert await hass.config_entries.async_reload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    assert async_get_metadata(hass) is not metadata
+
+    # The replaced cache no longer listens for changes
+    ar.async_get(hass).async_create("Kitchen")
+    await hass.async_block_till_done()
+    assert metadata.version == version
@@ -0,0 +1,70 @@
+"""Tests for panel asset delivery."""
+
+from __future__ import annotations
+
+import gzip
+
+from homeassistant.core import HomeAssistant
+from homeassistant.setup import async_setup_component
+
+from custom_components.hash.panel import (
+    CACHE_IMMUTABLE,
+    HashPanelView,
+    PanelAsset,
+    build_panel_asset,
+    select_encoding,
+)
+
+
+class TestSelectEncoding:
+    """Tests for select_encoding."""
+
+    VARIANTS = {"identity": b"", "gzip": b"", "br": b""}
+
+    def test_prefers_brotli(self):
+        assert select_encoding("gzip, deflate, br", self.VARIANTS) == "br"
+
+    def test_falls_back_to_gzip(self):
+        assert select_encoding("gzip", self.VARIANTS) == "gzip"
+        assert select_encoding("br;q=0, gzip", self.VARIANTS) == "gzip"
+        assert select_encoding("br", {"identity": b"", "gzip": b""}) == "identity"
+
+    def test_identity(self):
+        assert select_encoding("", self.VARIANTS) == "identity"
+        assert select_encoding("deflate", self.VARIANTS) == "identity"
+
+    def test_wildcard(self):
+        assert select_encoding("*", self.VARIANTS) == "br"
+
+
+def test_build_panel_asset(tmp_path):
+    script = tmp_path / "hash-panel.js"
+    script.write_text("console.log('hash');")
+
+    asset = build_panel_asset(script)
+    assert gzip.decompress(asset.variants["gzip"]) == script.read_bytes()
+    assert asset.digest in asset.url
+
+    script.write_text("console.log('changed');")
+    assert build_panel_asset(script).digest != asset.digest
+
+
+async def test_panel_view_headers(hass: HomeAssistant, hass_client_no_auth):
+    assert await async_setup_component(hass, "http", {})
+    body = b"console.log('hash');"
+    asset = PanelAsset("abc123", {"identity": body, "gzip": gzip.compress(body)})
+    hass.http.register_view(HashPanelView(asset))
+    client = await hass_client_no_auth()
+
+    resp = await client.get(asset.url, headers={"Accept-Encoding": "gzip"})
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == CACHE_IMMUTABLE
+    assert resp.headers["Content-Encoding"] == "gzip"
+    assert await resp.read() == body
+
+    resp = await client.get("/hash_panel/stale/hash-panel.js")
+    assert resp.status == 200
+    assert resp.headers["Cache-Control"] == "no-cache"
+
+    resp = await client.get(asset.url, headers={"If-None-Match": '"abc123"'})
+    assert resp.status == 304
@@ -0,0 +1,170 @@
+"""Tests for the planner module."""
+
+from __future__ import annotations
+
+import datetime
+
+from custom_components.hash.blocked import BlockedDays
+from custom_components.hash.planner import PlanItem, SchedulePlanner, plan_item
+from custom_components.hash.scheduler import DayRules
+
+# 2027-01-04 is a Monday
+TODAY = datetime.date(2027, 1, 4)
+THURSDAY = datetime.date(2027, 1, 7)
+SATURDAY = datetime.date(2027, 1, 9)
+
+
+def _planner(budget: int = 3, weeks: int = 4) -> SchedulePlanner:
+    return SchedulePlanner(budget, weeks)
+
+
+def test_unloaded_chore_follows_weekend_rule():
+    planner = _planner()
+    planner.update(
+        {
+            "thu": PlanItem(THURSDAY, 14, "person.alice"),
+            "mon": PlanItem(TODAY + datetime.timedelta(days=7), 14, "person.alice"),
+        },
+        TODAY,
+    )
+    assert planner.dates("thu")[0] == SATURDAY
+    assert planner.dates("mon")[0] == datetime.date(2027, 1, 11)
+
+
+def test_day_rules_per_chore():
+    planner = _planner()
+    planner.update(
+        {
+            # Preferred on Tuesday and Saturday, Friday is a blackout day
+            "tue": PlanItem(
+                TODAY, 28, "person.alice", rules=DayRules(frozenset({1, 5}))
+            ),
+            "fri": PlanItem(
+                THURSDAY + datetime.timedelta(days=1),
+                28,
+                "person.alice",
+                rules=DayRules(frozenset(), 0, frozenset({4})),
+            ),
+        },
+        TODAY - datetime.timedelta(days=1),
+    )
+    assert planner.dates("tue")[0] == datetime.date(2027, 1, 5)
+    assert planner.dates("fri")[0] == SATURDAY
+
+
+def test_blocked_days_are_skipped():
+    blocked = BlockedDays()
+    planner = SchedulePlanner(3, 4, blocked)
+    items = {"thu": PlanItem(THURSDAY, 28, "person.alice")}
+    planner.update(items, TODAY)
+    assert planner.dates("thu")[0] == SATURDAY
+
+    # Guests from Friday to Sunday; a changed calendar re-plans everything
+    blocked.update(
+        TODAY,
+        TODAY + datetime.timedelta(weeks=5),
+        [
+            (
+                SATURDAY - datetime.timedelta(days=1),
+                SATURDAY + datetime.timedelta(days=2),
+            )
+        ],
+    )
+    planner.update(items, TODAY)
+    assert planner.dates("thu")[0] == THURSDAY
+
+    # Nothing open within the shift: the first open day after
+    blocked.update(TODAY, TODAY, [(THURSDAY, SATURDAY)])
+    planner.update(items, TODAY)
+    assert planner.dates("thu")[0] == SATURDAY + datetime.timedelta(days=2)
+
+
+def test_budget_levels_weekend_pile_up():
+    planner = _planner(budget=2)
+    items = {f"c{i}": PlanItem(THURSDAY, 28, "person.alice") for i in range(4)}
+    planner.update(items, TODAY)
+
+    firsts = [planner.dates(chore_id)[0] for chore_id in sorted(items)]
+    assert firsts == [SATURDAY, SATURDAY, THURSDAY, THURSDAY]
+    assert planner.load("person.alice", SATURDAY) == 2
+
+
+def test_budget_is_per_person():
+    planner = _planner(budget=1)
+    planner.update(
+        {
+            "a": PlanItem(THURSDAY, 28, "person.alice"),
+            "b": PlanItem(THURSDAY, 28, "person.bob"),
+        },
+        TODAY,
+    )
+    assert planner.dates("a")[0] == SATURDAY
+    assert planner.dates("b")[0] == SATURDAY
+
+
+def test_shift_is_bounded():
+    planner = _planner(budget=1)
+    items = {f"c{i}": PlanItem(THURSDAY, 28, "person.alice") for i in range(5)}
+    planner.update(items, TODAY)
+
+    firsts = {planner.dates(chore_id)[0] for chore_id in items}
+    assert firsts == {THURSDAY, THURSDAY + datetime.timedelta(days=1), SATURDAY}
+
+
+def test_plan_covers_horizon():
+    planner = _planner(weeks=4)
+    planner.update({"weekly": PlanItem(datetime.date(2027, 1, 5), 7, "")}, TODAY)
+    assert planner.dates("weekly") == [
+        datetime.date(2027, 1, 5),
+        datetime.date(2027, 1, 12),
+        datetime.date(2027, 1, 19),
+        datetime.date(2027, 1, 26),
+    ]
+
+
+def test_overdue_stays_put():
+    planner = _planner(weeks=2)
+    overdue = datetime.date(2027, 1, 1)
+    planner.update({"late": PlanItem(overdue, 7, "")}, TODAY)
+    assert planner.dates("late") == [overdue, datetime.date(2027, 1, 11)]
+
+
+def test_update_item_leaves_other_chores():
+    planner = _planner(budget=1)
+    items = {f"c{i}": PlanItem(THURSDAY, 28, "person.alice") for i in range(3)}
+    planner.update(items, TODAY)
+    before = {chore_id: planner.dates(chore_id) for chore_id in items}
+
+    assert planner.update_item("c0", PlanItem(SATURDAY, 28, "person.alice"), TODAY)
+    for chore_id in ("c1", "c2"):
+        assert planner.dates(chore_id) == before[chore_id]
+    assert planner.load("person.alice", THURSDAY) == 1
+
+    assert not planner.update_item("c0", PlanItem(SATURDAY, 28, "person.alice"), TODAY)
+    assert planner.update_item("c0", None, TODAY)
+    assert planner.dates("c0") == []
+
+
+def test_update_only_replaces_changed():
+    planner = _planner()
+    items = {
+        "a": PlanItem(THURSDAY, 14, "person.alice"),
+        "b": PlanItem(THURSDAY, 14, "person.bob"),
+    }
+    planner.update(items, TODAY)
+    changed = planner.update(
+        {**items, "b": PlanItem(SATURDAY, 14, "person.bob")}, TODAY
+    )
+    assert changed == {"b"}
+    assert planner.update(items, TODAY + datetime.timedelta(days=1)) == {"a", "b"}
+
+
+def test_plan_item_from_snapshot():
+    snapshot = {
+        "next_due": "2027-01-07",
+        "interval_days": 14,
+        "assigned_to": None,
+        "effort": 1,
+    }
+    assert plan_item(snapshot) == PlanItem(THURSDAY, 14, "")
+    assert plan_item({**snapshot, "next_due": None}) is None
@@ -0,0 +1,129 @@
+"""Tests for the profiler module."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+import time
+
+import pytest
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import Unauthorized
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+
+from custom_components.hash.const import DOMAIN, SERVICE_PROFILE
+from custom_components.hash.coordinator import HashCoordinator
+from custom_components.hash.profiler import (
+    PROFILER_CPROFILE,
+    PROFILER_SAMPLING,
+    HashProfiler,
+)
+from custom_components.hash.stats import HashStats
+
+
+def _busy(seconds: float) -> None:
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.mark.parametrize(
+    ("sampling", "kind"), [(False, PROFILER_CPROFILE), (True, PROFILER_SAMPLING)]
+)
+async def test_profiles_only_the_next_calls(sampling: bool, kind: str):
+    stats = HashStats()
+    profiler = stats.profiler = HashProfiler(2, sampling)
+    assert profiler.kind == kind
+
+    # Store saves are not profiled on their own, but inside a command they are
+    with stats.timed("store_save"):
+        pass
+    with stats.timed("hash/complete_chore"), stats.timed("store_save"):
+        _busy(0.05)
+    assert not profiler.finished.is_set()
+    with stats.timed("refresh"):
+        _busy(0.01)
+    with stats.timed("refresh"):
+        pass
+    profiler.close()
+
+    assert profiler.finished.is_set()
+    assert profiler.calls == {"hash/complete_chore": 1, "refresh": 1}
+    functions = profiler.functions()
+    busy = next(row for row in functions if row["function"].endswith("(_busy)"))
+    assert busy["cumulative_ms"] >= 10
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_service_profile(hass: HomeAssistant, mock_config_entry, tmp_path):
+    hass.config.config_dir = str(tmp_path)
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    profile = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {"calls": 1, "duration": 10},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    while coordinator.stats.profiler is None:
+        await asyncio.sleep(0)
+    await coordinator.async_refresh()
+    result = await profile
+
+    assert result["profiler"] == PROFILER_CPROFILE
+    assert result["calls"] == {"refresh": 1}
+    assert result["functions"]
+    assert (tmp_path / result["file"].rpartition("/")[2]).exists()
+    assert coordinator.stats.profiler is None
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_service_profile_times_out(hass: HomeAssistant, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+
+    profile = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {"duration": 30},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    while coordinator.stats.profiler is None:
+        await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + datetime.timedelta(seconds=31))
+    result = await profile
+
+    # Nothing was called, so nothing was written
+    assert result["calls"] == {}
+    assert result["file"] is None
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_service_profile_requires_admin(
+    hass: HomeAssistant, mock_config_entry, hass_read_only_user
+):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    with pytest.raises(Unauthorized):
+        await hass.services.async_call(
+            DOMAIN,
+            SERVICE_PROFILE,
+            {},
+            blocking=True,
+            return_response=True,
+            context=Context(user_id=hass_read_only_user.id),
+        )
@@ -4,9 +4,15 @@ from __future__ import annotations
 
 import datetime
 
+import pytest
+
 from custom_components.hash.scheduler import (
+    WEEKEND_RULES,
+    DayRules,
     calculate_next_due,
+    day_rules,
     get_effective_assignee,
+    shift_table,
 )
 
 
@@ -73,6 +79,58 @@ class TestCalculateNextDue:
         assert result == datetime.date(2027, 1, 15)
 
 
+class TestDayRules:
+    """Tests for day rules and their shift tables."""
+
+    def test_weekend_table(self):
+        table = shift_table(WEEKEND_RULES)
+        # Thursday and Friday reach Saturday; Saturday stays
+        assert table[3] == (2, 0, 1)
+        assert table[4] == (1, 0, 2)
+        assert table[5][0] == 0
+        assert [entry[0] for entry in table] == [0, 0, 0, 2, 1, 0, 0]
+
+    def test_blackout_days_are_skipped(self):
+        # Nothing on Monday or Tuesday, no shift allowed
+        table = shift_table(DayRules(frozenset(), 0, frozenset({0, 1})))
+        assert table[0] == (2,)
+        assert table[1] == (1,)
+        assert table[2] == (0,)
+
+    def test_every_day_blacked_out(self):
+        with pytest.raises(ValueError):
+            shift_table(DayRules(blackout=frozenset(range(7))))
+
+    def test_table_is_compiled_once(self):
+        rules = DayRules(frozenset({1, 5}), 3)
+        assert shift_table(rules) is shift_table(DayRules(frozenset({1, 5}), 3))
+
+    def test_chore_days_replace_household_days(self):
+        settings = {
+            "preferred_days": ["sat", "sun"],
+            "max_shift_days": 3,
+            "blackout_days": ["wed"],
+        }
+        assert day_rules(settings) == DayRules(frozenset({5, 6}), 3, frozenset({2}))
+        assert day_rules(settings, {"preferred_days": ["tue"]}) == DayRules(
+            frozenset({1}), 3, frozenset({2})
+        )
+        assert day_rules({}) == WEEKEND_RULES
+
+    def test_next_due_uses_rules_and_today(self):
+        # 2027-01-04 + 14 = 2027-01-18 (Monday); Tuesday is preferred
+        last_cleaned = datetime.datetime(2027, 1, 4, 0, 0, 0)
+        rules = DayRules(frozenset({1}), 2)
+        today = datetime.date(2027, 1, 10)
+        assert calculate_next_due(
+            last_cleaned, 14, today=today, rules=rules
+        ) == datetime.date(2027, 1, 19)
+        # Already due by the given today
+        assert calculate_next_due(
+            last_cleaned, 14, today=datetime.date(2027, 1, 18), rules=rules
+        ) == datetime.date(2027, 1, 18)
+
+
 class TestGetEffectiveAssignee:
     """Tests for get_effective_assignee."""
 
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 import pytest
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
 
-from custom_components.hash.const import DOMAIN
+from custom_components.hash.const import DOMAIN, ICON_GREAT, ICON_URGENT
 from custom_components.hash.coordinator import HashCoordinator
+from custom_components.hash.sensor import STATS_SENSORS, HashChoreSensor
 
 from .conftest import MOCK_CHORE_ID
 
@@ -57,3 +61,146 @@ async def test_sensor_attributes_after_complete(hass: HomeAssistant, mock_config
     sensor = hash_sensors[0]
     # After completion, cleanliness should be very high
     assert float(sensor.state) > 99
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_sensor_skips_unchanged_writes(
+    hass: HomeAssistant, mock_config_entry, freezer
+):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    entity_id = hass.states.async_all("sensor")[0].entity_id
+    last_reported = hass.states.get(entity_id).last_reported
+    stamp = coordinator.chore_stamp(MOCK_CHORE_ID)
+    snapshot = coordinator.data[MOCK_CHORE_ID]
+
+    # A second later the (overdue) chore looks the same, so nothing is written
+    freezer.tick(1)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.chore_stamp(MOCK_CHORE_ID) == stamp
+    assert coordinator.data[MOCK_CHORE_ID] is snapshot
+    assert hass.states.get(entity_id).last_reported == last_reported
+
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    await hass.async_block_till_done()
+    assert coordinator.chore_stamp(MOCK_CHORE_ID) == stamp + 1
+    assert float(hass.states.get(entity_id).state) > 99
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_sensor_min_cleanliness_delta(
+    hass: HomeAssistant, mock_config_entry, freezer
+):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    entity_id = hass.states.async_all("sensor")[0].entity_id
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+
+    # One hour of a 14 day interval is about 0.3%, below the default delta
+    freezer.tick(3600)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert coordinator.data[MOCK_CHORE_ID]["cleanliness"] < float(state.state)
+    assert hass.states.get(entity_id).last_reported == state.last_reported
+
+    freezer.tick(3 * 3600)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert float(hass.states.get(entity_id).state) < float(state.state) - 1
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_sensor_caches_state_per_snapshot(hass: HomeAssistant, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    sensor = HashChoreSensor(coordinator, MOCK_CHORE_ID, mock_config_entry)
+    attributes = sensor.extra_state_attributes
+    assert sensor.extra_state_attributes is attributes
+    assert sensor.icon == ICON_URGENT
+
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    assert sensor.extra_state_attributes is not attributes
+    assert sensor.native_value > 99
+    assert sensor.icon == ICON_GREAT
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_refresh_writes_only_changed_chore_sensors(
+    hass: HomeAssistant, mock_config_entry_two_chores
+):
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][
+        mock_config_entry_two_chores.entry_id
+    ]
+    coordinator.apply_completion(MOCK_CHORE_ID)
+    with patch.object(
+        HashChoreSensor, "_async_write_if_changed", autospec=True
+    ) as write_state:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    assert [call.args[0]._chore_id for call in write_state.call_args_list] == [
+        MOCK_CHORE_ID
+    ]
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_stats_sensors(hass: HomeAssistant, mock_config_entry):
+    hass.states.async_set("person.alice", "home")
+    mock_config_entry.add_to_hass(hass)
+    entity_registry = er.async_get(hass)
+    # Diagnostic sensors are disabled by default; enable two up front
+    for key in ("store_size", "history_events"):
+        entity_registry.async_get_or_create(
+            "sensor",
+            DOMAIN,
+            f"{mock_config_entry.entry_id}_stats_{key}",
+            suggested_object_id=key,
+            config_entry=mock_config_entry,
+        )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    entries = er.async_entries_for_config_entry(
+        entity_registry, mock_config_entry.entry_id
+    )
+    stats_entries = [e for e in entries if "_stats_" in e.unique_id]
+    assert len(stats_entries) == len(STATS_SENSORS)
+    assert sum(e.disabled_by is None for e in stats_entries) == 2
+    assert hass.states.get("sensor.store_size").state == "unknown"
+    assert hass.states.get("sensor.history_events").state == "0"
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    await hass.async_block_till_done()
+    assert int(hass.states.get("sensor.store_size").state) > 0
+    assert hass.states.get("sensor.history_events").state == "1"
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_person_aggregate_uses_friendly_name(
+    hass: HomeAssistant, mock_config_entry_two_chores
+):
+    hass.states.async_set("person.alice", "home", {"friendly_name": "Alice Liddell"})
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.hash_cleaning_hub_alice_liddell_cleanliness")
+    assert state is not None
+    assert state.name == "HASH Cleaning Hub Alice Liddell cleanliness"
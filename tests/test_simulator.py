@@ -0,0 +1,163 @@
+"""Tests for the simulator module."""
+
+from __future__ import annotations
+
+import datetime
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.hash.const import DOMAIN, SERVICE_SIMULATE
+from custom_components.hash.simulator import simulate
+
+from .conftest import MOCK_CHORE_ID, MOCK_CHORE_ID_2, make_chore
+
+START = datetime.datetime(2027, 1, 4, 9, 0, tzinfo=datetime.UTC)
+ALICE = "person.alice"
+BOB = "person.bob"
+
+
+def test_rotation_alternates_persons():
+    result = simulate(
+        [make_chore(interval=7)],
+        [ALICE, BOB],
+        START,
+        days=28,
+        last_cleaned={MOCK_CHORE_ID: START},
+    )
+
+    # Due on days 7, 14 and 21; day 28 is past the end
+    assert result["completions"] == 3
+    assert result["persons"][ALICE]["completions"] == 2
+    assert result["persons"][BOB]["completions"] == 1
+    assert result["overdue_days"] == 0.0
+
+
+def test_cleanliness_distribution():
+    result = simulate(
+        [make_chore(interval=8)],
+        [ALICE],
+        START,
+        days=8,
+        last_cleaned={MOCK_CHORE_ID: START},
+    )
+
+    # One full linear decay cycle averages 50% and spends a quarter of its
+    # time in each status
+    assert result["cleanliness"]["mean"] == 50.0
+    assert set(result["cleanliness"]["status_share"].values()) == {0.25}
+
+
+def test_cleanliness_follows_decay_curve():
+    result = simulate(
+        [{**make_chore(interval=8), "decay": "step"}],
+        [ALICE],
+        START,
+        days=8,
+        last_cleaned={MOCK_CHORE_ID: START},
+    )
+
+    # Four equal steps of 100, 75, 50 and 25%; 75% still counts as Great
+    assert result["cleanliness"]["mean"] == 62.5
+    assert result["cleanliness"]["status_share"] == {
+        "Great": 0.5,
+        "Fine": 0.25,
+        "Dirty": 0.25,
+        "Urgent": 0.0,
+    }
+
+
+def test_vacation_without_cover_makes_chores_wait():
+    result = simulate(
+        [make_chore(interval=7)],
+        [ALICE],
+        START,
+        days=30,
+        last_cleaned={MOCK_CHORE_ID: START},
+        vacations=[
+            (
+                ALICE,
+                START + datetime.timedelta(days=5),
+                START + datetime.timedelta(days=10),
+            )
+        ],
+    )
+
+    # Due on day 7 but done on day 10; then due again on day 17 and 24
+    assert result["completions"] == 3
+    assert result["overdue_days"] == 3.0
+    assert result["lateness_days"]["max"] == 3.0
+
+
+def test_daily_budget_slips_chores():
+    chores = [make_chore(chore_id=f"c{i}", interval=7) for i in range(3)]
+    result = simulate(
+        chores,
+        [ALICE],
+        START,
+        days=10,
+        last_cleaned={f"c{i}": START for i in range(3)},
+        daily_budget=2,
+    )
+
+    assert result["completions"] == 3
+    assert result["overdue_days"] == pytest.approx(1.0, abs=0.1)
+
+
+def test_fair_share_balances_effort():
+    chores = [
+        {**make_chore(chore_id="big", interval=7), "effort": 3},
+        {**make_chore(chore_id="small1", interval=7), "effort": 1},
+        {**make_chore(chore_id="small2", interval=7), "effort": 2},
+    ]
+    result = simulate(
+        chores,
+        [ALICE, BOB],
+        START,
+        days=56,
+        last_cleaned=dict.fromkeys(("big", "small1", "small2"), START),
+        daily_budget=10,
+        assignment_mode="fair_share",
+    )
+
+    assert result["persons"][ALICE]["effort"] == result["persons"][BOB]["effort"]
+
+
+def test_large_household_uses_few_events():
+    chores = [
+        make_chore(chore_id=f"c{i}", interval=(7, 14, 28, 90, 365)[i % 5])
+        for i in range(500)
+    ]
+    result = simulate(chores, [ALICE, BOB, "person.carol"], START, daily_budget=100)
+
+    # Far fewer events than stepping 500 chores through 365 days
+    assert result["completions"] > 500
+    assert result["events"] < 500 * 365 / 10
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_simulate_service(hass: HomeAssistant, mock_config_entry_two_chores):
+    hass.states.async_set(ALICE, "home")
+    mock_config_entry_two_chores.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry_two_chores.entry_id)
+    await hass.async_block_till_done()
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_SIMULATE,
+        {
+            "days": 28,
+            "persons": [ALICE, BOB],
+            "intervals": {MOCK_CHORE_ID_2: 14},
+            "vacations": [
+                {"person_entity_id": BOB, "start": "2027-01-01", "end": "2027-01-14"}
+            ],
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    assert result["days"] == 28
+    assert result["chores"] == 2
+    assert set(result["persons"]) == {ALICE, BOB}
+    assert result["completions"] > 0
@@ -0,0 +1,119 @@
+"""Tests for the stats module and diagnostics."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.components.diagnostics import (
+    get_diagnostics_for_config_entry,
+)
+
+from custom_components.hash.const import DOMAIN
+from custom_components.hash.coordinator import HashCoordinator, HashStore
+from custom_components.hash.stats import SAMPLES, HashStats, Timing
+
+from .conftest import MOCK_CHORE_ID
+
+
+def test_timing_histogram_and_percentiles():
+    timing = Timing()
+    for milliseconds in range(1, 101):
+        timing.add(milliseconds)
+
+    result = timing.as_dict()
+    assert result["count"] == 100
+    assert result["mean"] == 50.5
+    assert result["max"] == 100
+    assert result["p50"] == 51
+    assert result["p99"] == 100
+    assert result["histogram"]["<=1"] == 1
+    assert result["histogram"]["<=100"] == 50
+    assert sum(result["histogram"].values()) == 100
+
+
+def test_samples_are_a_ring_buffer():
+    timing = Timing()
+    for milliseconds in range(SAMPLES * 2):
+        timing.add(milliseconds)
+
+    assert len(timing.samples) == SAMPLES
+    assert timing.samples[0] == SAMPLES
+    assert timing.count == SAMPLES * 2
+
+
+def test_timed_records_on_error():
+    stats = HashStats()
+    with pytest.raises(ValueError), stats.timed("op"):
+        raise ValueError
+    stats.count("things", 3)
+
+    result = stats.as_dict()
+    assert result["timings_ms"]["op"]["count"] == 1
+    assert result["counters"] == {"things": 3}
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_diagnostics(hass: HomeAssistant, hass_client, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+
+    diagnostics = await get_diagnostics_for_config_entry(
+        hass, hass_client, mock_config_entry
+    )
+
+    assert diagnostics["options"]["chores"] == 1
+    assert diagnostics["coordinator"]["chores"] == 1
+    stats = diagnostics["stats"]
+    assert stats["counters"]["completions"] == 1
+    assert stats["counters"]["refreshes"] >= 1
+    assert stats["counters"]["bytes_persisted"] > 0
+    assert {"refresh", "store_load", "store_save"} <= stats["timings_ms"].keys()
+
+
+async def test_store_measures_written_file(hass: HomeAssistant, tmp_path):
+    store = HashStore(hass, 1, "hash_test")
+    path = tmp_path / "hash_test"
+    await hass.async_add_executor_job(
+        store._write_data, str(path), {"version": 1, "data": {"chores": {}}}
+    )
+    assert store.size == path.stat().st_size
+
+
+async def test_history_events_follow_changes(
+    hass: HomeAssistant, mock_config_entry, bypass_store
+):
+    entry = {"person": "person.alice", "timestamp": "2025-01-01T00:00:00+00:00"}
+    bypass_store.async_load.return_value = {
+        "chores": {
+            MOCK_CHORE_ID: {
+                "last_cleaned": "2025-01-01T00:00:00+00:00",
+                "rotation_index": 2,
+                "completed_by_history": [entry, entry],
+            },
+            "orphan-chore": {
+                "last_cleaned": "2025-01-01T00:00:00+00:00",
+                "rotation_index": 1,
+                "completed_by_history": [entry],
+            },
+        }
+    }
+    hass.states.async_set("person.alice", "home")
+    mock_config_entry.add_to_hass(hass)
+    coordinator = HashCoordinator(hass, mock_config_entry)
+    await coordinator.async_load_store()
+    gauges = coordinator.stats.gauges
+    assert gauges["history_events"] == 3
+
+    coordinator.apply_completion(MOCK_CHORE_ID)
+    assert gauges["history_events"] == 4
+
+    await coordinator.async_cleanup_removed_chores()
+    assert gauges["history_events"] == 3
+
+    await coordinator.async_import_runtime(
+        {MOCK_CHORE_ID: {"completed_by_history": [entry]}}, {MOCK_CHORE_ID}
+    )
+    assert gauges["history_events"] == 1
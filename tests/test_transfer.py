@@ -0,0 +1,235 @@
+"""Tests for chore import/export."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+from homeassistant.core import Context, HomeAssistant
+from homeassistant.exceptions import ServiceValidationError, Unauthorized
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from custom_components.hash.const import (
+    CONF_CHORE_ID,
+    CONF_CHORE_NAME,
+    CONF_CHORES,
+    DOMAIN,
+    SERVICE_EXPORT,
+    SERVICE_IMPORT,
+)
+from custom_components.hash.coordinator import HashCoordinator
+from custom_components.hash.transfer import (
+    FORMAT_CSV,
+    FORMAT_NDJSON,
+    ImportBuilder,
+    iter_lines,
+    iter_records,
+)
+
+from .conftest import MOCK_CHORE_ID, make_chore
+
+
+@pytest.fixture
+async def coordinator(
+    hass: HomeAssistant, tmp_path, mock_config_entry
+) -> HashCoordinator:
+    hass.config.config_dir = str(tmp_path)
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    return hass.data[DOMAIN][mock_config_entry.entry_id]
+
+
+def test_csv_round_trip():
+    chores = [make_chore(name='Wipe "the"\nshelves')]
+    runtime = {
+        MOCK_CHORE_ID: {
+            "last_cleaned": "2026-01-01T00:00:00+00:00",
+            "rotation_index": 2,
+            "completed_by_history": [
+                {"person": "person.alice", "timestamp": "2026-01-01T00:00:00+00:00"}
+            ],
+        }
+    }
+    text = "".join(iter_lines(iter_records(chores, runtime, True), FORMAT_CSV))
+
+    builder = ImportBuilder(FORMAT_CSV)
+    for line in text.splitlines(keepends=True):
+        builder.feed_line(line)
+    builder.finish(())
+
+    assert builder.errors == []
+    assert builder.counts == {"chore": 1, "state": 1, "history": 1}
+    assert builder.chores[MOCK_CHORE_ID][CONF_CHORE_NAME] == 'Wipe "the"\nshelves'
+    assert builder.runtime[MOCK_CHORE_ID]["rotation_index"] == 2
+
+
+def test_import_rejects_malformed_records():
+    builder = ImportBuilder(FORMAT_NDJSON)
+    builder.feed_bytes(b'{"type": ["chore"], "chore_id": "a"}\n')
+    builder.feed_bytes(b"\xff\xfe\n")
+
+    assert builder.errors == [
+        "line 1: unknown record type ['chore']",
+        "line 2: invalid UTF-8: invalid start byte",
+    ]
+
+
+async def test_export_import_round_trip(
+    hass: HomeAssistant, tmp_path, bypass_store, coordinator, mock_config_entry
+):
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    coordinator.runtime_data[MOCK_CHORE_ID]["completed_by_history"].append(
+        {"person": "person.alice", "timestamp": "2026-01-01T00:00:00+00:00"}
+    )
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_EXPORT,
+        {"path": "backup.ndjson", "include_history": True},
+        blocking=True,
+        return_response=True,
+    )
+    assert result["records"] == 3
+    lines = (tmp_path / "hash" / "backup.ndjson").read_text().splitlines()
+    assert [json.loads(line)["type"] for line in lines] == [
+        "chore",
+        "state",
+        "history",
+    ]
+
+    hass.config_entries.async_update_entry(
+        mock_config_entry,
+        options={**mock_config_entry.options, CONF_CHORES: [make_chore("other")]},
+    )
+    await hass.async_block_till_done()
+
+    result = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_IMPORT,
+        {"path": "backup.ndjson", "mode": "replace"},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+    assert result["imported"] == {"chore": 1, "state": 1, "history": 1}
+
+    chores = mock_config_entry.options[CONF_CHORES]
+    assert [c[CONF_CHORE_ID] for c in chores] == [MOCK_CHORE_ID]
+    # Runtime state is saved before the options update reloads the entry
+    saved = bypass_store.async_save.call_args_list[-1].args[0]["chores"]
+    assert list(saved) == [MOCK_CHORE_ID]
+    assert saved[MOCK_CHORE_ID]["rotation_index"] == 1
+    assert len(saved[MOCK_CHORE_ID]["completed_by_history"]) == 1
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_import_is_atomic(
+    hass: HomeAssistant, tmp_path, coordinator, mock_config_entry
+):
+    lines = [
+        {"type": "chore", "chore_id": "new", "name": "Dust", "interval": 7},
+        {"type": "state", "chore_id": "new", "last_cleaned": "not a date"},
+    ]
+    (tmp_path / "hash").mkdir()
+    (tmp_path / "hash" / "bad.ndjson").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+    )
+
+    with pytest.raises(ServiceValidationError, match="line 2"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_IMPORT, {"path": "bad.ndjson"}, blocking=True
+        )
+    assert len(mock_config_entry.options[CONF_CHORES]) == 1
+    assert "new" not in coordinator.runtime_data
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_import_rejects_paths_outside_config(hass: HomeAssistant, coordinator):
+    with pytest.raises(ServiceValidationError, match="outside"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_IMPORT, {"path": "../secrets.ndjson"}, blocking=True
+        )
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_import_rejects_other_extensions(hass: HomeAssistant, coordinator):
+    with pytest.raises(ServiceValidationError, match="not an .ndjson or .csv"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_IMPORT, {"path": "secrets.yaml"}, blocking=True
+        )
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_export_refuses_to_overwrite(hass: HomeAssistant, tmp_path, coordinator):
+    (tmp_path / "hash").mkdir()
+    target = tmp_path / "hash" / "hash_export.ndjson"
+    target.write_text("keep")
+
+    with pytest.raises(ServiceValidationError, match="already exists"):
+        await hass.services.async_call(DOMAIN, SERVICE_EXPORT, {}, blocking=True)
+    assert target.read_text() == "keep"
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_EXPORT, {"overwrite": True}, blocking=True
+    )
+    assert json.loads(target.read_text().splitlines()[0])["type"] == "chore"
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_transfer_services_require_admin(
+    hass: HomeAssistant, tmp_path, coordinator, hass_read_only_user
+):
+    context = Context(user_id=hass_read_only_user.id)
+    for service, data in ((SERVICE_EXPORT, {}), (SERVICE_IMPORT, {"path": "a.csv"})):
+        with pytest.raises(Unauthorized):
+            await hass.services.async_call(
+                DOMAIN, service, data, blocking=True, context=context
+            )
+    assert not (tmp_path / "hash").exists()
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_import_view_rejects_invalid_utf8(
+    hass: HomeAssistant, coordinator, hass_client
+):
+    client = await hass_client()
+    resp = await client.post("/api/hash/import", data=b'{"type": "chore"}\n\xff\n')
+    assert resp.status == 400
+    errors = (await resp.json())["errors"]
+    assert errors[1] == "line 2: invalid UTF-8: invalid start byte"
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_import_of_state_only_refreshes(
+    hass: HomeAssistant, tmp_path, coordinator, mock_config_entry
+):
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{mock_config_entry.entry_id}_{MOCK_CHORE_ID}"
+    )
+    assert float(hass.states.get(entity_id).state) == 0
+    now = dt_util.utcnow().isoformat()
+    lines = [
+        {"type": "state", "chore_id": MOCK_CHORE_ID, "last_cleaned": now},
+        {
+            "type": "history",
+            "chore_id": MOCK_CHORE_ID,
+            "person": "person.alice",
+            "timestamp": now,
+        },
+    ]
+    (tmp_path / "hash").mkdir()
+    (tmp_path / "hash" / "state.ndjson").write_text(
+        "".join(json.dumps(line) + "\n" for line in lines)
+    )
+
+    await hass.services.async_call(
+        DOMAIN, SERVICE_IMPORT, {"path": "state.ndjson"}, blocking=True
+    )
+    await hass.async_block_till_done()
+
+    # The chores are unchanged, so the entry was not reloaded
+    assert hass.data[DOMAIN][mock_config_entry.entry_id] is coordinator
+    assert float(hass.states.get(entity_id).state) > 99
+    history = coordinator.runtime_data[MOCK_CHORE_ID]["completed_by_history"]
+    assert history == [{"person": "person.alice", "timestamp": now}]
@@ -0,0 +1,99 @@
+"""Tests for the vacation module."""
+
+from __future__ import annotations
+
+import datetime
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.hash.const import (
+    CONF_CHORE_ID,
+    CONF_CHORES,
+    CONF_GLOBAL_PAUSE,
+    CONF_VACATION_PERSONS,
+    DOMAIN,
+)
+from custom_components.hash.coordinator import HashCoordinator
+from custom_components.hash.vacation import Vacation, away, next_transition
+
+from .conftest import MOCK_CHORE_ID, MOCK_CHORE_ID_2, make_chore
+
+START = datetime.datetime(2027, 7, 14, tzinfo=datetime.UTC)
+DAY = datetime.timedelta(days=1)
+
+
+def test_away_and_next_transition():
+    vacations = [
+        Vacation("person.alice", START, START + 7 * DAY),
+        Vacation("person.bob", START + 3 * DAY, START + 5 * DAY),
+    ]
+
+    assert away(vacations, START - DAY) == frozenset()
+    assert away(vacations, START + 4 * DAY) == {"person.alice", "person.bob"}
+    # The end is exclusive
+    assert away(vacations, START + 5 * DAY) == {"person.alice"}
+    assert next_transition(vacations, START - DAY) == START
+    assert next_transition(vacations, START) == START + 3 * DAY
+    assert next_transition(vacations, START + 7 * DAY) is None
+
+
+def test_round_trip():
+    vacation = Vacation("person.alice", START, START + DAY)
+    assert Vacation.from_dict(vacation.as_dict()) == vacation
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_scheduled_vacation_reassigns_on_time(hass: HomeAssistant, freezer):
+    hass.states.async_set("person.alice", "home")
+    hass.states.async_set("person.bob", "home")
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        options={
+            CONF_CHORES: [
+                make_chore(assigned_person="person.bob"),
+                make_chore(
+                    chore_id=MOCK_CHORE_ID_2,
+                    name="Mop Kitchen",
+                    assigned_person="person.alice",
+                ),
+            ],
+            CONF_VACATION_PERSONS: [],
+            CONF_GLOBAL_PAUSE: False,
+        },
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator: HashCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    start = dt_util.start_of_local_day() + DAY
+    await coordinator.async_add_vacation("person.alice", start, start + 2 * DAY)
+    assert coordinator.data[MOCK_CHORE_ID_2]["assigned_to"] == "person.alice"
+
+    freezer.move_to(start + datetime.timedelta(seconds=1))
+    with patch.object(
+        coordinator, "_async_update_chores", wraps=coordinator._async_update_chores
+    ) as update_chores:
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+    assert coordinator.vacation_list() == ["person.alice"]
+    assert coordinator.data[MOCK_CHORE_ID_2]["assigned_to"] == "person.bob"
+    assert coordinator.data[MOCK_CHORE_ID]["assigned_to"] == "person.bob"
+    # Chores keeping their assignee are not recomputed
+    update_chores.assert_called_once()
+    chores = update_chores.call_args.args[0]
+    assert [chore[CONF_CHORE_ID] for chore in chores] == [MOCK_CHORE_ID_2]
+
+    freezer.move_to(start + 2 * DAY + datetime.timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert coordinator.vacation_list() == []
+    assert coordinator.vacations == []
+    assert coordinator.data[MOCK_CHORE_ID_2]["assigned_to"] == "person.alice"
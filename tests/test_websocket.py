@@ -0,0 +1,150 @@
+"""Tests for the websocket API."""
+
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.hash.const import CONF_CHORE_ID, CONF_CHORES, DOMAIN
+from custom_components.hash.coordinator import HashCoordinator
+from custom_components.hash.stats import async_get_stats
+from custom_components.hash.websocket import register_websocket_commands
+
+from .conftest import MOCK_CHORE_ID
+
+
+@pytest.fixture
+async def ws_client(hass: HomeAssistant, hass_ws_client, mock_config_entry):
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+    register_websocket_commands(hass)
+    return await hass_ws_client(hass)
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_complete_chore_returns_snapshot(hass: HomeAssistant, ws_client):
+    await ws_client.send_json_auto_id(
+        {"type": "hash/complete_chore", "chore_id": MOCK_CHORE_ID}
+    )
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["chore"]["chore_id"] == MOCK_CHORE_ID
+    assert msg["result"]["chore"]["cleanliness"] > 99
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_subscribe_receives_completed_chore(
+    hass: HomeAssistant, ws_client, mock_config_entry
+):
+    await ws_client.send_json_auto_id({"type": "hash/subscribe"})
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert async_get_stats(hass).gauges["subscribers"] == 1
+
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    await coordinator.async_complete_chore(MOCK_CHORE_ID)
+    msg = await ws_client.receive_json()
+    assert msg["type"] == "event"
+    assert list(msg["event"]["chores"]) == [MOCK_CHORE_ID]
+    assert msg["event"]["chores"][MOCK_CHORE_ID]["cleanliness"] > 99
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_batch(hass: HomeAssistant, ws_client, mock_config_entry):
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    runtime = coordinator._ensure_runtime(MOCK_CHORE_ID)
+
+    await ws_client.send_json_auto_id(
+        {
+            "type": "hash/batch",
+            "operations": [
+                {"op": "add", "chore_id": "new-1", "name": "Dust", "interval": 7},
+                {"op": "edit", "chore_id": "new-1", "name": "Dust shelves"},
+                {"op": "add", "name": "Windows", "interval": 90},
+                {"op": "complete", "chore_id": MOCK_CHORE_ID},
+            ],
+        }
+    )
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    results = msg["result"]["results"]
+    assert [r["op"] for r in results] == ["add", "edit", "add", "complete"]
+    assert results[0]["chore_id"] == "new-1"
+    assert runtime["rotation_index"] == 1
+
+    chores = mock_config_entry.options[CONF_CHORES]
+    assert [c[CONF_CHORE_ID] for c in chores][:2] == [MOCK_CHORE_ID, "new-1"]
+    assert chores[1]["name"] == "Dust shelves"
+    assert len(chores) == 3
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_batch_is_atomic(hass: HomeAssistant, ws_client, mock_config_entry):
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    runtime = coordinator._ensure_runtime(MOCK_CHORE_ID)
+
+    await ws_client.send_json_auto_id(
+        {
+            "type": "hash/batch",
+            "operations": [
+                {"op": "complete", "chore_id": MOCK_CHORE_ID},
+                {"op": "delete", "chore_id": "missing"},
+            ],
+        }
+    )
+    msg = await ws_client.receive_json()
+    assert not msg["success"]
+    assert "Operation 1" in msg["error"]["message"]
+    assert runtime["rotation_index"] == 0
+    assert len(mock_config_entry.options[CONF_CHORES]) == 1
+
+
+@pytest.mark.usefixtures("bypass_store")
+@pytest.mark.parametrize("op", [["complete"], {"name": "complete"}, None])
+async def test_batch_rejects_non_string_op(hass: HomeAssistant, ws_client, op):
+    await ws_client.send_json_auto_id(
+        {"type": "hash/batch", "operations": [{"op": op, "chore_id": MOCK_CHORE_ID}]}
+    )
+    msg = await ws_client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "invalid_format"
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_debug_stats(hass: HomeAssistant, ws_client):
+    await ws_client.send_json_auto_id({"type": "hash/dashboard"})
+    assert (await ws_client.receive_json())["success"]
+
+    await ws_client.send_json_auto_id({"type": "hash/debug/stats"})
+    msg = await ws_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["timings_ms"]["hash/dashboard"]["count"] == 1
+    bytes_sent = msg["result"]["counters"]["bytes_sent"]
+    assert bytes_sent > 0
+
+    # The stats command is timed and counted like the others
+    await ws_client.send_json_auto_id({"type": "hash/debug/stats"})
+    msg = await ws_client.receive_json()
+    assert msg["result"]["timings_ms"]["hash/debug/stats"]["count"] == 1
+    assert msg["result"]["counters"]["bytes_sent"] > bytes_sent
+
+
+@pytest.mark.usefixtures("bypass_store")
+async def test_dashboard_chore_unchanged_after_planning(
+    hass: HomeAssistant, ws_client, mock_config_entry, freezer
+):
+    freezer.move_to("2026-03-02 12:00:00")
+    coordinator: HashCoordinator = hass.data[DOMAIN][mock_config_entry.entry_id]
+    await coordinator.async_refresh()
+    await ws_client.send_json_auto_id({"type": "hash/dashboard"})
+    before = (await ws_client.receive_json())["result"]["chores"][MOCK_CHORE_ID]
+
+    await coordinator.async_refresh()
+    assert coordinator.planner.dates(MOCK_CHORE_ID)
+    await ws_client.send_json_auto_id({"type": "hash/dashboard"})
+    after = (await ws_client.receive_json())["result"]["chores"][MOCK_CHORE_ID]
+
+    # The panel keeps its object for a chore whose fields all compare with ===
+    assert after == before
+    assert not any(isinstance(value, list | dict) for value in after.values())